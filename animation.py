@@ -0,0 +1,130 @@
+import gzip
+import hashlib
+import os
+
+# -----------------------------------------------------------------------------
+# ANIMAÇÃO INTERATIVA (PÁGINA 8): CASCA HTML + BUNDLE PRÉ-COMPILADO
+# -----------------------------------------------------------------------------
+# O componente é um bundle JavaScript puro e minificado em static/ (gerado por
+# animation_src/build.py), sem React, Babel nem fontes vindas da internet:
+# funciona em sala de aula sem acesso externo. A página 8 aponta um iframe
+# para o payload em cache (abaixo); sem rota para servi-lo, o bundle vai
+# embutido na casca HTML.
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STATIC_URL = 'app/static/'
+BUNDLE_JS = 'jornada.min.js'
+BUNDLE_CSS = 'jornada.min.css'
+
+_SHELL = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+{css}
+</head>
+<body>
+<div id="root"></div>
+{js}
+</body>
+</html>
+"""
+
+
+def read_bundle(name):
+    with open(os.path.join(STATIC_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def standalone_html():
+    # Arquivo único para download/uso offline, com CSS e JS embutidos
+    return _SHELL.format(css=f'<style>{read_bundle(BUNDLE_CSS)}</style>',
+                         js=f'<script>{read_bundle(BUNDLE_JS)}</script>')
+
+
+# -----------------------------------------------------------------------------
+# PAYLOAD EM CACHE, ENDEREÇADO PELO HASH DO CONTEÚDO
+# -----------------------------------------------------------------------------
+# O HTML standalone é montado e comprimido uma única vez por processo, na
+# importação. O hash do conteúdo vira o nome do recurso e o ETag: a página 8
+# só envia pelo websocket a URL do iframe, e o navegador revalida (304) ou
+# usa a cópia em cache. Rota própria (app.py, via st.App) responde com gzip,
+# ETag e Cache-Control imutável; sem ela, o arquivo é publicado em
+# static/cache/ e servido pela rota estática do Streamlit (que já manda ETag).
+
+ROUTE_PATH = 'animacao'
+CACHE_DIR = os.path.join(STATIC_DIR, 'cache')
+DOWNLOAD_NAME = 'jornada_tokenizacao.html'
+
+_route_mounted = False
+
+
+def build_payload():
+    html = standalone_html().encode('utf-8')
+    etag = hashlib.sha256(html).hexdigest()[:16]
+    return {
+        'etag': etag,
+        'name': f'jornada.{etag}.html',
+        'html': html,
+        'gzip': gzip.compress(html, compresslevel=9),
+    }
+
+
+PAYLOAD = build_payload()
+
+
+def publish_static(payload=PAYLOAD):
+    # Arquivos com o hash no nome nunca mudam: só grava se ainda não existir
+    path = os.path.join(CACHE_DIR, payload['name'])
+    if not os.path.exists(path):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload['html'])
+        os.replace(tmp_path, path)
+    return f'{STATIC_URL}cache/{payload["name"]}'
+
+
+def animation_url(static_serving):
+    # URL relativa do payload, ou None se não há rota para servi-lo
+    if _route_mounted:
+        return f'{ROUTE_PATH}/{PAYLOAD["name"]}'
+    if static_serving:
+        return publish_static()
+    return None
+
+
+def _etag_matches(header, etag):
+    tags = [tag.strip().removeprefix('W/').strip('"') for tag in header.split(',')]
+    return '*' in tags or etag in tags
+
+
+async def animation_endpoint(request):
+    from starlette.responses import Response
+
+    if request.path_params['name'] != PAYLOAD['name']:
+        return Response(status_code=404)
+    etag = PAYLOAD['etag']
+    headers = {
+        'ETag': f'"{etag}"',
+        'Cache-Control': 'public, max-age=31536000, immutable',
+        'Vary': 'Accept-Encoding',
+    }
+    if _etag_matches(request.headers.get('if-none-match', ''), etag):
+        return Response(status_code=304, headers=headers)
+    if 'download' in request.query_params:
+        headers['Content-Disposition'] = f'attachment; filename="{DOWNLOAD_NAME}"'
+    body = PAYLOAD['html']
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        body = PAYLOAD['gzip']
+        headers['Content-Encoding'] = 'gzip'
+    return Response(body, media_type='text/html; charset=utf-8', headers=headers)
+
+
+def animation_routes():
+    # Rotas para st.App (ver app.py); marca que a URL própria está disponível
+    global _route_mounted
+    from starlette.routing import Route
+
+    _route_mounted = True
+    return [Route(f'/{ROUTE_PATH}/{{name}}', animation_endpoint)]
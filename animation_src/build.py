@@ -0,0 +1,42 @@
+import os
+import re
+
+# -----------------------------------------------------------------------------
+# BUILD DO BUNDLE DA ANIMAÇÃO (PÁGINA 8)
+# -----------------------------------------------------------------------------
+# Gera static/jornada.min.js e static/jornada.min.css a partir das fontes em
+# animation_src/. A minificação é conservadora: remove comentários de linha
+# inteira, indentação e linhas vazias, mas mantém as quebras de linha (a
+# inserção automática de ponto e vírgula do JavaScript continua valendo).
+# Uso: python animation_src/build.py
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(os.path.dirname(SOURCE_DIR), 'static')
+
+
+def minify_js(source):
+    lines = (line.strip() for line in source.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//')) + '\n'
+
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    return re.sub(r'\s*([{};:,])\s*', r'\1', source).strip() + '\n'
+
+
+def build():
+    outputs = {}
+    for name, minify in (('jornada.js', minify_js), ('jornada.css', minify_css)):
+        with open(os.path.join(SOURCE_DIR, name), encoding='utf-8') as f:
+            minified = minify(f.read())
+        target = os.path.join(STATIC_DIR, name.replace('.', '.min.'))
+        with open(target, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(minified)
+        outputs[target] = len(minified.encode('utf-8'))
+    return outputs
+
+
+if __name__ == "__main__":
+    for path, size in build().items():
+        print(f"{os.path.relpath(path)}: {size:,} bytes")
@@ -0,0 +1,12 @@
+import streamlit as st
+
+from animation import animation_routes
+
+# -----------------------------------------------------------------------------
+# PONTO DE ENTRADA ASGI (ROTAS EXTRAS + APP STREAMLIT)
+# -----------------------------------------------------------------------------
+# `streamlit run app.py` sobe o mesmo app de tokens.py com a rota em cache da
+# animação da página 8 (gzip + ETag + 304). `streamlit run tokens.py` continua
+# funcionando, com a animação servida pela rota estática do Streamlit.
+
+app = st.App("tokens.py", routes=animation_routes())
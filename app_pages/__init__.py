@@ -0,0 +1,46 @@
+import importlib
+import time
+
+# -----------------------------------------------------------------------------
+# REGISTRO DE PÁGINAS (CARREGAMENTO SOB DEMANDA)
+# -----------------------------------------------------------------------------
+# Cada página do menu vive no seu próprio módulo, importado só na primeira
+# visita. Assim o arranque do app não paga pandas/plotly/simulações de páginas
+# que o aluno ainda não abriu, e cada rerun executa apenas a página atual.
+# (A pasta não se chama pages/ porque o Streamlit trataria cada arquivo como
+# uma página independente na barra lateral.)
+
+PAGES = {
+    "Início: Jornada": "home",
+    "1 - Fundamentos": "fundamentals",
+    "2 - Mecânica da Tokenização": "mechanics",
+    "3 - Sandbox Blockchain (DLT)": "sandbox",
+    "4 - Ciclo de Vida do Ativo": "asset_lifecycle",
+    "5 - Matriz de Riscos": "risk_matrix",
+    "6 - Casos Reais": "case_studies",
+    "7 - Smart Contracts": "smart_contracts",
+    "8 - Animação interativa": "journey_animation",
+    "9 - Quiz Final": "quiz",
+}
+
+# Tempo de import de cada página na primeira visita (compartilhado pelo processo)
+load_times = {}
+
+
+def load_page(label):
+    name = f"{__name__}.{PAGES[label]}"
+    if name not in load_times:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        load_times[name] = time.perf_counter() - start
+        return module
+    return importlib.import_module(name)
+
+
+def load_time(label):
+    # Segundos gastos no import da página (None se ainda não foi visitada)
+    return load_times.get(f"{__name__}.{PAGES[label]}")
+
+
+def render_page(label):
+    load_page(label).render()
@@ -0,0 +1,98 @@
+import plotly.io as pio
+import streamlit as st
+
+from app_pages.common import seed_control
+from figures import FIGURE_CACHE_BYTES, figure_cache
+from lifecycle import (bond_figures, bond_portfolio, bond_single, monte_carlo_figures, portfolio_figures,
+                       rental_figures, rental_monte_carlo, rental_single_path, simulation_cache)
+
+# -----------------------------------------------------------------------------
+# PÁGINA 4: CICLO DE VIDA
+# -----------------------------------------------------------------------------
+
+
+def render():
+    st.title("4 - Simulador de Ciclo de Vida")
+    st.markdown("Acompanhe a evolução de um ativo tokenizado ao longo do tempo.")
+
+    asset_type = st.selectbox("Escolha o cenário:", ["Imóvel (Aluguel)", "Título de Dívida Corporativa (Debênture)"])
+    years = st.slider("Período de Simulação (Anos)", 1, 10, 5)
+
+    # Setup da simulação: resultados vêm do cache (lifecycle.py) e figuras do cache de figuras (figures.py)
+    seed = seed_control()
+    
+    if asset_type == "Imóvel (Aluguel)":
+        rental = rental_single_path(years, seed)
+        
+        st.subheader("Fluxo de Caixa (Smart Contract Payout)")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.plotly_chart(pio.from_json(rental_figures(rental)['lifecycle']), use_container_width=True)
+        with col2:
+            st.metric("Total Pago em Dividendos", f"R$ {rental['total_dividends']:.2f}")
+            st.metric("Variação de Capital", f"R$ {rental['capital_gain']:.2f}")
+            st.metric("ROI Total do Investidor", f"{rental['roi']:.1f}%")
+            
+            st.markdown("""
+            **Evento Smart Contract:**
+            Todo dia 05, o contrato inteligente verifica o pagamento do inquilino e distribui automaticamente para as carteiras dos detentores do token.
+            """)
+
+        st.markdown("---")
+        st.subheader("🎲 Monte Carlo: Milhares de Cenários")
+        n_paths = st.select_slider("Número de caminhos simulados", options=[1000, 5000, 10000, 20000, 50000], value=10000)
+        mc = rental_monte_carlo(years, n_paths, seed)
+        mc_figures = monte_carlo_figures(mc)
+
+        st.plotly_chart(pio.from_json(mc_figures['fan']), use_container_width=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(pio.from_json(mc_figures['roi']), use_container_width=True)
+        with col2:
+            st.plotly_chart(pio.from_json(mc_figures['dividends']), use_container_width=True)
+
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("ROI Mediano", f"{mc['roi_p50']:.1f}%")
+        c2.metric("ROI P5 (cenário ruim)", f"{mc['roi_p5']:.1f}%")
+        c3.metric("ROI P95 (cenário bom)", f"{mc['roi_p95']:.1f}%")
+        c4.metric("Prob. de ROI Negativo", f"{mc['prob_loss']:.1%}")
+        st.caption(f"{n_paths:,} caminhos × {years * 12} meses simulados em {mc['elapsed'] * 1000:.0f} ms.")
+
+    elif asset_type == "Título de Dívida Corporativa (Debênture)":
+        default_prob = st.slider("Probabilidade de Calote (Default)", 0.0, 0.2, 0.02)
+        bond = bond_single(years, default_prob, seed)
+        status = bond['status']
+            
+        st.subheader(f"Status do Título: {status}")
+        st.plotly_chart(pio.from_json(bond_figures(bond)['cash_flows']), use_container_width=True)
+        
+        if status == "Default (Calote)":
+            st.error("⚠️ Ocorreu um evento de Default! O Smart Contract interrompeu pagamentos e iniciou execução de garantias.")
+
+        st.markdown("---")
+        st.subheader("🎲 Carteira Simulada: Distribuição de Perdas")
+        n_bonds = st.select_slider("Número de títulos simulados", options=[1000, 10000, 100000, 1000000], value=1000000)
+        portfolio = bond_portfolio(years, default_prob, n_bonds, seed)
+        bond_stats = portfolio['stats']
+        bond_portfolio_figures = portfolio_figures(portfolio)
+
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Taxa de Default", f"{bond_stats['default_rate']:.2%}")
+        c2.metric("Perda Esperada", f"R$ {bond_stats['expected_loss']:,.2f}")
+        c3.metric("Perda / Fluxo Prometido", f"{bond_stats['loss_rate']:.2%}")
+        c4.metric("Fluxo Médio Recebido", f"R$ {bond_stats['expected_cash']:,.2f}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(pio.from_json(bond_portfolio_figures['survival']), use_container_width=True)
+        with col2:
+            st.plotly_chart(pio.from_json(bond_portfolio_figures['outcomes']), use_container_width=True)
+        st.caption(f"{n_bonds:,} títulos × {years} anos simulados em {portfolio['elapsed'] * 1000:.0f} ms.")
+
+    cache_stats = simulation_cache.stats()
+    st.caption(f"⚡ Cache de simulações: {cache_stats['hits']} acertos, {cache_stats['misses']} falhas "
+               f"({cache_stats['hit_rate']:.0%} de acerto, {cache_stats['entries']} resultados guardados).")
+    figure_stats = figure_cache.stats()
+    st.caption(f"📊 Cache de figuras (todas as sessões): {figure_stats['hits']} acertos, {figure_stats['misses']} falhas "
+               f"({figure_stats['hit_rate']:.0%} de acerto, {figure_stats['entries']} figuras, "
+               f"{figure_stats['bytes'] / 2**20:.1f} de {FIGURE_CACHE_BYTES / 2**20:.0f} MB).")
@@ -0,0 +1,49 @@
+import streamlit as st
+
+# -----------------------------------------------------------------------------
+# PÁGINA 6: CASOS REAIS
+# -----------------------------------------------------------------------------
+
+
+def render():
+    st.title("6 - Estudos de Caso")
+    st.markdown("Exemplos do Brasil e do Mundo.")
+    
+    case_tab1, case_tab2, case_tab3 = st.tabs(["🇧🇷 FIDC Tokenizado", "🇺🇸 Títulos do Tesouro (BUIDL)", "🌍 Créditos de Carbono"])
+    
+    with case_tab1:
+        st.header("FIDC e Recebíveis no Brasil")
+        st.markdown("""
+        **O Cenário:** O Brasil é pioneiro na tokenização de recebíveis (FIDC). 
+        
+        * **Como funciona:** Uma empresa (ex: varejista) tem notas fiscais a receber em 90 dias.
+        * **Tokenização:** Essas notas são empacotadas, validadas e transformadas em tokens.
+        * **Investidor:** Compra o token com desconto (ex: paga 95 para receber 100).
+        * **Regulação:** CVM Resolução 175 e Sandbox Regulatório.
+        
+        **Vantagem:** Redução de intermediários bancários e custo de captação menor para a empresa.
+        """)
+        st.info("Empresas envolvidas no ecossistema: Liqi, Vórtx, MB.")
+        
+    with case_tab2:
+        st.header("BlackRock BUIDL & Franklin Templeton")
+        st.markdown("""
+        **O Cenário:** Grandes gestoras trazendo Títulos do Tesouro Americano (Treasuries) para a blockchain.
+        
+        * **Produto:** Fundo de liquidez tokenizado.
+        * **Mecânica:** Cada token vale $1. O rendimento é pago diariamente via *rebasing* (aumenta a quantidade de tokens na carteira) ou dividendo mensal.
+        * **Blockchain:** Ethereum (ERC-20).
+        * **Sucesso:** O fundo BUIDL da BlackRock atingiu >$500 milhões em ativos em tempo recorde.
+        """)
+        st.metric("TVL (Total Value Locked) estimado no Setor RWA", "$ 12 Bilhões+")
+        
+    with case_tab3:
+        st.header("Toucan Protocol & Klima DAO")
+        st.markdown("""
+        **O Cenário:** Tokenização de créditos de carbono 'zumbis' (antigos).
+        
+        * **O Problema:** Créditos antigos de baixa qualidade foram tokenizados e vendidos como offsets "premium".
+        * **A Lição:** A Blockchain garante que o token é único, mas não garante a **qualidade do ativo subjacente**.
+        * **Consequência:** A certificadora Verra suspendeu a tokenização direta para criar regras mais rígidas.
+        """)
+        st.warning("Lição aprendida: 'Garbage In, Garbage Out'. A tecnologia não conserta um ativo ruim.")
@@ -0,0 +1,120 @@
+import os
+import re
+import uuid
+
+import streamlit as st
+
+from session_resources import SessionResourceManager
+
+# -----------------------------------------------------------------------------
+# ESTADO DA SESSÃO E CONTROLES COMPARTILHADOS ENTRE PÁGINAS
+# -----------------------------------------------------------------------------
+# Só o que toda página precisa fica aqui. Os módulos pesados (cadeia,
+# mineração, simulações) são importados dentro das funções, na primeira vez
+# em que uma página usa a cadeia ou uma semente.
+
+# Pasta das cadeias salvas em disco (formato mapeado em memória)
+CHAIN_DIR = os.environ.get("TOKENS_CHAIN_DIR",
+                           os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "saved_chains"))
+
+# Código do espaço de trabalho (pasta própria de cadeias salvas), guardado na URL
+WORKSPACE_PATTERN = re.compile(r'[0-9a-f]{16}')
+
+# Memória de cada sessão: objetos derivados podem ser descartados a qualquer
+# momento; resultados de simulação só quando a sessão fica ociosa
+session_manager = SessionResourceManager(
+    os.path.join(CHAIN_DIR, "sessions"),
+    derived_keys=('chain_table', 'chain_validator', 'last_mining_job'),
+    idle_keys=('ledger_runs', 'quiz_result', 'quiz_sim_store'),
+)
+
+
+def init_session_state():
+    session_manager.begin_run()
+    if 'hash_rates' not in st.session_state:
+        st.session_state.hash_rates = {}
+    if 'mining_job' not in st.session_state:
+        st.session_state.mining_job = None
+    if 'ledger_runs' not in st.session_state:
+        st.session_state.ledger_runs = {}
+    # Semente das simulações desta sessão (fluxos independentes via SeedSequence)
+    if 'sim_seed' not in st.session_state:
+        st.session_state.sim_seed = 42
+    notice = st.session_state.pop('session_notice', None)
+    if notice:
+        st.toast(notice, icon="💾")
+
+
+def end_run():
+    session_manager.end_run()
+
+
+def ensure_chain():
+    # A cadeia da sessão só é criada quando o Sandbox é visitado
+    if 'blockchain' not in st.session_state:
+        from blockchain import create_genesis_block
+        from chain_store import ChainStore
+
+        st.session_state.blockchain = ChainStore([create_genesis_block()])
+    return st.session_state.blockchain
+
+
+def chain_workspace():
+    # Cada aluno salva e lista só a própria pasta. O código vai para a URL
+    # (?ws=...): recarregar a página ou guardar o link mantém o acesso.
+    workspace = st.query_params.get('ws')
+    if workspace is None or not WORKSPACE_PATTERN.fullmatch(workspace):
+        workspace = uuid.uuid4().hex[:16]
+        st.query_params['ws'] = workspace
+    return os.path.join(CHAIN_DIR, 'workspaces', workspace)
+
+
+def _set_seed():
+    st.session_state.sim_seed = int(st.session_state.seed_input)
+
+
+def _new_seed():
+    from simulations import fresh_seed
+
+    st.session_state.sim_seed = fresh_seed()
+
+
+def seed_control():
+    # Mesma semente = mesmos resultados; cada sessão tem a sua
+    st.session_state.seed_input = st.session_state.sim_seed
+    c1, c2 = st.columns([3, 1])
+    c1.number_input("Semente aleatória (reprodutibilidade)", min_value=0, max_value=2**32 - 1, step=1,
+                    key='seed_input', on_change=_set_seed)
+    c2.button("🎲 Nova Semente", on_click=_new_seed)
+    return st.session_state.sim_seed
+
+
+def collect_mining_job():
+    # Anexa o bloco do job em segundo plano à cadeia quando ele termina,
+    # em qualquer página que o aluno esteja visitando
+    if st.session_state.mining_job is None:
+        return None
+    from mining_jobs import get_job, pop_job
+
+    job = get_job(st.session_state.mining_job)
+    if job is None:
+        st.session_state.mining_job = None
+        return None
+    if not job.done:
+        return job
+    pop_job(job.job_id)
+    st.session_state.mining_job = None
+    if job.status == "done" and job.block.previous_hash == st.session_state.blockchain[-1].hash:
+        st.session_state.blockchain.append(job.block)
+        st.session_state.hash_rates[job.mode] = job.progress()["hash_rate"]
+    st.session_state.last_mining_job = job.progress()
+    return None
+
+
+def session_footprint():
+    # Mede a sessão atual (aplicando os tetos) e mostra os totais do servidor
+    record = session_manager.track()
+    totals = session_manager.totals()
+    mine = f" · esta sessão: {record['bytes'] / 2**20:.1f} MB" if record else ""
+    st.sidebar.caption(f"🧠 {totals['active']} sessões ativas · {totals['bytes'] / 2**20:.1f} MB em memória "
+                       f"· {totals['disk_bytes'] / 2**20:.1f} MB em disco{mine}")
@@ -0,0 +1,57 @@
+import streamlit as st
+
+from diagrams import TOKENIZATION_FLOW, static_diagram
+
+# -----------------------------------------------------------------------------
+# PÁGINA 1: FUNDAMENTOS
+# -----------------------------------------------------------------------------
+
+
+def render():
+    st.title("1 - Fundamentos da Tokenização")
+    st.markdown("Entenda os conceitos básicos antes de mergulhar na tecnologia.")
+    
+    tab1, tab2, tab3 = st.tabs(["🃏 Conceitos Chave", "🔄 O Fluxo", "🏷️ Classificação"])
+    
+    with tab1:
+        st.subheader("Cartões de Conceito")
+        col1, col2 = st.columns(2)
+        with col1:
+            with st.expander("O que é um Token?", expanded=True):
+                st.write("Um token é a **representação digital** de um ativo ou utilidade em uma blockchain. Não é o arquivo PDF do contrato, mas o registro programável de propriedade.")
+            with st.expander("Fungível vs. Não Fungível (NFT)"):
+                st.write("**Fungível:** Dinheiro, ações (uma nota de R$10 vale o mesmo que outra).")
+                st.write("**Não Fungível:** Obras de arte, Imóveis (cada unidade é única e insubstituível).")
+        with col2:
+            with st.expander("Ledger vs. Blockchain"):
+                st.write("**Ledger:** Livro razão (registro contábil).")
+                st.write("**Blockchain:** Um tipo de DLT (Distributed Ledger Technology) onde os registros são agrupados em blocos encadeados criptograficamente.")
+            with st.expander("Custódia (On-chain vs. Off-chain)"):
+                st.write("O grande desafio. Se tokenizo um prédio (Off-chain), quem garante que o dono do token é dono do prédio? É necessário um **Custodiante Jurídico** e oráculos.")
+
+    with tab2:
+        st.subheader("Fluxo de Tokenização")
+        st.markdown("Como um ativo sai do mundo real e vai para a Blockchain.")
+        
+        static_diagram(TOKENIZATION_FLOW)
+
+    with tab3:
+        st.subheader("Explorador de Classificação de Tokens")
+        ativo = st.selectbox("Escolha um ativo para analisar:", 
+                             ["Títulos Públicos", "Cotas de FIDC", "Imóvel Real", "Obra de Arte", "Crédito de Carbono"])
+        
+        info = {
+            "Títulos Públicos": {"Tipo": "Security Token (RWA)", "Regulação": "Alta (Tesouro/CVM)", "Fracionalização": "Alta", "Padrão": "ERC-20 / DREX"},
+            "Cotas de FIDC": {"Tipo": "Security Token", "Regulação": "CVM 175", "Fracionalização": "Média", "Padrão": "ERC-20 com Whitelist"},
+            "Imóvel Real": {"Tipo": "Security/Utility Híbrido", "Regulação": "Cartório + CVM", "Fracionalização": "Baixa (SPV necessário)", "Padrão": "ERC-1400 (Security)"},
+            "Obra de Arte": {"Tipo": "NFT (Non-Fungible)", "Regulação": "Baixa/Média", "Fracionalização": "Possível (Sharding)", "Padrão": "ERC-721"},
+            "Crédito de Carbono": {"Tipo": "Utility/Commodity", "Regulação": "Emergente", "Fracionalização": "Alta (Toneladas)", "Padrão": "Token Climático"}
+        }
+        
+        data = info[ativo]
+        c1, c2 = st.columns(2)
+        c1.metric("Tipo de Token", data["Tipo"])
+        c2.metric("Regulação", data["Regulação"])
+        c3, c4 = st.columns(2)
+        c3.metric("Fracionalização", data["Fracionalização"])
+        c4.metric("Padrão Técnico", data["Padrão"])
@@ -0,0 +1,43 @@
+import streamlit as st
+
+from diagrams import JOURNEY_MAP, static_diagram
+
+# -----------------------------------------------------------------------------
+# PÁGINA: INÍCIO
+# -----------------------------------------------------------------------------
+
+
+def render():
+    st.markdown(
+    """
+    <div style='text-align: center;'>
+        <h1>Bem-vindo à Revolução dos Ativos Digitais</h1>
+        <h2><b>A Jornada da Tokenização: Transformando um ativo real em um ativo digital</b></h2>
+        <h4>Uma experiência interativa para entender o futuro da infraestrutura financeira</h4>
+    </div>
+    """,
+    unsafe_allow_html=True
+    )
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.image("https://img.icons8.com/fluency/240/blockchain-technology.png", width=200)
+        st.caption("Tokenização, DLT e Smart Contracts")
+        
+    with col2:
+        st.markdown("""
+        Este aplicativo foi desenhado para estudantes de MBA e Finanças visualizarem conceitos complexos como:
+        
+        * **Desmaterialização:** Como ativos físicos viram código.
+        * **Fracionalização:** Como dividir um prédio em mil pedaços negociáveis.
+        * **Imutabilidade:** Como funciona a confiança matemática da Blockchain.
+        """)
+
+    st.markdown("---")
+    st.subheader("🗺️ Seu Mapa de Aprendizado")
+    
+    # Visual Journey Map using Graphviz (SVG pré-renderizado, ver diagrams.py)
+    static_diagram(JOURNEY_MAP)
+    
+    st.info("👈 Selecione o **Módulo 1** na barra lateral para começar.")
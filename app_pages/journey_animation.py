@@ -0,0 +1,37 @@
+import streamlit as st
+
+from animation import DOWNLOAD_NAME, PAYLOAD, animation_url
+
+# -----------------------------------------------------------------------------
+# PÁGINA 8: ANIMAÇÃO INTERATIVA
+# -----------------------------------------------------------------------------
+
+
+def render():
+    st.title("🚀 Jornada da Tokenização")
+    st.markdown("""
+    **Navegue pelas 8 etapas** que transformam um ativo do mundo real em um token digital na blockchain.
+    Use a timeline, os botões de navegação ou o modo automático para explorar cada fase.
+    """)
+    
+    # O payload é montado uma vez por processo e servido por URL com o hash do
+    # conteúdo: a cada rerun só a URL do iframe passa pelo websocket.
+    # st.iframe só trata como URL o caminho iniciado por '/', então a URL
+    # relativa ganha a raiz do servidor (server.baseUrlPath)
+    animation_src = animation_url(st.get_option("server.enableStaticServing"))
+    if animation_src:
+        base_path = st.get_option("server.baseUrlPath").strip('/')
+        animation_src = '/' + (f'{base_path}/' if base_path else '') + animation_src
+        st.iframe(animation_src, height=1200)
+        st.markdown(f'<a href="{animation_src}?download=1" download="{DOWNLOAD_NAME}" target="_blank">'
+                    f'📥 Baixar animação (HTML standalone)</a>', unsafe_allow_html=True)
+    else:
+        # Sem rota para servir arquivos: o bundle vai embutido na casca HTML
+        st.iframe(PAYLOAD['html'].decode('utf-8'), height=1200)
+        st.download_button(
+            label="📥 Baixar animação (HTML standalone)",
+            data=PAYLOAD['html'],
+            file_name=DOWNLOAD_NAME,
+            mime="text/html",
+            help="Baixe a animação para usar offline ou compartilhar"
+        )
@@ -0,0 +1,135 @@
+import re
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from app_pages.common import seed_control
+from figures import cached_figure, figure_cache
+from simulations import cap_table_cache, cap_table_scenario
+
+# -----------------------------------------------------------------------------
+# PÁGINA 2: MECÂNICA
+# -----------------------------------------------------------------------------
+
+
+def lorenz_figure(cap_table, rounds):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=[0, 1], y=[0, 1], line=dict(dash='dash', color='gray'), name='Igualdade perfeita'))
+    fig.add_trace(go.Scatter(x=cap_table['lorenz_initial'][0], y=cap_table['lorenz_initial'][1], name='Emissão'))
+    fig.add_trace(go.Scatter(x=cap_table['lorenz_final'][0], y=cap_table['lorenz_final'][1],
+                             name=f'Após {rounds} rodadas'))
+    fig.update_layout(xaxis_title="Fração das carteiras", yaxis_title="Fração dos tokens",
+                      xaxis_tickformat='.0%', yaxis_tickformat='.0%')
+    return fig
+
+
+def render():
+    st.title("2 - Simulador de Mecânica e Fracionalização")
+    st.markdown("Vamos tokenizar um ativo agora. Ajuste os parâmetros e veja o resultado.")
+    
+    col_input, col_output = st.columns([1, 1])
+    
+    with col_input:
+        st.markdown("### 🎛️ Parâmetros do Ativo")
+        asset_name = st.text_input("Nome do Ativo", "Edifício Faria Lima 2025")
+        valuation = st.number_input("Valuation do Ativo (R$)", min_value=10000.0, value=10000000.0, step=50000.0)
+        fraction_count = st.slider("Número de Tokens (Fracionalização)", min_value=100, max_value=1000000, value=1000, step=100)
+        standard = st.selectbox("Padrão do Token", ["ERC-20 (Fungível)", "ERC-721 (Único)"])
+        
+        st.markdown("---")
+        st.markdown("### ⚖️ Governança")
+        custody_quality = st.select_slider("Qualidade da Custódia Off-chain", options=["Baixa/Inexistente", "Média (Auditoria Anual)", "Alta (Banco Top-tier)"])
+    
+    token_price = valuation / fraction_count
+    
+    with col_output:
+        st.markdown("### 🏭 Resultado da Emissão (Minting)")
+        
+        c1, c2 = st.columns(2)
+        c1.metric("Preço por Token", f"R$ {token_price:,.2f}")
+        c2.metric("Market Cap Inicial", f"R$ {valuation:,.2f}")
+        
+        # Gráfico de Distribuição
+        df_dist = pd.DataFrame({
+            'Stakeholder': ['Investidores Varejo', 'Emissor (Retido)', 'Taxa Plataforma', 'Reserva de Liquidez'],
+            'Quantidade': [fraction_count*0.6, fraction_count*0.2, fraction_count*0.05, fraction_count*0.15]
+        })
+        # Figuras montadas uma vez por conteúdo e compartilhadas entre sessões (figures.py)
+        fig = cached_figure('distribution_pie', lambda: px.pie(df_dist, values='Quantidade', names='Stakeholder',
+                                                                title=f'Distribuição de Tokens: {asset_name}', hole=0.4),
+                            df_dist, asset_name)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Flags de Risco
+        st.markdown("### 🚩 Análise de Risco Automática")
+        if token_price < 10:
+            st.warning("⚠️ **Risco de Pulverização:** Preço muito baixo pode atrair especulação excessiva e dificultar governança.")
+        if custody_quality == "Baixa/Inexistente":
+            st.error("🚨 **Risco Crítico:** Sem custódia robusta, o token não tem lastro real. Potencial fraude.")
+        elif custody_quality == "Média (Auditoria Anual)":
+            st.info("ℹ️ **Atenção:** Auditoria anual pode não capturar fraudes em tempo real.")
+        else:
+            st.success("✅ **Estrutura Robusta:** Custódia de alta qualidade mitiga risco de contraparte.")
+
+    # Cap table simulada: emissão para carteiras sintéticas + mercado secundário
+    st.markdown("---")
+    st.markdown("### 👥 Cap Table Simulada (Emissão e Mercado Secundário)")
+    st.markdown("Os tokens de varejo são distribuídos entre carteiras sintéticas e negociados em rodadas "
+                "de mercado secundário. Acompanhe como a concentração dos detentores evolui.")
+
+    col_params, col_charts = st.columns([1, 2])
+
+    with col_params:
+        wallet_options = [w for w in [100, 1000, 10000, 100000, 1000000] if w <= fraction_count] or [100]
+        n_wallets = st.select_slider("Carteiras de investidores", options=wallet_options, value=wallet_options[-1])
+        rounds = st.slider("Rodadas de negociação", 0, 20, 5,
+                           help="Em cada rodada há ~1 negócio para cada 10 carteiras, sempre em tokens inteiros. "
+                                "No ERC-20 o vendedor vende parte do saldo; no ERC-721 cada negócio transfere "
+                                "um token único.")
+        concentration = st.select_slider("Concentração inicial da oferta",
+                                         options=["Alta (Pareto 1.1)", "Média (Pareto 1.5)", "Baixa (Pareto 3.0)"],
+                                         value="Média (Pareto 1.5)")
+        pareto_alpha = float(re.search(r'Pareto ([\d.]+)', concentration).group(1))
+        seed = seed_control()
+
+    token_standard = 'ERC-721' if standard.startswith('ERC-721') else 'ERC-20'
+    cap_table = cap_table_scenario(fraction_count, n_wallets, rounds, pareto_alpha, seed, token_standard)
+    initial, final = cap_table['initial'], cap_table['final']
+
+    with col_charts:
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Índice de Gini (investidores)", f"{final['gini']:.3f}",
+                  f"{final['gini'] - initial['gini']:+.3f}", delta_color="inverse")
+        c2.metric("Participação dos 10 maiores investidores", f"{final['top10']:.2%}",
+                  f"{final['top10'] - initial['top10']:+.2%}", delta_color="inverse")
+        c3.metric("Carteiras com saldo", f"{final['holders']:,}",
+                  help=f"{final['tokens']:,} tokens inteiros ({token_standard}); nenhuma carteira tem fração de token.")
+
+        tab_lorenz, tab_hist, tab_gini = st.tabs(["Curva de Lorenz", "Distribuição dos Saldos", "Gini por Rodada"])
+        with tab_lorenz:
+            fig = cached_figure('lorenz', lambda: lorenz_figure(cap_table, rounds),
+                                *cap_table['lorenz_initial'], *cap_table['lorenz_final'], rounds)
+            st.plotly_chart(fig, use_container_width=True)
+        with tab_hist:
+            counts, edges = cap_table['holdings_hist']
+            df_hist = pd.DataFrame({'Saldo (tokens)': np.sqrt(edges[:-1] * edges[1:]), 'Carteiras': counts})
+            fig = cached_figure('holdings_hist', lambda: px.bar(df_hist, x='Saldo (tokens)', y='Carteiras', log_x=True,
+                                                                 title="Carteiras por faixa de saldo (escala log)"),
+                                df_hist)
+            st.plotly_chart(fig, use_container_width=True)
+        with tab_gini:
+            df_gini = pd.DataFrame({'Rodada': range(len(cap_table['gini_trajectory'])),
+                                    'Gini (amostra)': cap_table['gini_trajectory']})
+            fig = cached_figure('gini_trajectory', lambda: px.line(df_gini, x='Rodada', y='Gini (amostra)', markers=True,
+                                                                    title="Concentração ao longo das rodadas"),
+                                df_gini)
+            st.plotly_chart(fig, use_container_width=True)
+
+        cache_stats = cap_table_cache.stats()
+        figure_stats = figure_cache.stats()
+        st.caption(f"⚡ {n_wallets:,} carteiras simuladas em {cap_table['elapsed']:.2f}s · cache: "
+                   f"{cache_stats['hits']} acertos, {cache_stats['misses']} falhas · figuras: "
+                   f"{figure_stats['hit_rate']:.0%} de acerto, {figure_stats['bytes'] / 2**20:.1f} MB.")
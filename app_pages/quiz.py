@@ -0,0 +1,138 @@
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from figures import cached_figure
+from quiz_engine import BANK, UNANSWERED, AttemptStore, attempt_store, simulate_class
+from simulations import fresh_seed, simulation_rng
+
+# -----------------------------------------------------------------------------
+# PÁGINA 9: QUIZ
+# -----------------------------------------------------------------------------
+# Prova sorteada do banco de questões (quiz_engine.py) para cada sessão;
+# as tentativas de todos os alunos alimentam o painel da turma.
+
+
+def _new_quiz():
+    # Nova prova: semente própria da sessão e alternativas em branco
+    seed = fresh_seed()
+    st.session_state.quiz_questions = BANK.sample(simulation_rng(seed, 'quiz'))
+    for question_id in BANK.ids:
+        st.session_state.pop(f'quiz_{question_id}', None)
+    st.session_state.pop('quiz_result', None)
+
+
+def quiz_form():
+    questions = st.session_state.quiz_questions
+    with st.form('quiz_form'):
+        for number, position in enumerate(questions, 1):
+            question = BANK.questions[position]
+            st.radio(f"{number}. {question['question']}", question['options'], index=None,
+                     key=f"quiz_{question['id']}")
+            st.markdown("---")
+        submitted = st.form_submit_button("Verificar Resultado")
+
+    if submitted:
+        choices = []
+        for position in questions:
+            question = BANK.questions[position]
+            picked = st.session_state.get(f"quiz_{question['id']}")
+            choices.append(UNANSWERED if picked is None else question['options'].index(picked))
+        correct = attempt_store().add(st.session_state.quiz_session, questions, np.array(choices))
+        st.session_state.quiz_result = correct
+
+    result = st.session_state.get('quiz_result')
+    if result is not None:
+        score, total = int(result.sum()), len(result)
+        review = sorted({BANK.modules[position] for position, ok in zip(questions, result) if not ok})
+        if score == total:
+            if submitted:
+                st.balloons()
+            st.success(f"Parabéns! Você acertou {score}/{total}. Você é um Mestre da Tokenização! 🎓")
+        elif score >= total - 1:
+            st.warning(f"Bom trabalho! Você acertou {score}/{total}. Revise: {', '.join(review)}.")
+        else:
+            st.error(f"Sua pontuação: {score}/{total}. Revise: {', '.join(review)}.")
+
+    st.button("🔄 Sortear novas questões", on_click=_new_quiz)
+
+
+def class_dashboard():
+    # Tentativas reais ficam no SQLite compartilhado; a turma simulada vai para
+    # um banco em memória só desta sessão e nunca se mistura aos rollups reais
+    c1, c2 = st.columns([2, 1])
+    n_attempts = c1.select_slider("Simular turma (tentativas)", options=[200, 1000, 10000, 100000], value=1000)
+    if c2.button("Simular turma"):
+        start = time.perf_counter()
+        question_idx, choices = simulate_class(BANK, n_attempts, fresh_seed())
+        st.session_state.quiz_sim_store = AttemptStore(':memory:')
+        st.session_state.quiz_sim_store.add_batch('turma simulada', question_idx, choices)
+        st.session_state.quiz_source = "Turma simulada"
+        st.caption(f"{n_attempts:,} tentativas corrigidas e gravadas em {time.perf_counter() - start:.2f}s.")
+
+    simulated = st.session_state.get('quiz_sim_store')
+    source = st.radio("Dados do painel", ["Tentativas reais", "Turma simulada"], horizontal=True, key='quiz_source',
+                      help="A turma simulada fica só nesta sessão e não entra nas estatísticas reais.")
+    if source == "Turma simulada" and simulated is None:
+        st.info("Nenhuma turma simulada nesta sessão. Escolha o tamanho e clique em Simular turma.")
+        return
+    store = simulated if source == "Turma simulada" else attempt_store()
+
+    start = time.perf_counter()
+    report = store.class_report()
+    elapsed = time.perf_counter() - start
+    if not report['attempts']:
+        st.info("Nenhuma tentativa registrada ainda. Responda o quiz ou simule uma turma.")
+        return
+
+    df_questions = report['questions']
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Tentativas", f"{report['attempts']:,}")
+    m2.metric("Nota média", f"{report['mean_score']:.0%}")
+    m3.metric("Questão mais difícil", f"{df_questions['difficulty'].iloc[0]:.0%} de erro")
+
+    df_view = pd.DataFrame({
+        'Questão': [BANK.questions[BANK.positions[q]]['question'] for q in df_questions['question_id']],
+        'Módulo': df_questions['module'],
+        'Respostas': df_questions['attempts'],
+        'Dificuldade': df_questions['difficulty'],
+        'Em branco': df_questions['unanswered'] / df_questions['attempts'],
+        'Distrator mais escolhido': [
+            '' if pd.isna(choice) else BANK.questions[BANK.positions[q]]['options'][int(choice)]
+            for q, choice in zip(df_questions['question_id'], df_questions['top_distractor'])],
+        'Taxa do distrator': df_questions['distractor_rate'],
+    })
+    st.dataframe(df_view, use_container_width=True, hide_index=True,
+                 column_config={column: st.column_config.NumberColumn(format="percent")
+                                for column in ['Dificuldade', 'Em branco', 'Taxa do distrator']})
+
+    df_modules = (df_questions.groupby('module')[['attempts', 'correct']].sum()
+                  .assign(Erro=lambda d: 1 - d['correct'] / d['attempts']).reset_index()
+                  .rename(columns={'module': 'Módulo'}))
+    fig = cached_figure('quiz_modules', lambda: px.bar(df_modules, x='Módulo', y='Erro',
+                                                       title="Taxa de erro por módulo").update_yaxes(tickformat='.0%'),
+                        df_modules)
+    st.plotly_chart(fig, use_container_width=True)
+    origin = "turma simulada desta sessão" if store is simulated else "tentativas reais, lotes deste processo"
+    st.caption(f"⚡ Painel lido dos rollups pré-calculados em {elapsed * 1000:.0f} ms "
+               f"({store.batches} lotes gravados; {origin}).")
+
+
+def render():
+    st.title("🎯 Avaliação de Conhecimento")
+    st.markdown("Teste o que você aprendeu.")
+
+    if 'quiz_session' not in st.session_state:
+        st.session_state.quiz_session = uuid.uuid4().hex
+    if 'quiz_questions' not in st.session_state:
+        _new_quiz()
+
+    view = st.radio("Visão", ["📝 Quiz", "📊 Painel da Turma"], horizontal=True, label_visibility="collapsed")
+    if view == "📝 Quiz":
+        quiz_form()
+    else:
+        class_dashboard()
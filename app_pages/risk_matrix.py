@@ -0,0 +1,65 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from app_pages.common import seed_control
+from figures import cached_figure
+from simulations import risk_stress_test
+
+# -----------------------------------------------------------------------------
+# PÁGINA 5: MATRIZ DE RISCO
+# -----------------------------------------------------------------------------
+
+
+def risk_heatmap(df_risk):
+    fig = px.imshow(df_risk,
+                    labels=dict(x="Categoria de Risco", y="", color="Intensidade (0-100)"),
+                    x=list(df_risk.columns), y=list(df_risk.index),
+                    color_continuous_scale='RdYlGn_r', range_color=[0, 100], text_auto='.0f')
+    fig.update_layout(height=400)
+    return fig
+
+
+def aggregate_figure(df_aggregate, aggregate_var, n_scenarios):
+    fig = px.bar(df_aggregate, x='Risco Agregado', y='Cenários',
+                 title=f"Distribuição do Risco Agregado ({n_scenarios:,} cenários)")
+    fig.add_vline(x=aggregate_var, line_dash='dash', line_color='red',
+                  annotation_text=f"VaR 95%: {aggregate_var:.1f}")
+    fig.update_yaxes(tickformat='.1%')
+    return fig
+
+
+def render():
+    st.title("5 - Matriz de Risco Multidimensional")
+    st.markdown("Tokenização não elimina riscos, ela adiciona novas camadas tecnológicas.")
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        st.markdown("### Teste de Estresse")
+        market_shock = st.slider("Choque de Mercado (Queda Preço)", 0, 100, 20)
+        tech_fail = st.checkbox("Falha no Smart Contract (Hack)")
+        reg_change = st.checkbox("Mudança Regulatória Adversa")
+        
+        n_scenarios = st.select_slider("Cenários simulados", options=[10000, 100000, 500000], value=100000)
+        seed = seed_control()
+        
+    with col2:
+        # Cenários correlacionados, condicionados aos controles de estresse
+        stress = risk_stress_test(market_shock, tech_fail, reg_change, n_scenarios, seed)
+        df_risk = stress['metrics']
+        
+        # Figuras montadas uma vez por conteúdo e compartilhadas entre sessões (figures.py)
+        fig = cached_figure('risk_heatmap', lambda: risk_heatmap(df_risk), df_risk)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.caption("Verde = Seguro | Vermelho = Crítico · VaR = percentil 95% da intensidade; "
+                   "ES = média dos 5% piores cenários.")
+
+        counts, edges = stress['aggregate_hist']
+        df_aggregate = pd.DataFrame({'Risco Agregado': (edges[:-1] + edges[1:]) / 2,
+                                     'Cenários': counts / counts.sum()})
+        fig = cached_figure('risk_aggregate', lambda: aggregate_figure(df_aggregate, stress['aggregate_var'], n_scenarios),
+                            df_aggregate, stress['aggregate_var'], n_scenarios)
+        st.plotly_chart(fig, use_container_width=True)
+        st.metric("Expected Shortfall 95% (Risco Agregado)", f"{stress['aggregate_es']:.1f}")
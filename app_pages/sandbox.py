@@ -0,0 +1,195 @@
+import os
+import re
+import time
+
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import chain_workspace, collect_mining_job, ensure_chain
+from blockchain import benchmark_hash_rates, create_genesis_block, next_block
+from chain_explorer import DEFAULT_WINDOW, PAGE_SIZE, ChainTable, chain_graph_source
+from chain_store import ChainStore, MappedChainStore, save_chain
+from chain_validation import REASONS, ChainValidator, verify_parallel
+from mining_jobs import cancel_job, start_job
+
+# -----------------------------------------------------------------------------
+# PÁGINA 3: SANDBOX BLOCKCHAIN
+# -----------------------------------------------------------------------------
+
+
+def chain_views():
+    # Tabela do explorador e validador acompanham o ChainStore atual; reiniciar
+    # a cadeia cria um store novo e descarta os dois
+    store = st.session_state.blockchain
+    if st.session_state.get('chain_table') is None or st.session_state.chain_table.store is not store:
+        st.session_state.chain_table = ChainTable(store)
+        st.session_state.chain_validator = ChainValidator(store, getattr(store, 'verified_upto', -1))
+    return st.session_state.chain_table, st.session_state.chain_validator
+
+
+def render():
+    ensure_chain()
+    st.title("3 - Sandbox: Construa sua Blockchain")
+    st.markdown("Entenda como a imutabilidade funciona na prática visualizando hashs e blocos.")
+
+    col_sim, col_viz = st.columns([1, 2])
+
+    with col_sim:
+        st.subheader("Mineração")
+        data_input = st.text_input("Dados da Transação (Ex: Alice paga Bob 10 Tokens)", "Transação Inicial")
+        difficulty = st.slider("Dificuldade de Mineração (Zeros no Hash)", 1, 6, 2)
+        mining_mode = st.radio("Modo de Mineração", ["Escalar", "Lote (NumPy)"], horizontal=True,
+                               help="Escalar (padrão, o mais rápido) usa o SHA-256 em C do hashlib, um nonce por vez. "
+                                    "Lote é uma demonstração didática do SHA-256 vetorizado em NumPy: calcula milhares de "
+                                    "nonces de uma vez, mas em geral fica mais lento que o escalar (compare abaixo).")
+        batch_size = st.select_slider("Tamanho do Lote (nonces)", options=[1024, 4096, 16384, 65536, 262144],
+                                      value=65536, disabled=mining_mode == "Escalar")
+        
+        mining_active = st.session_state.mining_job is not None
+        if st.button("Minerar Bloco", disabled=mining_active):
+            last_block = st.session_state.blockchain[-1]
+            new_block = next_block(last_block, data_input)
+            st.session_state.mining_job = start_job(new_block, difficulty, mining_mode, batch_size)
+            st.rerun()
+
+        @st.fragment(run_every=0.5 if mining_active else None)
+        def mining_progress():
+            job = collect_mining_job()
+            if job is None:
+                if st.session_state.mining_job is None and mining_active:
+                    # Job terminou: rerun completo para atualizar explorador e grafo
+                    st.rerun()
+                last = st.session_state.pop('last_mining_job', None)
+                if last and last["status"] == "done":
+                    st.success(f"Bloco adicionado à cadeia! ({last['tried']:,} nonces em {last['elapsed']:.2f}s)")
+                elif last and last["status"] == "cancelled":
+                    st.warning(f"Mineração cancelada após {last['tried']:,} nonces.")
+                elif last and last["status"] == "error":
+                    st.error("A mineração falhou.")
+                return
+            info = job.progress()
+            if info['waiting']:
+                st.info(f"⏳ Job `{info['job_id']}` aguardando o minerador compartilhado (muitos alunos minerando agora)...")
+            else:
+                st.info(f"⛏️ Job `{info['job_id']}` minerando em segundo plano (dificuldade {job.difficulty})...")
+            p1, p2 = st.columns(2)
+            p1.metric("Nonces Testados", f"{info['tried']:,}")
+            p2.metric("Hashes/s", f"{info['hash_rate']:,.0f}")
+            st.caption(f"Melhor prefixo até agora: `{info['best_hash'][:job.difficulty + 4]}...`")
+            if st.button("Cancelar Mineração"):
+                cancel_job(job.job_id)
+
+        mining_progress()
+
+        st.markdown("##### ⚡ Desempenho (hashes/s)")
+        r1, r2 = st.columns(2)
+        for col, mode in ((r1, "Escalar"), (r2, "Lote (NumPy)")):
+            rate = st.session_state.hash_rates.get(mode)
+            col.metric(mode, f"{rate:,.0f}" if rate else "—")
+        if st.button("Comparar Modos (100 mil hashes)"):
+            with st.spinner('Medindo...'):
+                rates = benchmark_hash_rates(st.session_state.blockchain[-1], 100000, batch_size)
+            st.session_state.hash_rates["Escalar"] = rates['scalar']
+            st.session_state.hash_rates["Lote (NumPy)"] = rates['batch']
+            st.rerun()
+            
+        if st.button("Reiniciar Blockchain"):
+            cancel_job(st.session_state.mining_job)
+            st.session_state.blockchain = ChainStore([create_genesis_block()])
+            st.rerun()
+
+        with st.expander("💾 Salvar / Abrir Cadeia"):
+            workspace = chain_workspace()
+            st.caption(f"Espaço de trabalho `{os.path.basename(workspace)}` (guarde o link da página para "
+                       "voltar às suas cadeias).")
+            chain_name = st.text_input("Nome da cadeia", "minha_cadeia")
+            if st.button("Salvar Cadeia"):
+                safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', chain_name) or "cadeia"
+                os.makedirs(workspace, exist_ok=True)
+                _, validator = chain_views()
+                validator.validate()
+                save_chain(st.session_state.blockchain, os.path.join(workspace, safe_name + ".chain"),
+                           validator.verified_upto)
+                st.success(f"Cadeia salva como '{safe_name}'.")
+            saved = sorted(f[:-len(".chain")] for f in os.listdir(workspace) if f.endswith(".chain")) \
+                if os.path.isdir(workspace) else []
+            chosen = st.selectbox("Cadeias salvas", saved, index=None, placeholder="Nenhuma selecionada")
+            if st.button("Abrir Cadeia", disabled=chosen is None):
+                try:
+                    store = MappedChainStore(os.path.join(workspace, chosen + ".chain"))
+                except (OSError, ValueError) as exc:
+                    st.error(f"Não foi possível abrir a cadeia: {exc}")
+                else:
+                    cancel_job(st.session_state.mining_job)
+                    st.session_state.blockchain = store
+                    st.rerun()
+
+    with col_viz:
+        st.subheader("Explorador da Cadeia")
+        # Tabela incremental: reaproveitada enquanto a cadeia não for reiniciada
+        chain_table, chain_validator = chain_views()
+        pages = chain_table.page_count()
+        page = st.number_input(f"Página (de {pages}, {PAGE_SIZE} blocos cada)", min_value=1,
+                               max_value=pages, value=pages, step=1)
+        st.dataframe(chain_table.page(page - 1), hide_index=True)
+        chain_bytes = st.session_state.blockchain.nbytes()
+        st.caption(f"Memória da cadeia: {chain_bytes / 1024:,.1f} KB "
+                   f"({chain_bytes / len(st.session_state.blockchain):,.0f} bytes/bloco)")
+        if isinstance(st.session_state.blockchain, MappedChainStore):
+            st.caption(f"Cadeia aberta do disco via mmap: {st.session_state.blockchain.disk_bytes() / 1024:,.1f} KB "
+                       "lidos sob demanda.")
+        
+        # Visualização Gráfica da Cadeia
+        st.markdown("#### Visualização da Ligação Criptográfica")
+        window = st.slider("Blocos recentes exibidos no grafo", 5, 50, DEFAULT_WINDOW,
+                           help="Blocos mais antigos são resumidos em intervalos para manter o grafo leve.")
+        st.graphviz_chart(chain_graph_source(st.session_state.blockchain, window))
+        
+    st.markdown("---")
+    st.subheader("🧪 Laboratório de Ataques")
+    st.info("**Experimento Mental:** Se você tentar alterar os dados do Bloco #0, o hash dele mudará. Como o Bloco #1 contém o 'Hash Anterior' do Bloco #0, o hash do Bloco #1 também mudará, invalidando toda a cadeia futura. É assim que a blockchain garante segurança.")
+
+    col_attack, col_check = st.columns([1, 2])
+
+    with col_attack:
+        st.markdown("#### Adulterar um Bloco")
+        chain = st.session_state.blockchain
+        target_index = st.number_input("Índice do bloco", min_value=0, max_value=len(chain) - 1, value=0, step=1)
+        target = chain[target_index]
+        tampered_data = st.text_input("Novos dados", target.data, key=f"tamper_{target_index}")
+        rehash = st.checkbox("Recalcular o hash do bloco adulterado",
+                             help="O atacante atualiza o hash do bloco, mas o bloco seguinte continua apontando para o hash antigo.")
+        if st.button("Adulterar Bloco"):
+            target.data = tampered_data
+            if rehash:
+                target.hash = target.calculate_hash()
+            chain[target_index] = target
+            chain_table.invalidate(target_index)
+            chain_validator.invalidate(target_index)
+            st.rerun()
+
+    with col_check:
+        st.markdown("#### Verificação de Integridade")
+        first_invalid = chain_validator.validate()
+        if first_invalid is None:
+            st.success(f"✅ Cadeia íntegra: {len(chain)} blocos verificados.")
+        else:
+            suffix = chain_validator.invalid_suffix()
+            st.error(f"🚨 Cadeia inválida a partir do bloco #{first_invalid}: "
+                     f"{len(suffix)} bloco(s) comprometido(s). {REASONS[chain_validator.reason]}.")
+            df_invalid = pd.DataFrame({
+                "Index": list(suffix[:200]),
+                "Situação": ["Falhou na verificação" if i == first_invalid else f"Invalidado (depende do bloco #{first_invalid})"
+                             for i in suffix[:200]]
+            })
+            st.dataframe(df_invalid, hide_index=True)
+        st.caption(f"Verificado até o bloco #{chain_validator.verified_upto} · "
+                   f"{chain_validator.checks} checagens de hash nesta cadeia (cada bloco novo custa uma).")
+        if st.button("Reverificar Cadeia Inteira (em paralelo)"):
+            start = time.perf_counter()
+            invalid = verify_parallel(chain, limit=20)
+            elapsed = time.perf_counter() - start
+            if invalid:
+                st.warning(f"Primeiros blocos inválidos: {', '.join(f'#{i}' for i in invalid)} ({elapsed:.2f}s)")
+            else:
+                st.success(f"Todos os {len(chain)} blocos conferidos em {elapsed:.2f}s.")
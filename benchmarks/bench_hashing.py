@@ -0,0 +1,42 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import create_genesis_block, next_block
+
+# -----------------------------------------------------------------------------
+# MICRO-BENCHMARK: calculate_hash (cabeçalho completo) vs. midstate do prefixo
+# -----------------------------------------------------------------------------
+# Uso: python benchmarks/bench_hashing.py [tentativas]
+
+
+def attempts_per_second(hash_fn, attempts):
+    start = time.perf_counter()
+    for nonce in range(attempts):
+        hash_fn(nonce)
+    return attempts / (time.perf_counter() - start)
+
+
+def main(attempts=200000):
+    block = next_block(create_genesis_block(), "Alice paga Bob 10 Tokens")
+
+    def full_hash(nonce):
+        block.nonce = nonce
+        return block.calculate_hash()
+
+    def midstate_hash(nonce):
+        return block.calculate_hash_fast(nonce)
+
+    assert full_hash(12345) == midstate_hash(12345)
+
+    full = attempts_per_second(full_hash, attempts)
+    fast = attempts_per_second(midstate_hash, attempts)
+    print(f"calculate_hash (completo): {full:>12,.0f} tentativas/s")
+    print(f"midstate do prefixo:       {fast:>12,.0f} tentativas/s")
+    print(f"ganho:                     {fast / full:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,51 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kyc_index import (LOOKUP_MIXES, digests_to_addresses, load_whitelist_csv, measure_lookups, random_digests,
+                       save_whitelist_csv, set_bytes_per_address)
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: WHITELIST KYC EM MASSA (CARGA CSV, MEMÓRIA, CONSULTAS/S)
+# -----------------------------------------------------------------------------
+# Uso: python benchmarks/bench_kyc.py [endereços aprovados] [consultas]
+
+
+def main(n_addresses=1000000, n_queries=1000000):
+    rng = np.random.default_rng(0)
+    digests = random_digests(rng, n_addresses)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'whitelist.csv')
+        save_whitelist_csv(digests, path)
+        start = time.perf_counter()
+        index = load_whitelist_csv(path)
+        load = time.perf_counter() - start
+
+    addresses = digests_to_addresses(digests[:100000])
+    approved = set(addresses)
+    queries = addresses[:n_queries // 2] + digests_to_addresses(random_digests(rng, n_queries // 2))
+    start = time.perf_counter()
+    for address in queries:
+        address in approved
+    set_rate = len(queries) / (time.perf_counter() - start)
+    rates = measure_lookups(index, rng, n_queries)
+
+    print(f"carga do CSV ({n_addresses:,} endereços):  {load:>10.2f} s")
+    print(f"memória por endereço (índice):       {index.bytes_per_address():>10.1f} B")
+    print(f"memória por endereço (set de str):   {set_bytes_per_address(addresses):>10.1f} B")
+    print(f"consultas/s, set (uma a uma):        {set_rate:>10,.0f}")
+    for mix, member_share in LOOKUP_MIXES.items():
+        print(f"{mix} ({member_share:.0%} aprovados), consultas/s em lote:")
+        print(f"  só busca binária:                  {rates[mix]['sorted']:>10,.0f}")
+        print(f"  Bloom + busca binária:             {rates[mix]['bloom']:>10,.0f}")
+        print(f"  automático:                        {rates[mix]['auto']:>10,.0f}")
+    print(f"falsos positivos do Bloom:           {rates['false_positive']:>10.2%}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from token_ledger import simulate_ledger
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: THROUGHPUT DO LEDGER ERC-20 (TRANSFERÊNCIAS/S)
+# -----------------------------------------------------------------------------
+# Uso: python benchmarks/bench_ledger.py [transferências] [endereços]
+
+
+def main(n_ops=2000000, n_addresses=100000):
+    print(f"{n_ops:,} transferências entre {n_addresses:,} endereços")
+    for label, whitelist_share in (("ERC-20 simples", None), ("Compliance (80% KYC)", 0.8)):
+        for batch_size in (1000, 100000):
+            run = simulate_ledger("BENCH", 10**12, n_addresses, n_ops, seed=0,
+                                  batch_size=batch_size, whitelist_share=whitelist_share)
+            assert run['supply_ok']
+            print(f"{label:<22} lote {batch_size:>7,}: {run['tps']:>12,.0f} transf/s "
+                  f"({run['reverted']:,} revertidas)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,33 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_validation import build_chain
+from chain_validation import verify_parallel
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: VERIFICAÇÃO COMPLETA EM PARALELO (ESCALONAMENTO POR WORKERS)
+# -----------------------------------------------------------------------------
+# Uso: python benchmarks/bench_parallel_validation.py [blocos]
+
+
+def main(length=1000000):
+    print(f"Construindo cadeia com {length:,} blocos...")
+    store = build_chain(length)
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    baseline = None
+    for workers in counts:
+        verify_parallel(store.segment(0, min(length, 1000)), workers)  # aquece o pool
+        start = time.perf_counter()
+        assert verify_parallel(store, workers) == []
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>2} worker(s): {elapsed:>8.2f} s  speedup {baseline / elapsed:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
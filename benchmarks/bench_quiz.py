@@ -0,0 +1,62 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quiz_engine import BANK, AttemptStore, simulate_class
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: CORREÇÃO EM LOTE, GRAVAÇÃO EM SQLITE E PAINEL DA TURMA
+# -----------------------------------------------------------------------------
+# Grava as tentativas uma por transação (como um INSERT por envio) e em lotes,
+# e compara o painel lido dos rollups com a mesma agregação por varredura.
+# Uso: python benchmarks/bench_quiz.py [tentativas]
+
+_SCAN = """
+SELECT question_id, COUNT(*), SUM(correct), SUM(choice = -1) FROM answers GROUP BY question_id;
+"""
+_SCAN_OPTIONS = """
+SELECT question_id, choice, COUNT(*) FROM answers WHERE choice >= 0 GROUP BY question_id, choice;
+"""
+
+
+def main(n_attempts=200000):
+    question_idx, choices = simulate_class(BANK, n_attempts, seed=0)
+
+    start = time.perf_counter()
+    BANK.score(question_idx, choices).sum(axis=1)
+    score_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        single = AttemptStore(os.path.join(tmp, 'single.sqlite'), batch_size=1)
+        n_single = min(n_attempts, 2000)
+        start = time.perf_counter()
+        for i in range(n_single):
+            single.add('bench', question_idx[i], choices[i])
+        single_rate = n_single / (time.perf_counter() - start)
+
+        store = AttemptStore(os.path.join(tmp, 'batched.sqlite'))
+        start = time.perf_counter()
+        store.add_batch('bench', question_idx, choices)
+        batch_rate = n_attempts / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        report = store.class_report()
+        rollup_time = time.perf_counter() - start
+        start = time.perf_counter()
+        store.conn.execute(_SCAN).fetchall()
+        store.conn.execute(_SCAN_OPTIONS).fetchall()
+        scan_time = time.perf_counter() - start
+
+    print(f"correção vetorizada ({n_attempts:,} tentativas): {score_time * 1000:>10.1f} ms")
+    print(f"tentativas/s, uma transação cada:        {single_rate:>10,.0f}")
+    print(f"tentativas/s, lote único:                {batch_rate:>10,.0f}")
+    print(f"painel pelos rollups:                    {rollup_time * 1000:>10.1f} ms")
+    print(f"mesma agregação varrendo as respostas:   {scan_time * 1000:>10.1f} ms")
+    print(f"nota média da turma simulada:            {report['mean_score']:>10.1%}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import app_pages
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: PARTIDA A FRIO E TEMPO POR RERUN DO SCRIPT DO APP
+# -----------------------------------------------------------------------------
+# Partida a frio: processo Python novo que importa o Streamlit e executa o
+# script uma vez (AppTest), na página inicial. Rerun: média de execuções
+# seguidas do script já carregado, em cada página. A lista de páginas e o
+# tempo de import de cada módulo vêm do próprio registro (app_pages).
+# Uso: python benchmarks/bench_startup.py [script] [reruns]
+
+_COLD_START = """
+import sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+streamlit_loaded = time.perf_counter()
+AppTest.from_file({script!r}, default_timeout=120).run()
+end = time.perf_counter()
+print(streamlit_loaded - start, end - streamlit_loaded)
+"""
+
+
+def cold_start(script, runs=3):
+    # Melhor de `runs` processos novos (descarta ruído de disco/cache do SO)
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', _COLD_START.format(script=script)], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout.split()
+        results.append((float(out[-2]), float(out[-1])))
+    return min(results, key=lambda r: r[1])
+
+
+def rerun_times(script, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=120).run()
+    times = {}
+    for page in app_pages.PAGES:
+        at.sidebar.radio[0].set_value(page)
+        start = time.perf_counter()
+        at.run()
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(reruns):
+            at.run()
+        times[page] = (first, (time.perf_counter() - start) / reruns, app_pages.load_time(page))
+    return times
+
+
+def main(script=os.path.join(ROOT, 'tokens.py'), reruns=5):
+    streamlit_import, first_run = cold_start(script)
+    print(f"partida a frio: import do streamlit {streamlit_import:.2f}s + primeira execução {first_run:.2f}s")
+    print(f"{'página':<30} {'1ª visita':>10} {'import':>10} {'rerun':>10}")
+    for page, (first, rerun, imported) in rerun_times(script, int(reruns)).items():
+        # Sem tempo de import: o script medido não usa o registro (ex.: versão monolítica)
+        imported = f"{imported * 1000:>8.0f}ms" if imported is not None else f"{'—':>10}"
+        print(f"{page:<30} {first * 1000:>8.0f}ms {imported} {rerun * 1000:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from blockchain import create_genesis_block, next_block
+from chain_store import ChainStore
+from chain_validation import ChainValidator, validate_full
+
+# -----------------------------------------------------------------------------
+# BENCHMARK: VALIDAÇÃO COMPLETA vs. INCREMENTAL (MARCA D'ÁGUA)
+# -----------------------------------------------------------------------------
+# Uso: python benchmarks/bench_validation.py [blocos] [anexações]
+
+
+def build_chain(length):
+    store = ChainStore([create_genesis_block()])
+    for i in range(1, length):
+        store.append(next_block(store[-1], f"Transação {i}"))
+    return store
+
+
+def main(length=100000, appends=1000):
+    print(f"Construindo cadeia com {length:,} blocos...")
+    store = build_chain(length)
+
+    start = time.perf_counter()
+    assert validate_full(store) is None
+    full = time.perf_counter() - start
+
+    validator = ChainValidator(store)
+    start = time.perf_counter()
+    assert validator.validate() is None
+    first = time.perf_counter() - start
+
+    elapsed = 0.0
+    for i in range(appends):
+        store.append(next_block(store[-1], f"Anexado {i}"))
+        start = time.perf_counter()
+        assert validator.validate() is None
+        elapsed += time.perf_counter() - start
+    incremental = elapsed / appends
+
+    print(f"validação completa:             {full * 1000:>10.1f} ms")
+    print(f"primeira passada do validador:  {first * 1000:>10.1f} ms")
+    print(f"incremental por bloco anexado:  {incremental * 1e6:>10.1f} µs")
+    print(f"ganho por anexação:             {full / incremental:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,403 @@
+import hashlib
+import multiprocessing as mp
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# BLOCO E CADEIA (SIMULAÇÃO DE BLOCKCHAIN)
+# -----------------------------------------------------------------------------
+# Módulo separado do tokens.py para que os processos de mineração paralela
+# possam importar estas funções sem reexecutar o script do Streamlit.
+
+# Tamanho do intervalo de nonces entregue a cada worker por vez
+PARALLEL_CHUNK_SIZE = 20000
+# Abaixo desta dificuldade a busca serial termina antes do pool aquecer
+PARALLEL_MIN_DIFFICULTY = 4
+# Quantidade de nonces avaliados por lote no modo vetorizado (NumPy, didático)
+DEFAULT_BATCH_SIZE = 65536
+
+
+class Block:
+    __slots__ = ('index', 'timestamp', 'data', 'previous_hash', 'nonce', 'hash',
+                 '_prefix_key', '_prefix_state')
+
+    def __init__(self, index, timestamp, data, previous_hash):
+        self.index = index
+        self.timestamp = timestamp
+        self.data = data
+        self.previous_hash = previous_hash
+        self.nonce = 0
+        self._prefix_key = None
+        self._prefix_state = None
+        self.hash = self.calculate_hash()
+
+    @classmethod
+    def restore(cls, index, timestamp, data, previous_hash, nonce, block_hash):
+        # Reconstrói um bloco já minerado sem recalcular o hash (usado pelos
+        # armazenamentos compactos da cadeia)
+        block = cls.__new__(cls)
+        block.index = index
+        block.timestamp = timestamp
+        block.data = data
+        block.previous_hash = previous_hash
+        block.nonce = nonce
+        block.hash = block_hash
+        block._prefix_key = None
+        block._prefix_state = None
+        return block
+
+    def hash_prefix(self):
+        # Campos fixos do cabeçalho: só o nonce muda durante a mineração
+        return (str(self.index).encode('utf-8') +
+                str(self.timestamp).encode('utf-8') +
+                str(self.data).encode('utf-8') +
+                str(self.previous_hash).encode('utf-8'))
+
+    def calculate_hash(self):
+        sha = hashlib.sha256()
+        sha.update(str(self.index).encode('utf-8') +
+                   str(self.timestamp).encode('utf-8') +
+                   str(self.data).encode('utf-8') +
+                   str(self.previous_hash).encode('utf-8') +
+                   str(self.nonce).encode('utf-8'))
+        return sha.hexdigest()
+
+    def prefix_state(self):
+        # Estado SHA-256 (midstate) já alimentado com o prefixo fixo. É
+        # refeito apenas se algum campo do cabeçalho mudar.
+        key = (self.index, self.timestamp, self.data, self.previous_hash)
+        if self._prefix_key != key:
+            self._prefix_state = hashlib.sha256(self.hash_prefix())
+            self._prefix_key = key
+        return self._prefix_state
+
+    def calculate_hash_fast(self, nonce=None):
+        # Mesmo resultado de calculate_hash: copia o midstate e hasheia só o nonce
+        sha = self.prefix_state().copy()
+        sha.update(str(self.nonce if nonce is None else nonce).encode('utf-8'))
+        return sha.hexdigest()
+
+    def mine_block(self, difficulty):
+        target = '0' * difficulty
+        state = self.prefix_state()
+        nonce = self.nonce
+        block_hash = self.hash
+        while block_hash[:difficulty] != target:
+            nonce += 1
+            sha = state.copy()
+            sha.update(str(nonce).encode('utf-8'))
+            block_hash = sha.hexdigest()
+        self.nonce = nonce
+        self.hash = block_hash
+
+    def mine_block_batch(self, difficulty, batch_size=DEFAULT_BATCH_SIZE):
+        # Demonstração didática: avalia lotes de nonces de uma vez com o SHA-256
+        # vetorizado abaixo e fica com o primeiro válido de cada lote (mesmo
+        # nonce da busca serial). Não é mais rápido que mine_block.
+        nonce = batch_search(self.hash_prefix(), difficulty, self.nonce, batch_size)
+        self.nonce = nonce
+        self.hash = self.calculate_hash_fast()
+
+    def mine_block_parallel(self, difficulty, workers=None):
+        # Mesmo nonce que mine_block encontraria, mas dividindo o espaço de
+        # busca entre processos. Dificuldades baixas ficam no caminho serial.
+        workers = workers or os.cpu_count() or 1
+        if workers < 2 or difficulty < PARALLEL_MIN_DIFFICULTY:
+            self.mine_block(difficulty)
+            return
+        self.nonce = parallel_search(self.hash_prefix(), difficulty, self.nonce, workers)
+        self.hash = self.calculate_hash_fast()
+
+
+def create_genesis_block():
+    return Block(0, datetime.now(), "Bloco Gênese", "0")
+
+
+def next_block(last_block, data):
+    this_index = last_block.index + 1
+    this_timestamp = datetime.now()
+    this_hash = last_block.hash
+    return Block(this_index, this_timestamp, data, this_hash)
+
+
+# -----------------------------------------------------------------------------
+# MINERAÇÃO PARALELA (POOL DE PROCESSOS)
+# -----------------------------------------------------------------------------
+# Buscas simultâneas no mesmo pool (uma por job de mineração). Cada busca usa
+# o seu slot em _found: [geração, menor nonce encontrado]. Os intervalos de
+# todas as buscas entram na mesma fila do pool, intercalados.
+SEARCH_SLOTS = 16
+
+_pool = None
+_pool_workers = 0
+_found = None
+_free_slots = list(range(SEARCH_SLOTS))
+_slots_lock = threading.Lock()
+
+
+def _init_worker(found):
+    global _found
+    _found = found
+
+
+def _search_range(prefix, difficulty, start, stop, slot, generation):
+    # Varre [start, stop) e devolve (menor nonce válido do intervalo ou None,
+    # menor hash visto, nonces testados). Aborta cedo se outro worker da mesma
+    # busca já achou um nonce menor que este intervalo ou se a busca
+    # (generation do slot) que o originou já terminou ou foi cancelada.
+    target = '0' * difficulty
+    state = hashlib.sha256(prefix)
+    best = 'f' * 64
+    for nonce in range(start, stop):
+        if nonce % 4096 == 0:
+            current, found = _found[2 * slot], _found[2 * slot + 1]
+            if current != generation or 0 <= found < start:
+                return None, best, nonce - start
+        sha = state.copy()
+        sha.update(str(nonce).encode('utf-8'))
+        digest = sha.hexdigest()
+        if digest < best:
+            best = digest
+        if digest[:difficulty] == target:
+            with _found.get_lock():
+                if _found[2 * slot] == generation and (_found[2 * slot + 1] < 0 or nonce < _found[2 * slot + 1]):
+                    _found[2 * slot + 1] = nonce
+            return nonce, best, nonce - start + 1
+    return None, best, stop - start
+
+
+def _get_pool(workers):
+    # O pool é reaproveitado entre mineradas: criar processos custa mais que
+    # minerar um bloco de dificuldade baixa. Só é recriado (outro número de
+    # workers) quando nenhuma busca está em andamento. Chamado sob _slots_lock.
+    global _pool, _pool_workers, _found
+    if _pool is None or (_pool_workers != workers and len(_free_slots) == SEARCH_SLOTS):
+        shutdown_pool()
+        ctx = mp.get_context('spawn')
+        _found = ctx.Array('q', [0, -1] * SEARCH_SLOTS)
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                    initializer=_init_worker, initargs=(_found,))
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_pool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+def _acquire_slot(workers, should_stop, on_wait=None):
+    # Reserva um slot e o pool; com todos os slots ocupados, espera na fila
+    # (avisando on_wait uma vez), desistindo se a busca for cancelada
+    waiting = False
+    while True:
+        with _slots_lock:
+            if _free_slots:
+                pool = _get_pool(workers)
+                slot = _free_slots.pop()
+                with _found.get_lock():
+                    _found[2 * slot] += 1
+                    _found[2 * slot + 1] = -1
+                    return pool, slot, _found[2 * slot]
+        if should_stop is not None and should_stop():
+            return None
+        if not waiting and on_wait is not None:
+            on_wait()
+        waiting = True
+        time.sleep(0.1)
+
+
+def _release_slot(slot):
+    # Muda a geração: intervalos ainda em andamento desta busca abortam
+    with _found.get_lock():
+        _found[2 * slot] += 1
+    with _slots_lock:
+        _free_slots.append(slot)
+
+
+def parallel_search(prefix, difficulty, start=0, workers=None, chunk_size=PARALLEL_CHUNK_SIZE,
+                    should_stop=None, on_chunk=None, on_wait=None):
+    # Os intervalos são despachados em ordem crescente. Quando um worker acha
+    # um nonce, só esperamos os intervalos anteriores a ele terminarem, e o
+    # menor nonce válido (o mesmo da busca serial) é o resultado.
+    # Várias buscas dividem o pool, cada uma no seu slot de _found e com no
+    # máximo 2 intervalos por worker na fila.
+    # should_stop() é consultado entre intervalos (None = busca cancelada) e
+    # on_chunk(testados, menor_hash) recebe o progresso de cada intervalo;
+    # on_wait() avisa que a busca está na fila por um slot livre.
+    workers = workers or os.cpu_count() or 1
+    reserved = _acquire_slot(workers, should_stop, on_wait)
+    if reserved is None:
+        return None
+    pool, slot, generation = reserved
+    pending = {}
+    try:
+        next_start = start
+        best = None
+        while True:
+            if should_stop is not None and should_stop():
+                return None
+            while len(pending) < workers * 2 and (best is None or next_start < best):
+                future = pool.submit(_search_range, prefix, difficulty,
+                                     next_start, next_start + chunk_size, slot, generation)
+                pending[future] = next_start
+                next_start += chunk_size
+            if not pending:
+                return best
+            done, _ = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+            for future in done:
+                del pending[future]
+                nonce, lowest, tried = future.result()
+                if on_chunk is not None:
+                    on_chunk(tried, lowest)
+                if nonce is not None and (best is None or nonce < best):
+                    best = nonce
+            if best is not None:
+                # Intervalos acima do melhor nonce não podem mais vencer
+                for future, chunk_start in list(pending.items()):
+                    if chunk_start > best:
+                        future.cancel()
+                pending = {f: s for f, s in pending.items() if s < best}
+    finally:
+        for future in pending:
+            future.cancel()
+        _release_slot(slot)
+
+
+# -----------------------------------------------------------------------------
+# MINERAÇÃO EM LOTE (SHA-256 VETORIZADO COM NUMPY)
+# -----------------------------------------------------------------------------
+# Cada linha dos arrays é um candidato: os 64 rounds do SHA-256 rodam uma vez
+# para o lote inteiro, em vez de um laço Python por nonce. É uma demonstração
+# didática da vetorização: cada round ainda passa pelo interpretador e varre
+# arrays na memória, e o resultado fica em geral abaixo do hashlib em C com
+# midstate (~0,4-0,7 M contra ~0,7-0,8 M hashes/s em lotes de 65536; bem menos
+# em lotes pequenos). O modo escalar é o padrão da interface e dos jobs.
+
+_K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+], dtype=np.uint32)
+
+_H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+], dtype=np.uint32)
+
+
+def _rotr(x, n):
+    return (x >> np.uint32(n)) | (x << np.uint32(32 - n))
+
+
+def _compress(state, words):
+    # state: (8, B) uint32, words: (B, 16) uint32 de um bloco de 64 bytes
+    w = np.empty((64, words.shape[0]), dtype=np.uint32)
+    w[:16] = words.T
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> np.uint32(3))
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> np.uint32(10))
+        w[t] = w[t - 16] + s0 + w[t - 7] + s1
+
+    a, b, c, d, e, f, g, h = state
+    for t in range(64):
+        t1 = h + (_rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)) + ((e & f) ^ (~e & g)) + _K[t] + w[t]
+        t2 = (_rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c))
+        h, g, f, e, d, c, b, a = g, f, e, d + t1, c, b, a, t1 + t2
+    return state + np.stack([a, b, c, d, e, f, g, h])
+
+
+def prefix_midstate(prefix):
+    # Processa os blocos completos do prefixo uma única vez; sobra a cauda
+    full = len(prefix) // 64 * 64
+    state = _H0.reshape(8, 1).copy()
+    blocks = np.frombuffer(prefix[:full], dtype='>u4').astype(np.uint32).reshape(-1, 16)
+    for block in blocks:
+        state = _compress(state, block.reshape(1, 16))
+    return state, prefix[full:]
+
+
+def sha256_batch(prefix, nonces, midstate=None):
+    # SHA-256 de prefix + str(nonce) para um array de nonces com a mesma
+    # quantidade de dígitos. Devolve os 8 words do digest, shape (8, B).
+    nonces = np.asarray(nonces, dtype=np.uint64)
+    state, tail = midstate if midstate is not None else prefix_midstate(prefix)
+    digits = len(str(int(nonces[0])))
+    msg_len = len(prefix) + digits
+    tail_len = len(tail) + digits
+    n_blocks = (tail_len + 9 + 63) // 64
+
+    buf = np.zeros((len(nonces), n_blocks * 64), dtype=np.uint8)
+    buf[:, :len(tail)] = np.frombuffer(tail, dtype=np.uint8)
+    for i in range(digits):
+        place = np.uint64(10 ** (digits - 1 - i))
+        buf[:, len(tail) + i] = (nonces // place % np.uint64(10)).astype(np.uint8) + ord('0')
+    buf[:, tail_len] = 0x80
+    buf[:, -8:] = np.frombuffer((msg_len * 8).to_bytes(8, 'big'), dtype=np.uint8)
+
+    words = buf.view('>u4').astype(np.uint32)
+    state = np.repeat(state, len(nonces), axis=1)
+    for block in range(n_blocks):
+        state = _compress(state, words[:, block * 16:(block + 1) * 16])
+    return state
+
+
+def leading_zero_mask(digest_words, difficulty):
+    # True onde o hash hexadecimal começa com `difficulty` zeros (4 bits cada)
+    mask = np.ones(digest_words.shape[1], dtype=bool)
+    bits = 4 * difficulty
+    for word in digest_words:
+        if bits <= 0:
+            break
+        if bits >= 32:
+            mask &= word == 0
+        else:
+            mask &= (word >> np.uint32(32 - bits)) == 0
+        bits -= 32
+    return mask
+
+
+def batch_search(prefix, difficulty, start=0, batch_size=DEFAULT_BATCH_SIZE):
+    # Percorre [start, start + batch_size), ... em ordem e devolve o menor
+    # nonce válido. Lotes são cortados nas potências de 10 para que todos os
+    # candidatos de um lote tenham o mesmo número de dígitos.
+    midstate = prefix_midstate(prefix)
+    nonce = start
+    while True:
+        stop = min(nonce + batch_size, 10 ** len(str(nonce)))
+        nonces = np.arange(nonce, stop, dtype=np.uint64)
+        hits = np.flatnonzero(leading_zero_mask(sha256_batch(prefix, nonces, midstate), difficulty))
+        if hits.size:
+            return nonce + int(hits[0])
+        nonce = stop
+
+
+def benchmark_hash_rates(block, attempts=100000, batch_size=DEFAULT_BATCH_SIZE):
+    # Hashes/s de cada modo sobre o mesmo cabeçalho e a mesma faixa de nonces
+    start = time.perf_counter()
+    for nonce in range(attempts):
+        block.calculate_hash_fast(nonce)
+    scalar = attempts / (time.perf_counter() - start)
+
+    prefix = block.hash_prefix()
+    start = time.perf_counter()
+    midstate = prefix_midstate(prefix)
+    nonce = 0
+    while nonce < attempts:
+        stop = min(nonce + batch_size, attempts, 10 ** len(str(nonce)))
+        leading_zero_mask(sha256_batch(prefix, np.arange(nonce, stop, dtype=np.uint64), midstate), 1)
+        nonce = stop
+    batch = attempts / (time.perf_counter() - start)
+    return {'scalar': scalar, 'batch': batch}
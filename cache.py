@@ -0,0 +1,102 @@
+import functools
+import threading
+from collections import OrderedDict
+
+# -----------------------------------------------------------------------------
+# CACHE LRU COMPARTILHADO (RESULTADOS DE SIMULAÇÃO E FIGURAS)
+# -----------------------------------------------------------------------------
+# Um dicionário ordenado com limite de entradas e descarte do item usado há
+# mais tempo. Vive no processo do servidor, então todas as sessões
+# aproveitam os mesmos resultados. Contadores de acertos/falhas ficam
+# visíveis nas páginas. Com max_bytes (e uma função sizeof), o cache também
+# respeita um teto de memória, descartando os itens mais antigos.
+
+
+class LRUCache:
+    def __init__(self, name, max_entries=128, max_bytes=None, sizeof=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._items = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+            return default
+
+    def _discard(self, key):
+        self._items.pop(key)
+        self.nbytes -= self._sizes.pop(key, 0)
+
+    def put(self, key, value):
+        size = self.sizeof(value) if self.sizeof is not None else 0
+        with self._lock:
+            if key in self._items:
+                self._discard(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Maior que o cache inteiro: devolvido a quem pediu, mas não guardado
+                return
+            self._items[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            while len(self._items) > self.max_entries or (self.max_bytes is not None and self.nbytes > self.max_bytes):
+                self._discard(next(iter(self._items)))
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        # O cálculo roda fora da trava: duas sessões com a mesma chave podem
+        # calcular ao mesmo tempo, mas nenhuma bloqueia as demais
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'name': self.name,
+            'entries': len(self._items),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.nbytes,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+def memoize(cache):
+    # Chave = nome da função + argumentos (que precisam ser hashable). Os
+    # valores devolvidos são compartilhados: quem chama não deve alterá-los.
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (fn.__qualname__, args, tuple(sorted(kwargs.items())))
+            return cache.get_or_compute(key, lambda: fn(*args, **kwargs))
+        wrapper.cache = cache
+        return wrapper
+    return decorator
@@ -0,0 +1,118 @@
+import graphviz
+import pandas as pd
+
+from cache import LRUCache
+
+# -----------------------------------------------------------------------------
+# EXPLORADOR DA CADEIA (TABELA INCREMENTAL E PAGINADA)
+# -----------------------------------------------------------------------------
+# A tabela do Sandbox não percorre mais a cadeia inteira a cada rerun. As
+# linhas são montadas por página, só quando a página é exibida, e ficam em
+# cache: minerar um bloco invalida apenas a última página e reiniciar a cadeia
+# descarta tudo (nova ChainTable para o novo ChainStore).
+
+PAGE_SIZE = 50
+COLUMNS = ["Index", "Timestamp", "Dados", "Hash Atual", "Hash Anterior", "Nonce"]
+
+
+def block_row(block):
+    return {
+        "Index": block.index,
+        "Timestamp": block.timestamp.strftime("%H:%M:%S"),
+        "Dados": block.data,
+        "Hash Atual": block.hash,
+        "Hash Anterior": block.previous_hash,
+        "Nonce": block.nonce
+    }
+
+
+class ChainTable:
+    def __init__(self, store, page_size=PAGE_SIZE):
+        self.store = store
+        self.page_size = page_size
+        self._pages = {}
+        self._length = 0
+
+    def page_count(self):
+        return max(1, -(-len(self.store) // self.page_size))
+
+    def sync(self):
+        # Blocos novos só afetam a página que era a última e as seguintes
+        length = len(self.store)
+        if length != self._length:
+            first_dirty = min(length, self._length) // self.page_size
+            for page in [p for p in self._pages if p >= first_dirty]:
+                del self._pages[page]
+            self._length = length
+
+    def invalidate(self, index):
+        # Um bloco histórico mudou: descarta a página dele
+        self._pages.pop(index // self.page_size, None)
+
+    def page(self, page):
+        self.sync()
+        if page not in self._pages:
+            start = page * self.page_size
+            rows = [block_row(block) for block in self.store[start:start + self.page_size]]
+            self._pages[page] = pd.DataFrame(rows, columns=COLUMNS)
+        return self._pages[page]
+
+
+# -----------------------------------------------------------------------------
+# GRAFO DA CADEIA (JANELA DESLIZANTE + RESUMO DO HISTÓRICO)
+# -----------------------------------------------------------------------------
+# Só os últimos `window` blocos viram nós individuais; o histórico anterior é
+# resumido em poucos nós de intervalo dentro de um cluster. O custo de layout
+# fica constante, e o DOT gerado é reaproveitado enquanto a ponta da cadeia
+# (hash do último bloco) e a revisão do store (adulterações) não mudarem.
+
+DEFAULT_WINDOW = 10
+HISTORY_SEGMENTS = 3
+_GRAPH_CACHE_SIZE = 256
+graph_cache = LRUCache("Grafo da cadeia", max_entries=_GRAPH_CACHE_SIZE)
+
+
+def _history_ranges(end, segments=HISTORY_SEGMENTS):
+    # Divide [1, end) em até `segments` intervalos contíguos (o gênese fica à parte)
+    count = end - 1
+    if count <= 0:
+        return []
+    segments = min(segments, count)
+    bounds = [1 + count * k // segments for k in range(segments + 1)]
+    return [(bounds[k], bounds[k + 1] - 1) for k in range(segments)]
+
+
+def build_chain_graph(store, window=DEFAULT_WINDOW):
+    chain_graph = graphviz.Digraph()
+    chain_graph.attr(rankdir='LR')
+    length = len(store)
+    first_visible = max(0, length - window)
+
+    genesis = store[0]
+    label = f"Bloco #{genesis.index}\nNonce: {genesis.nonce}\nDados: {genesis.data[:15]}..."
+    chain_graph.node('0', label, shape='box', style='filled', fillcolor='#fff9c4')
+    previous = '0'
+
+    ranges = _history_ranges(first_visible)
+    if ranges:
+        with chain_graph.subgraph(name='cluster_history') as history:
+            history.attr(label=f'Histórico resumido ({first_visible - 1:,} blocos)', style='dashed', color='gray')
+            for start, stop in ranges:
+                node_id = f'r{start}_{stop}'
+                history.node(node_id, f"Blocos #{start}–#{stop}\n({stop - start + 1:,} blocos)",
+                             shape='folder', style='filled', fillcolor='#eceff1')
+                chain_graph.edge(previous, node_id, style='dashed')
+                previous = node_id
+
+    for block in store[max(1, first_visible):]:
+        label = f"Bloco #{block.index}\nNonce: {block.nonce}\nDados: {block.data[:15]}..."
+        chain_graph.node(str(block.index), label, shape='box', style='filled', fillcolor='#e1f5fe')
+        chain_graph.edge(previous, str(block.index), label=f"Hash Prev:\n{block.previous_hash[:6]}...")
+        previous = str(block.index)
+    return chain_graph
+
+
+def chain_graph_source(store, window=DEFAULT_WINDOW):
+    # DOT em cache por (hash da ponta, tamanho, janela, revisão), com descarte LRU
+    key = (store[-1].hash, len(store), window, getattr(store, 'revision', 0))
+    return graph_cache.get_or_compute(key, lambda: build_chain_graph(store, window).source)
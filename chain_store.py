@@ -0,0 +1,344 @@
+import itertools
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+
+from blockchain import Block
+
+# -----------------------------------------------------------------------------
+# ARMAZENAMENTO COMPACTO DA CADEIA
+# -----------------------------------------------------------------------------
+# Em vez de uma lista de objetos Block por sessão, a cadeia fica em buffers
+# contíguos: hashes como digests binários de 32 bytes, timestamps como int64
+# (microssegundos desde a época) e nonces num array de inteiros. Os dados das
+# transações ficam num único blob UTF-8 com offsets. Cada acesso devolve um
+# Block montado na hora, com a mesma interface lida pelo explorador e pelo
+# grafo da página do Sandbox.
+
+DIGEST_SIZE = 32
+# Revisão de conteúdo: 0 = cadeia só com blocos anexados (mesma ponta, mesmo
+# conteúdo); cada adulteração recebe um número novo, único no processo, para
+# que caches indexados pela ponta não sirvam uma versão antiga
+_revisions = itertools.count(1)
+# Bytes mortos no blob de dados (versões substituídas) que disparam a
+# compactação, quando também passam da metade do blob
+_COMPACT_MIN_DEAD = 64 * 1024
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def timestamp_to_int(timestamp):
+    # Aritmética com datetime "naive": ida e volta exata, str() idêntico
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def int_to_timestamp(value):
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _is_digest_hex(value):
+    return isinstance(value, str) and len(value) == 2 * DIGEST_SIZE and \
+        all(c in '0123456789abcdef' for c in value)
+
+
+class ChainStore:
+    def __init__(self, blocks=(), base_index=0):
+        # base_index > 0 só em segmentos (ver segment), cujo primeiro bloco
+        # não é o gênese
+        self.base_index = base_index
+        self.revision = 0
+        self._timestamps = array('q')
+        self._nonces = array('Q')
+        self._hashes = bytearray()
+        self._prev_hashes = bytearray()
+        # previous_hash fora do formato de digest (ex.: "0" do bloco gênese)
+        self._text_prev = {}
+        self._data = bytearray()
+        self._data_start = array('Q')
+        self._data_len = array('Q')
+        # Bytes do blob que nenhum bloco referencia mais
+        self._dead = 0
+        for block in blocks:
+            self.append(block)
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._block(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._block(j) for j in range(*i.indices(len(self)))]
+        return self._block(self._normalize(i))
+
+    def __setitem__(self, i, block):
+        # Substitui um bloco histórico (ex.: adulteração no Laboratório de Ataques)
+        i = self._normalize(i)
+        self._write(i, block)
+        self.revision = next(_revisions)
+
+    def append(self, block):
+        expected = self.base_index + len(self)
+        if block.index != expected:
+            raise ValueError(f"Bloco #{block.index} fora de ordem (esperado #{expected})")
+        self._timestamps.append(0)
+        self._nonces.append(0)
+        self._hashes.extend(bytes(DIGEST_SIZE))
+        self._prev_hashes.extend(bytes(DIGEST_SIZE))
+        self._data_start.append(0)
+        self._data_len.append(0)
+        self._write(len(self) - 1, block)
+
+    def _normalize(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice de bloco fora da cadeia")
+        return i
+
+    def _write(self, i, block):
+        span = slice(i * DIGEST_SIZE, (i + 1) * DIGEST_SIZE)
+        self._timestamps[i] = timestamp_to_int(block.timestamp)
+        self._nonces[i] = block.nonce
+        self._hashes[span] = bytes.fromhex(block.hash)
+        if _is_digest_hex(block.previous_hash):
+            self._prev_hashes[span] = bytes.fromhex(block.previous_hash)
+            self._text_prev.pop(i, None)
+        else:
+            self._prev_hashes[span] = bytes(DIGEST_SIZE)
+            self._text_prev[i] = str(block.previous_hash)
+        # Dados que cabem no espaço da versão anterior são gravados no lugar;
+        # os maiores vão para o fim do blob e a versão antiga vira espaço morto
+        encoded = str(block.data).encode('utf-8')
+        old_len = self._data_len[i]
+        if len(encoded) <= old_len:
+            start = self._data_start[i]
+            self._data[start:start + len(encoded)] = encoded
+            self._dead += old_len - len(encoded)
+        else:
+            self._dead += old_len
+            self._data_start[i] = len(self._data)
+            self._data.extend(encoded)
+        self._data_len[i] = len(encoded)
+        if self._dead >= _COMPACT_MIN_DEAD and 2 * self._dead > len(self._data):
+            self.compact()
+
+    def compact(self):
+        # Regrava o blob só com os dados vivos, na ordem dos blocos
+        data = bytearray()
+        for i, (start, length) in enumerate(zip(self._data_start, self._data_len)):
+            self._data_start[i] = len(data)
+            data += self._data[start:start + length]
+        self._data = data
+        self._dead = 0
+
+    def _block(self, i):
+        span = slice(i * DIGEST_SIZE, (i + 1) * DIGEST_SIZE)
+        if i in self._text_prev:
+            previous_hash = self._text_prev[i]
+        else:
+            previous_hash = self._prev_hashes[span].hex()
+        start = self._data_start[i]
+        data = self._data[start:start + self._data_len[i]].decode('utf-8')
+        return Block.restore(self.base_index + i, int_to_timestamp(self._timestamps[i]), data,
+                             previous_hash, self._nonces[i], self._hashes[span].hex())
+
+    def segment(self, start, stop):
+        # Cópia compacta dos blocos [start, stop), com os índices originais.
+        # É o que vai para os workers da verificação paralela: só buffers,
+        # barato de serializar.
+        segment = ChainStore(base_index=self.base_index + start)
+        span = slice(start * DIGEST_SIZE, stop * DIGEST_SIZE)
+        segment._timestamps = self._timestamps[start:stop]
+        segment._nonces = self._nonces[start:stop]
+        segment._hashes = self._hashes[span]
+        segment._prev_hashes = self._prev_hashes[span]
+        segment._text_prev = {i - start: text for i, text in self._text_prev.items() if start <= i < stop}
+        if stop > start:
+            data_start = self._data_start[start:stop]
+            first = min(data_start)
+            last = max(s + n for s, n in zip(data_start, self._data_len[start:stop]))
+            segment._data = self._data[first:last]
+            segment._data_start = array('Q', (s - first for s in data_start))
+            segment._data_len = self._data_len[start:stop]
+            segment._dead = len(segment._data) - sum(segment._data_len)
+            if segment._dead:
+                # Não serializa para os workers versões antigas dos dados
+                segment.compact()
+        return segment
+
+    def nbytes(self):
+        # Memória ocupada pelos buffers da cadeia (sem o overhead fixo do objeto)
+        return (sys.getsizeof(self._timestamps) + sys.getsizeof(self._nonces) +
+                sys.getsizeof(self._hashes) + sys.getsizeof(self._prev_hashes) +
+                sys.getsizeof(self._data) + sys.getsizeof(self._data_start) +
+                sys.getsizeof(self._data_len) + sys.getsizeof(self._text_prev))
+
+
+# -----------------------------------------------------------------------------
+# ARMAZENAMENTO EM DISCO (REGISTROS FIXOS + MMAP)
+# -----------------------------------------------------------------------------
+# Formato: um arquivo de registros de tamanho fixo (<nome>.chain) e um arquivo
+# lateral com os dados de tamanho variável (<nome>.chain.data). Abrir uma
+# cadeia salva só mapeia os arquivos em memória (mmap); cada bloco é
+# decodificado quando é lido. Os arquivos nunca são alterados depois de
+# salvos: blocos minerados ou adulterados após a abertura ficam em memória
+# (ChainStore de cauda + edições) até a cadeia ser salva de novo.
+
+CHAIN_MAGIC = b'TKCHAIN1'
+# magic, versão, tamanho do registro, bloco verificado até (-1 = nenhum),
+# identificador da gravação, tamanho do arquivo de dados
+_HEADER = struct.Struct('<8sIIqQQ')
+# O arquivo de dados começa com o mesmo identificador da gravação: os dois
+# arquivos são trocados por renomeações separadas, e um leitor que pegar um
+# par de gravações diferentes percebe em vez de ler offsets errados
+_DATA_HEADER = struct.Struct('<Q')
+# timestamp, nonce, hash, previous_hash, offset dos dados, tamanho dos dados,
+# tamanho do previous_hash textual (gravado logo após os dados), reservado
+_RECORD = struct.Struct('<qQ32s32sQIHH')
+CHAIN_VERSION = 2
+# Tentativas de abrir um par consistente enquanto outra gravação é renomeada
+_OPEN_ATTEMPTS = 3
+
+
+def save_chain(store, path, verified_upto=-1):
+    # Grava em arquivos temporários próprios desta gravação e renomeia:
+    # leitores de um arquivo antigo com o mesmo nome continuam com o
+    # mapeamento íntegro, e duas gravações simultâneas não se misturam
+    save_id = int.from_bytes(os.urandom(8), 'little')
+    tmp_path = f'{path}.{save_id:016x}.tmp'
+    offset = _DATA_HEADER.size
+    with open(tmp_path, 'wb') as records, open(tmp_path + '.data', 'wb') as side:
+        records.write(bytes(_HEADER.size))
+        side.write(_DATA_HEADER.pack(save_id))
+        for block in store:
+            data = str(block.data).encode('utf-8')
+            if _is_digest_hex(block.previous_hash):
+                prev_digest, prev_text = bytes.fromhex(block.previous_hash), b''
+            else:
+                prev_digest, prev_text = bytes(DIGEST_SIZE), str(block.previous_hash).encode('utf-8')
+            records.write(_RECORD.pack(timestamp_to_int(block.timestamp), block.nonce,
+                                       bytes.fromhex(block.hash), prev_digest,
+                                       offset, len(data), len(prev_text), 0))
+            side.write(data + prev_text)
+            offset += len(data) + len(prev_text)
+        records.seek(0)
+        records.write(_HEADER.pack(CHAIN_MAGIC, CHAIN_VERSION, _RECORD.size, verified_upto, save_id, offset))
+    # Um leitor entre as duas renomeações vê identificadores diferentes e tenta de novo
+    os.replace(tmp_path, path)
+    os.replace(tmp_path + '.data', path + '.data')
+
+
+def _map(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _close_map(mapped):
+    if isinstance(mapped, mmap.mmap):
+        mapped.close()
+
+
+def _open_pair(path):
+    # Mapeia registros + dados e confere que são da mesma gravação
+    for attempt in range(_OPEN_ATTEMPTS):
+        records, data = _map(path), _map(path + '.data')
+        if len(records) < _HEADER.size:
+            raise ValueError(f"{path} está vazio ou truncado")
+        magic, version, record_size, verified_upto, save_id, data_size = _HEADER.unpack_from(records, 0)
+        if magic != CHAIN_MAGIC or version != CHAIN_VERSION or record_size != _RECORD.size:
+            raise ValueError(f"{path} não é um arquivo de cadeia válido")
+        if (len(records) - _HEADER.size) % _RECORD.size:
+            raise ValueError(f"{path} está truncado")
+        if len(data) == data_size >= _DATA_HEADER.size and _DATA_HEADER.unpack_from(data, 0)[0] == save_id:
+            return records, data, verified_upto
+        _close_map(records)
+        _close_map(data)
+        time.sleep(0.05)
+    raise ValueError(f"{path}.data não corresponde aos registros (truncado ou de outra gravação)")
+
+
+class MappedChainStore:
+    def __init__(self, path):
+        self.path = path
+        self._records, self._data, verified_upto = _open_pair(path)
+        self.verified_upto = verified_upto
+        self._mapped_len = (len(self._records) - _HEADER.size) // _RECORD.size
+        self._tail = ChainStore(base_index=self._mapped_len)
+        self._edits = {}
+        # O arquivo pode conter blocos adulterados: nunca compartilha revisão
+        self.revision = next(_revisions)
+
+    def __len__(self):
+        return self._mapped_len + len(self._tail)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._block(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._block(j) for j in range(*i.indices(len(self)))]
+        return self._block(self._normalize(i))
+
+    def __setitem__(self, i, block):
+        i = self._normalize(i)
+        if i >= self._mapped_len:
+            self._tail[i - self._mapped_len] = block
+        else:
+            self._edits[i] = _copy_block(block)
+            self.verified_upto = min(self.verified_upto, i - 1)
+        self.revision = next(_revisions)
+
+    def append(self, block):
+        self._tail.append(block)
+
+    def _normalize(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice de bloco fora da cadeia")
+        return i
+
+    def _block(self, i):
+        if i >= self._mapped_len:
+            return self._tail[i - self._mapped_len]
+        if i in self._edits:
+            return _copy_block(self._edits[i])
+        timestamp, nonce, block_hash, prev_digest, offset, data_len, prev_len, _ = \
+            _RECORD.unpack_from(self._records, _HEADER.size + i * _RECORD.size)
+        data = bytes(self._data[offset:offset + data_len]).decode('utf-8')
+        if prev_len:
+            previous_hash = bytes(self._data[offset + data_len:offset + data_len + prev_len]).decode('utf-8')
+        else:
+            previous_hash = prev_digest.hex()
+        return Block.restore(i, int_to_timestamp(timestamp), data, previous_hash, nonce, block_hash.hex())
+
+    def segment(self, start, stop):
+        return ChainStore((self._block(i) for i in range(start, stop)), base_index=start)
+
+    def nbytes(self):
+        # Só o que está no heap Python; os registros mapeados ficam no page cache
+        return sys.getsizeof(self) + self._tail.nbytes() + sum(sys.getsizeof(b.data) + 200 for b in self._edits.values())
+
+    def disk_bytes(self):
+        return len(self._records) + len(self._data)
+
+    def close(self):
+        _close_map(self._records)
+        _close_map(self._data)
+
+
+def _copy_block(block):
+    return Block.restore(block.index, block.timestamp, block.data, block.previous_hash,
+                         block.nonce, block.hash)
@@ -0,0 +1,134 @@
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# -----------------------------------------------------------------------------
+# VALIDAÇÃO DA CADEIA (INCREMENTAL, COM MARCA D'ÁGUA)
+# -----------------------------------------------------------------------------
+# O validador recalcula o hash de cada bloco e confere o elo previous_hash com
+# o bloco anterior. Ele guarda até qual índice a cadeia já foi verificada
+# (verified_upto): anexar um bloco custa uma única checagem, e só uma
+# adulteração em um bloco histórico faz a verificação recomeçar daquele ponto.
+
+HASH_MISMATCH = "hash"
+BROKEN_LINK = "link"
+
+REASONS = {
+    HASH_MISMATCH: "Hash armazenado não confere com o conteúdo do bloco",
+    BROKEN_LINK: "'Hash Anterior' não aponta para o hash do bloco anterior",
+}
+
+
+def check_block(block, previous_hash):
+    # Devolve o motivo da falha ou None. previous_hash=None dispensa o elo (gênese)
+    if block.calculate_hash() != block.hash:
+        return HASH_MISMATCH
+    if previous_hash is not None and block.previous_hash != previous_hash:
+        return BROKEN_LINK
+    return None
+
+
+class ChainValidator:
+    def __init__(self, store, verified_upto=-1):
+        # verified_upto > -1 aproveita a marca d'água gravada junto com uma
+        # cadeia salva em disco, sem revarrer os blocos já conferidos
+        self.store = store
+        self.verified_upto = verified_upto
+        self.first_invalid = None
+        self.reason = None
+        self.checks = 0
+
+    def invalidate(self, index):
+        # Um bloco histórico mudou: a verificação recomeça a partir dele
+        self.verified_upto = min(self.verified_upto, index - 1)
+        self.first_invalid = None
+        self.reason = None
+
+    def validate(self):
+        # Devolve o índice do primeiro bloco inválido, ou None se a cadeia é íntegra
+        if self.first_invalid is not None:
+            return self.first_invalid
+        start = self.verified_upto + 1
+        previous_hash = self.store[start - 1].hash if start > 0 else None
+        for i in range(start, len(self.store)):
+            block = self.store[i]
+            self.checks += 1
+            reason = check_block(block, previous_hash)
+            if reason is not None:
+                self.first_invalid = block.index
+                self.reason = reason
+                return self.first_invalid
+            previous_hash = block.hash
+            self.verified_upto = block.index
+        return None
+
+    def invalid_suffix(self):
+        # Blocos comprometidos: do primeiro inválido até a ponta da cadeia
+        first = self.validate()
+        if first is None:
+            return range(0)
+        return range(first, len(self.store))
+
+
+def validate_full(store):
+    # Varredura completa, sem marca d'água (referência para o benchmark)
+    previous_hash = None
+    for block in store:
+        if check_block(block, previous_hash) is not None:
+            return block.index
+        previous_hash = block.hash
+    return None
+
+
+# -----------------------------------------------------------------------------
+# VERIFICAÇÃO COMPLETA EM PARALELO (POOL DE PROCESSOS)
+# -----------------------------------------------------------------------------
+# Tomando os previous_hash armazenados como entrada, cada bloco pode ser
+# conferido de forma independente: a cadeia é cortada em segmentos, cada worker
+# recalcula hashes e elos do seu segmento (o elo da borda usa o hash
+# armazenado do bloco anterior ao segmento) e os resultados são juntados.
+
+_verify_pool = None
+_verify_workers = 0
+
+
+def _verify_segment(segment, boundary_hash):
+    invalid = []
+    previous_hash = boundary_hash
+    for block in segment:
+        if check_block(block, previous_hash) is not None:
+            invalid.append(block.index)
+        previous_hash = block.hash
+    return invalid
+
+
+def _get_verify_pool(workers):
+    global _verify_pool, _verify_workers
+    if _verify_pool is None or _verify_workers != workers:
+        if _verify_pool is not None:
+            _verify_pool.shutdown(cancel_futures=True)
+        _verify_pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('spawn'))
+        _verify_workers = workers
+    return _verify_pool
+
+
+def verify_parallel(store, workers=None, chunks_per_worker=4, limit=None):
+    # Índices de todos os blocos inválidos, em ordem (os `limit` primeiros se
+    # informado). Com um único worker a verificação roda no próprio processo.
+    workers = workers or os.cpu_count() or 1
+    length = len(store)
+    chunk = max(1, -(-length // (workers * chunks_per_worker)))
+    jobs = [(start, min(start + chunk, length)) for start in range(0, length, chunk)]
+
+    def boundary(start):
+        return store[start - 1].hash if start > 0 else None
+
+    if workers < 2 or len(jobs) < 2:
+        results = [_verify_segment(store.segment(a, b), boundary(a)) for a, b in jobs]
+    else:
+        pool = _get_verify_pool(workers)
+        futures = [pool.submit(_verify_segment, store.segment(a, b), boundary(a)) for a, b in jobs]
+        results = [future.result() for future in futures]
+
+    invalid = [index for result in results for index in result]
+    return invalid[:limit] if limit is not None else invalid
@@ -0,0 +1,136 @@
+import hashlib
+import os
+
+import graphviz
+import streamlit as st
+
+from cache import LRUCache
+
+# -----------------------------------------------------------------------------
+# DIAGRAMAS ESTÁTICOS PRÉ-RENDERIZADOS (MAPA DA JORNADA E FLUXO DE TOKENIZAÇÃO)
+# -----------------------------------------------------------------------------
+# Os diagramas fixos das páginas Início e Fundamentos não mudam entre visitas.
+# Cada um é convertido para SVG uma única vez, com a chave = hash do código
+# DOT, e o SVG fica num cache do processo compartilhado por todas as sessões:
+# trocar de página não refaz layout nenhum. A ordem de busca é memória ->
+# static/diagrams/<hash>.svg (etapa de build `python diagrams.py`) ->
+# static/cache/diagrams/<hash>.svg -> binário `dot` local. O SVG feito pelo
+# `dot` em tempo de execução vai para static/cache/ (fora do git, como o
+# payload da animação), então só o primeiro processo após um deploy paga o
+# layout. O `dot` vem do pacote `graphviz` de packages.txt (instalado no build
+# do Streamlit Community Cloud). Sem SVG disponível, o DOT vai para
+# st.graphviz_chart e o layout é feito no navegador, como antes.
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIAGRAM_DIR = os.path.join(STATIC_DIR, 'diagrams')
+RENDER_DIR = os.path.join(STATIC_DIR, 'cache', 'diagrams')
+
+diagram_cache = LRUCache("Diagramas estáticos", max_entries=16)
+
+
+def journey_map():
+    journey = graphviz.Digraph()
+    journey.attr(rankdir='LR', size='10')
+    journey.attr('node', shape='rectangle', style='filled', color='lightblue')
+
+    journey.edge('Fundamentos', 'Mecânica\nTokenização')
+    journey.edge('Mecânica\nTokenização', 'Sandbox\nBlockchain')
+    journey.edge('Sandbox\nBlockchain', 'Ciclo de Vida')
+    journey.edge('Ciclo de Vida', 'Matriz de Risco')
+    journey.edge('Matriz de Risco', 'Casos Reais')
+    journey.edge('Casos Reais', 'Smart Contracts')
+    journey.edge('Smart Contracts', 'Animação interativa')
+    journey.edge('Animação interativa', 'Quiz Final')
+    return journey.source
+
+
+def tokenization_flow():
+    flow = graphviz.Digraph()
+    flow.attr(rankdir='LR')
+    flow.node('A', 'Ativo Real\n(Imóvel, Recebível)', shape='box', style='filled', fillcolor='#ffcccc')
+    flow.node('B', 'SPV / Veículo Legal\n(Auditoria & Custódia)', shape='box')
+    flow.node('C', 'Emissão do Smart Contract\n(Minting)', shape='box', style='filled', fillcolor='#ccffcc')
+    flow.node('D', 'Distribuição\n(Carteira do Investidor)', shape='ellipse')
+
+    flow.edge('A', 'B', label='Formalização')
+    flow.edge('B', 'C', label='Oraculização')
+    flow.edge('C', 'D', label='Venda Primária')
+    return flow.source
+
+
+# Código DOT montado uma vez, na importação
+JOURNEY_MAP = journey_map()
+TOKENIZATION_FLOW = tokenization_flow()
+STATIC_DIAGRAMS = [JOURNEY_MAP, TOKENIZATION_FLOW]
+
+
+def diagram_key(source):
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+
+def _svg_path(key, directory=DIAGRAM_DIR):
+    return os.path.join(directory, f'{key}.svg')
+
+
+def render_svg(source):
+    # Layout com o binário `dot` (None se o Graphviz do sistema não existe)
+    try:
+        return graphviz.Source(source).pipe(format='svg', encoding='utf-8')
+    except (graphviz.ExecutableNotFound, graphviz.CalledProcessError):
+        return None
+
+
+def _write_svg(path, svg):
+    # Arquivo temporário + os.replace: outro processo nunca lê um SVG pela metade
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(svg)
+    os.replace(tmp_path, path)
+
+
+def _load_svg(source):
+    key = diagram_key(source)
+    for path in (_svg_path(key), _svg_path(key, RENDER_DIR)):
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+    svg = render_svg(source)
+    if svg is not None:
+        try:
+            _write_svg(_svg_path(key, RENDER_DIR), svg)
+        except OSError:
+            # Pasta somente leitura: o SVG continua no cache do processo
+            pass
+    return svg
+
+
+def diagram_svg(source):
+    # Cacheia também a ausência de SVG: sem `dot`, não tenta de novo a cada visita
+    return diagram_cache.get_or_compute(diagram_key(source), lambda: _load_svg(source))
+
+
+def static_diagram(source):
+    svg = diagram_svg(source)
+    if svg is None:
+        st.graphviz_chart(source)
+    else:
+        st.image(svg)
+
+
+def prerender(sources=STATIC_DIAGRAMS):
+    # Etapa de build: grava um SVG por diagrama, nomeado pelo hash do DOT
+    outputs = {}
+    for source in sources:
+        svg = render_svg(source)
+        if svg is None:
+            raise RuntimeError("binário 'dot' do Graphviz não encontrado no PATH")
+        path = _svg_path(diagram_key(source))
+        _write_svg(path, svg)
+        outputs[path] = len(svg.encode('utf-8'))
+    return outputs
+
+
+if __name__ == "__main__":
+    for path, size in prerender().items():
+        print(f"{os.path.relpath(path)}: {size:,} bytes")
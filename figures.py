@@ -0,0 +1,48 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+from cache import LRUCache
+
+# -----------------------------------------------------------------------------
+# CACHE DE FIGURAS PLOTLY COMPARTILHADO PELO PROCESSO
+# -----------------------------------------------------------------------------
+# Montar uma figura com px.* custa dezenas de ms (validação de cada trace).
+# Aqui cada figura é montada uma vez por conteúdo: a chave é o nome do gráfico
+# + o hash dos dados de entrada (DataFrames, arrays e parâmetros como título),
+# e o valor é o JSON serializado. Uma turma inteira com os mesmos controles
+# reaproveita a mesma figura; o LRU tem teto de entradas e de memória.
+
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Tamanho aproximado de cada figura = comprimento do JSON
+figure_cache = LRUCache("Figuras Plotly", max_entries=1024, max_bytes=FIGURE_CACHE_BYTES, sizeof=len)
+
+
+def data_hash(*inputs):
+    digest = hashlib.sha256()
+    for value in inputs:
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        elif isinstance(value, pd.Series):
+            digest.update(repr(value.name).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        elif isinstance(value, np.ndarray):
+            digest.update(f'{value.dtype}{value.shape}'.encode('utf-8'))
+            digest.update(np.ascontiguousarray(value).tobytes())
+        else:
+            digest.update(repr(value).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def figure_json(name, build, *inputs):
+    # build() só roda na falha; inputs precisa cobrir tudo o que a figura usa
+    return figure_cache.get_or_compute((name, data_hash(*inputs)), lambda: build().to_json())
+
+
+def cached_figure(name, build, *inputs):
+    return pio.from_json(figure_json(name, build, *inputs))
@@ -0,0 +1,255 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cache import LRUCache
+
+# -----------------------------------------------------------------------------
+# ÍNDICE DE WHITELIST/KYC EM MASSA (DIGESTS ORDENADOS + FILTRO DE BLOOM)
+# -----------------------------------------------------------------------------
+# Milhões de endereços aprovados não cabem bem num set de strings (~150 bytes
+# por endereço). Aqui cada endereço vira o seu digest binário de 20 bytes,
+# num único array numpy ordenado: a busca é binária (searchsorted) e um lote
+# inteiro de destinatários é conferido de uma vez. Na frente fica um filtro
+# de Bloom (~10 bits por endereço) que descarta quase todos os não aprovados
+# sem tocar no array ordenado. O filtro só compensa quando a maior parte do
+# lote é desconhecida (triagem de endereços novos): com muitos aprovados,
+# quase todo endereço passa pelo Bloom e ainda vai para a busca binária. O
+# modo automático acompanha a fração de aprovados dos lotes anteriores e
+# escolhe o caminho.
+
+ADDRESS_SIZE = 20
+DIGEST_DTYPE = f'S{ADDRESS_SIZE}'
+BLOOM_BITS_PER_KEY = 10
+BLOOM_HASHES = 7
+# Acima desta fração de positivos no Bloom, a busca binária direta é mais rápida
+BLOOM_MAX_HIT_RATE = 0.25
+CSV_CHUNK = 1000000
+
+# CSVs enviados pela página 7, já convertidos em digests (chave = id do upload)
+upload_cache = LRUCache("Bases KYC enviadas", max_entries=4)
+
+_MIX1 = np.uint64(0xbf58476d1ce4e5b9)
+_MIX2 = np.uint64(0x94d049bb133111eb)
+
+
+def addresses_to_digests(addresses):
+    # '0x' + 40 hex (prefixo opcional) -> array S20, com uma única conversão
+    # hex para o lote todo. Cada endereço é conferido antes: só o tamanho total
+    # não basta, um endereço curto e um longo se compensariam e o lote seria
+    # recortado em digests errados.
+    width = 2 * ADDRESS_SIZE
+    lengths = np.fromiter(map(len, addresses), dtype=np.int64, count=len(addresses))
+    joined = ''.join(addresses)
+    if (lengths == width + 2).all() and not joined[0::width + 2].strip('0') and not joined[1::width + 2].strip('xX'):
+        # Caso comum (todos com prefixo): 'x' não é dígito hex, então o
+        # replace só remove os prefixos já conferidos
+        hex_digits = joined.replace('0x', '').replace('0X', '')
+    elif (lengths == width).all():
+        hex_digits = joined
+    else:
+        for address in addresses:
+            digits = address[2:] if address[:2] in ('0x', '0X') else address
+            if len(digits) != width:
+                raise ValueError(f"Endereço inválido {address!r}: esperado 0x seguido de 40 dígitos hexadecimais")
+        hex_digits = ''.join(address[2:] if address[:2] in ('0x', '0X') else address for address in addresses)
+    raw = bytes.fromhex(hex_digits)
+    # fromhex ignora espaços: um endereço com espaço sai com menos bytes
+    if len(raw) != ADDRESS_SIZE * len(addresses):
+        raise ValueError("Endereço inválido: esperado 0x seguido de 40 dígitos hexadecimais")
+    return np.frombuffer(raw, dtype=DIGEST_DTYPE)
+
+
+def digests_to_addresses(digests):
+    raw = digests.tobytes()
+    return ['0x' + raw[i:i + ADDRESS_SIZE].hex() for i in range(0, len(raw), ADDRESS_SIZE)]
+
+
+def _mix(x):
+    # Finalizador do splitmix64: endereços fora do padrão (ex.: sequenciais)
+    # também se espalham bem pelo filtro
+    x = x ^ (x >> np.uint64(30))
+    x = x * _MIX1
+    x = x ^ (x >> np.uint64(27))
+    x = x * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+def _bloom_hashes(digests):
+    # Dois hashes de 64 bits por endereço (hashing duplo: h1 + i*h2)
+    raw = np.frombuffer(digests.tobytes(), dtype=np.uint8).reshape(-1, ADDRESS_SIZE)
+    head = raw[:, :16].copy().view('<u8')
+    tail = np.zeros((len(raw), 8), dtype=np.uint8)
+    tail[:, :4] = raw[:, 16:]
+    tail = tail.view('<u8')[:, 0]
+    h1 = _mix(head[:, 0] ^ _mix(tail))
+    h2 = _mix(head[:, 1] ^ tail) | np.uint64(1)
+    return h1, h2
+
+
+class BloomFilter:
+    def __init__(self, n_keys, bits_per_key=BLOOM_BITS_PER_KEY, n_hashes=BLOOM_HASHES):
+        self.n_bits = max(64, n_keys * bits_per_key)
+        self.n_hashes = n_hashes
+        self.bits = np.zeros(-(-self.n_bits // 8), dtype=np.uint8)
+
+    def _positions(self, digests):
+        h1, h2 = _bloom_hashes(digests)
+        steps = np.arange(self.n_hashes, dtype=np.uint64)
+        return (h1[:, None] + steps * h2[:, None]) % np.uint64(self.n_bits)
+
+    def add(self, digests):
+        positions = self._positions(digests).ravel()
+        masks = np.left_shift(1, positions & np.uint64(7)).astype(np.uint8)
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3), masks)
+
+    def might_contain(self, digests):
+        positions = self._positions(digests)
+        bits = (self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def nbytes(self):
+        return self.bits.nbytes
+
+
+class WhitelistIndex:
+    def __init__(self, digests=()):
+        # Ordena e remove duplicatas (np.sort em S20 é bem mais rápido que np.unique)
+        digests = np.sort(np.asarray(digests, dtype=DIGEST_DTYPE))
+        if len(digests):
+            keep = np.ones(len(digests), dtype=bool)
+            keep[1:] = digests[1:] != digests[:-1]
+            digests = digests[keep]
+        self.digests = digests
+        self.bloom = BloomFilter(len(self.digests))
+        if len(self.digests):
+            self.bloom.add(self.digests)
+        # Aprovações avulsas (addToWhitelist) depois da carga em massa, já como
+        # digests: valem nas consultas desde já e entram no array em compact()
+        self.pending = set()
+        # Fração de positivos do último lote (modo automático do Bloom)
+        self.hit_rate = 0.0
+
+    @classmethod
+    def from_addresses(cls, addresses):
+        return cls(addresses_to_digests(addresses))
+
+    def __len__(self):
+        return len(self.digests) + len(self.pending)
+
+    def add(self, address):
+        # Endereço malformado é recusado aqui (ValueError), não no compact()
+        self.pending.add(addresses_to_digests([address])[0])
+
+    def _pending_digests(self):
+        return np.array(sorted(self.pending), dtype=DIGEST_DTYPE)
+
+    def compact(self):
+        # Incorpora as aprovações avulsas ao array ordenado e refaz o filtro
+        if self.pending:
+            merged = WhitelistIndex(np.concatenate([self.digests, self._pending_digests()]))
+            self.digests, self.bloom, self.pending = merged.digests, merged.bloom, set()
+
+    def _sorted_contains(self, digests):
+        if not len(self.digests):
+            return np.zeros(len(digests), dtype=bool)
+        # Consultas ordenadas antes da busca: acessos ao array ficam em ordem
+        order = np.argsort(digests)
+        idx = np.searchsorted(self.digests, digests[order])
+        idx[idx == len(self.digests)] = 0
+        found = np.empty(len(digests), dtype=bool)
+        found[order] = self.digests[idx] == digests[order]
+        return found
+
+    def contains_digests(self, digests, use_bloom=None):
+        # Conferência vetorizada. Com Bloom: filtro primeiro, busca binária só
+        # nos positivos. use_bloom=None escolhe pelo lote anterior.
+        if use_bloom is None:
+            use_bloom = self.hit_rate <= BLOOM_MAX_HIT_RATE
+        if not use_bloom:
+            found = self._sorted_contains(digests)
+            self.hit_rate = float(found.mean()) if len(found) else self.hit_rate
+        else:
+            found = self.bloom.might_contain(digests)
+            candidates = np.flatnonzero(found)
+            self.hit_rate = len(candidates) / len(found) if len(found) else self.hit_rate
+            found[candidates] = self._sorted_contains(digests[candidates])
+        if self.pending:
+            found |= np.isin(digests, self._pending_digests())
+        return found
+
+    def contains_batch(self, addresses, use_bloom=None):
+        return self.contains_digests(addresses_to_digests(addresses), use_bloom)
+
+    def __contains__(self, address):
+        return bool(self.contains_batch([address])[0])
+
+    def nbytes(self):
+        return self.digests.nbytes + self.bloom.nbytes() + sys.getsizeof(self.pending)
+
+    def bytes_per_address(self):
+        return self.nbytes() / max(1, len(self))
+
+
+def set_bytes_per_address(addresses, sample=10000):
+    # Estimativa do custo do mesmo conjunto num set de strings (referência)
+    sample = addresses[:sample]
+    if not sample:
+        return 0.0
+    strings = sum(sys.getsizeof(address) for address in sample) / len(sample)
+    return strings + sys.getsizeof(set(sample)) / len(sample)
+
+
+def load_digests_csv(source, column='address', chunksize=CSV_CHUNK):
+    # Carga em massa: lê o CSV em blocos e converte cada bloco para digests
+    chunks = []
+    for frame in pd.read_csv(source, usecols=[column], dtype={column: str}, chunksize=chunksize):
+        addresses = frame[column].dropna().str.strip().str.lower()
+        if not addresses.str.fullmatch(r'(0x)?[0-9a-f]{40}').all():
+            raise ValueError(f"coluna '{column}' com endereço fora do formato 0x + 40 dígitos hex")
+        addresses = addresses.tolist()
+        chunks.append(addresses_to_digests(addresses))
+    return np.concatenate(chunks) if chunks else np.empty(0, dtype=DIGEST_DTYPE)
+
+
+def load_whitelist_csv(source, column='address', chunksize=CSV_CHUNK):
+    # O índice é montado uma única vez, no final da leitura
+    return WhitelistIndex(load_digests_csv(source, column, chunksize))
+
+
+def save_whitelist_csv(digests, path, column='address'):
+    pd.DataFrame({column: digests_to_addresses(digests)}).to_csv(path, index=False)
+
+
+def random_digests(rng, n):
+    return np.frombuffer(rng.bytes(ADDRESS_SIZE * n), dtype=DIGEST_DTYPE)
+
+
+def lookup_queries(index, rng, n_queries, member_share):
+    # Mistura de endereços aprovados e desconhecidos, na proporção pedida
+    n_members = min(len(index.digests), int(n_queries * member_share))
+    members = index.digests[rng.integers(0, len(index.digests), n_members)] if n_members else index.digests[:0]
+    return np.concatenate([members, random_digests(rng, n_queries - n_members)]), n_members
+
+
+# Cargas de consulta: lote com metade aprovada (fluxo de transferências) e
+# triagem de endereços novos (quase todos desconhecidos), onde o Bloom ganha
+LOOKUP_MIXES = {'fluxo': 0.5, 'triagem': 0.05}
+
+
+def measure_lookups(index, rng, n_queries=200000, mixes=LOOKUP_MIXES):
+    # Consultas/s em lote por carga: só busca binária, Bloom + busca e o modo
+    # automático (que escolhe pelo lote anterior da mesma carga)
+    rates = {}
+    for mix, member_share in mixes.items():
+        queries, n_members = lookup_queries(index, rng, n_queries, member_share)
+        rates[mix] = {}
+        for label, use_bloom in (('sorted', False), ('bloom', True), ('auto', None)):
+            start = time.perf_counter()
+            index.contains_digests(queries, use_bloom)
+            rates[mix][label] = len(queries) / (time.perf_counter() - start)
+        if n_members < len(queries):
+            rates['false_positive'] = float(index.bloom.might_contain(queries[n_members:]).mean())
+    return rates
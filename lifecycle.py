@@ -0,0 +1,185 @@
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from cache import LRUCache, memoize
+from figures import figure_json
+from simulations import (bond_summary, percentile_bands, rental_summary, simulate_bond_defaults,
+                         simulate_rental_paths, simulation_rng)
+
+# -----------------------------------------------------------------------------
+# CENÁRIOS DO CICLO DE VIDA (PÁGINA 4) COM CACHE DE RESULTADOS
+# -----------------------------------------------------------------------------
+# Cada cenário devolve os DataFrames calculados. Os resultados ficam num LRU
+# do processo, com chave nos parâmetros do cenário e na semente da sessão: um
+# rerun com os mesmos parâmetros não recalcula nada. As figuras vêm do cache
+# de figuras (figures.py), com chave no hash dos dados de cada gráfico.
+
+RENTAL_BASE_VALUE = 100
+RENTAL_VOLATILITY = 0.02
+RENTAL_YIELD = 0.005  # 0.5% ao mês
+BOND_PAR_VALUE = 1000
+BOND_COUPON_RATE = 0.10  # 10% aa
+
+simulation_cache = LRUCache("Simulações do ciclo de vida", max_entries=64)
+
+
+@memoize(simulation_cache)
+def rental_single_path(years, seed):
+    # Um único caminho do mesmo motor vetorizado do Monte Carlo
+    rng = simulation_rng(seed, 'rental_single')
+    path_prices, path_dividends = simulate_rental_paths(rng, 1, years, RENTAL_BASE_VALUE,
+                                                        RENTAL_VOLATILITY, RENTAL_YIELD)
+    prices, dividends = path_prices[0], path_dividends[0]
+
+    df_lifecycle = pd.DataFrame({
+        'Mês': np.arange(1, (years * 12) + 1),
+        'Preço do Token (R$)': prices,
+        'Dividendos Pagos (R$)': dividends
+    })
+
+    total_dividends = dividends.sum()
+    capital_gain = prices[-1] - prices[0]
+    return {
+        'df_lifecycle': df_lifecycle,
+        'total_dividends': total_dividends,
+        'capital_gain': capital_gain,
+        'roi': ((total_dividends + capital_gain) / prices[0]) * 100,
+    }
+
+
+@memoize(simulation_cache)
+def rental_monte_carlo(years, n_paths, seed):
+    start = time.perf_counter()
+    rng = simulation_rng(seed, 'rental_monte_carlo')
+    prices, dividends = simulate_rental_paths(rng, n_paths, years, RENTAL_BASE_VALUE,
+                                              RENTAL_VOLATILITY, RENTAL_YIELD)
+    summary = rental_summary(prices, dividends)
+    bands = percentile_bands(prices)
+
+    roi_p5, roi_p50, roi_p95 = np.percentile(summary['ROI Total (%)'], [5, 50, 95])
+    return {
+        'summary': summary,
+        'bands': bands,
+        'roi_p5': roi_p5,
+        'roi_p50': roi_p50,
+        'roi_p95': roi_p95,
+        'prob_loss': (summary['ROI Total (%)'] < 0).mean(),
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+@memoize(simulation_cache)
+def bond_single(years, default_prob, seed):
+    rng = simulation_rng(seed, 'bond_single')
+    cash_flows = []
+    status = "Adimplente"
+
+    for y in range(1, years + 1):
+        if rng.random() < default_prob:
+            status = "Default (Calote)"
+            cash_flows.append(0)
+            break
+        else:
+            cash_flows.append(BOND_PAR_VALUE * BOND_COUPON_RATE)
+
+    # Se sobreviveu até o final, paga principal
+    if status == "Adimplente":
+        cash_flows[-1] += BOND_PAR_VALUE
+
+    df_bond = pd.DataFrame({
+        'Ano': range(1, len(cash_flows) + 1),
+        'Fluxo de Caixa': cash_flows
+    })
+    return {'status': status, 'df_bond': df_bond}
+
+
+@memoize(simulation_cache)
+def bond_portfolio(years, default_prob, n_bonds, seed):
+    start = time.perf_counter()
+    rng = simulation_rng(seed, 'bond_portfolio')
+    default_year, realized = simulate_bond_defaults(rng, n_bonds, years, default_prob,
+                                                    BOND_PAR_VALUE, BOND_COUPON_RATE)
+    df_survival, df_outcomes, stats = bond_summary(default_year, realized, years,
+                                                   BOND_PAR_VALUE, BOND_COUPON_RATE)
+    df_survival['Sobrevivência Teórica'] = (1 - default_prob) ** df_survival['Ano']
+
+    return {
+        'df_survival': df_survival,
+        'df_outcomes': df_outcomes,
+        'stats': stats,
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+# -----------------------------------------------------------------------------
+# FIGURAS DOS CENÁRIOS (JSON DO CACHE DE FIGURAS)
+# -----------------------------------------------------------------------------
+
+def rental_figures(rental):
+    df_lifecycle = rental['df_lifecycle']
+    return {
+        'lifecycle': figure_json('rental_lifecycle', lambda: px.line(
+            df_lifecycle, x='Mês', y=['Preço do Token (R$)', 'Dividendos Pagos (R$)'],
+            title="Valor do Token vs. Pagamento de Aluguéis"), df_lifecycle),
+    }
+
+
+def fan_chart(bands):
+    fan = go.Figure()
+    fan.add_trace(go.Scatter(x=bands.index, y=bands['P95'], line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fan.add_trace(go.Scatter(x=bands.index, y=bands['P5'], fill='tonexty', fillcolor='rgba(49,130,206,0.15)',
+                             line=dict(width=0), name='P5–P95'))
+    fan.add_trace(go.Scatter(x=bands.index, y=bands['P75'], line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fan.add_trace(go.Scatter(x=bands.index, y=bands['P25'], fill='tonexty', fillcolor='rgba(49,130,206,0.35)',
+                             line=dict(width=0), name='P25–P75'))
+    fan.add_trace(go.Scatter(x=bands.index, y=bands['P50'], line=dict(color='#1a365d'), name='Mediana'))
+    fan.update_layout(title="Fan Chart do Preço do Token (R$)", xaxis_title="Mês", yaxis_title="Preço do Token (R$)")
+    return fan
+
+
+def monte_carlo_figures(mc):
+    bands = mc['bands']
+    roi = mc['summary']['ROI Total (%)']
+    dividends = mc['summary']['Dividendos Totais (R$)']
+    return {
+        'fan': figure_json('rental_fan', lambda: fan_chart(bands), bands),
+        'roi': figure_json('rental_roi', lambda: px.histogram(
+            roi.to_frame(), x='ROI Total (%)', nbins=60, title="Distribuição do ROI Total"), roi),
+        'dividends': figure_json('rental_dividends', lambda: px.histogram(
+            dividends.to_frame(), x='Dividendos Totais (R$)', nbins=60,
+            title="Distribuição dos Dividendos Totais"), dividends),
+    }
+
+
+def bond_figures(bond):
+    df_bond = bond['df_bond']
+    return {
+        'cash_flows': figure_json('bond_cash_flows', lambda: px.bar(
+            df_bond, x='Ano', y='Fluxo de Caixa', title="Fluxos Recebidos pelo Investidor"), df_bond),
+    }
+
+
+def survival_chart(df_survival):
+    fig = px.line(df_survival, x='Ano', y=['Sobrevivência Simulada', 'Sobrevivência Teórica'],
+                  title="Curva de Sobrevivência", markers=True)
+    fig.update_yaxes(tickformat='.0%')
+    return fig
+
+
+def outcomes_chart(df_outcomes):
+    fig = px.bar(df_outcomes, x='Fluxo Total Recebido (R$)', y='Probabilidade',
+                 title="Distribuição do Fluxo Total Recebido")
+    fig.update_yaxes(tickformat='.1%')
+    return fig
+
+
+def portfolio_figures(portfolio):
+    df_survival, df_outcomes = portfolio['df_survival'], portfolio['df_outcomes']
+    return {
+        'survival': figure_json('bond_survival', lambda: survival_chart(df_survival), df_survival),
+        'outcomes': figure_json('bond_outcomes', lambda: outcomes_chart(df_outcomes), df_outcomes),
+    }
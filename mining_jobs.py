@@ -0,0 +1,207 @@
+import threading
+import time
+import uuid
+
+import numpy as np
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from blockchain import (DEFAULT_BATCH_SIZE, PARALLEL_MIN_DIFFICULTY, leading_zero_mask, parallel_search,
+                        prefix_midstate, sha256_batch)
+from session_resources import SESSION_TTL
+
+# -----------------------------------------------------------------------------
+# MINERAÇÃO EM SEGUNDO PLANO (JOBS COM PROGRESSO E CANCELAMENTO)
+# -----------------------------------------------------------------------------
+# A mineração roda numa thread própria, em fatias pequenas, para que o script
+# do Streamlit não fique preso no laço de nonces. A página apenas consulta o
+# progresso (polling) e anexa o bloco à cadeia quando o job termina.
+# No modo escalar, a partir de PARALLEL_MIN_DIFFICULTY a thread só coordena:
+# os hashes rodam no pool de processos de blockchain.parallel_search, fora do
+# GIL do servidor, dividido com os jobs das outras sessões. Um job cuja
+# sessão ficou desconectada por mais de SESSION_TTL se cancela sozinho e sai
+# do registro; antes disso a aba ainda pode reconectar (aba suspensa, rede
+# instável) e coletar o bloco.
+
+# Nonces por fatia no modo escalar: define a frequência de progresso/cancelamento
+SCALAR_SLICE = 20000
+
+_jobs = {}
+_jobs_lock = threading.Lock()
+
+
+class MiningJob:
+    def __init__(self, block, difficulty, mode="Escalar", batch_size=DEFAULT_BATCH_SIZE, session_id=None):
+        self.job_id = uuid.uuid4().hex[:8]
+        self.session_id = session_id
+        self.block = block
+        self.difficulty = difficulty
+        self.mode = mode
+        self.batch_size = batch_size
+        self.status = "running"
+        # Na fila do pool compartilhado (todos os slots de busca ocupados)
+        self.waiting = False
+        self.error = None
+        self.tried = 0
+        self.best_hash = block.hash
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        self._cancel = threading.Event()
+        self._inactive_since = None
+        self._thread = threading.Thread(target=self._run, name=f"mining-{self.job_id}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self._cancel.set()
+
+    def orphaned(self):
+        # A sessão dona do job está desconectada há mais de SESSION_TTL
+        if self.session_id is None or not runtime.exists():
+            return False
+        if runtime.get_instance().is_active_session(self.session_id):
+            self._inactive_since = None
+            return False
+        now = time.monotonic()
+        if self._inactive_since is None:
+            self._inactive_since = now
+        return now - self._inactive_since >= SESSION_TTL
+
+    def _stopped(self):
+        if not self._cancel.is_set() and self.orphaned():
+            self._cancel.set()
+        return self._cancel.is_set()
+
+    @property
+    def done(self):
+        return self.status != "running"
+
+    def elapsed(self):
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def progress(self):
+        elapsed = self.elapsed()
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "tried": self.tried,
+            "waiting": self.waiting,
+            "hash_rate": self.tried / elapsed if elapsed > 0 else 0.0,
+            "best_hash": self.best_hash,
+            "elapsed": elapsed,
+        }
+
+    def _run(self):
+        try:
+            if self.mode == "Escalar":
+                nonce = self._search_scalar()
+            else:
+                nonce = self._search_batch()
+            if nonce is None:
+                self.status = "cancelled"
+            else:
+                self.block.nonce = nonce
+                self.block.hash = self.block.calculate_hash_fast()
+                self.best_hash = self.block.hash
+                self.status = "done"
+        except Exception as exc:
+            self.error = exc
+            self.status = "error"
+        finally:
+            self.finished_at = time.perf_counter()
+            if self.orphaned():
+                pop_job(self.job_id)
+
+    def _wait(self):
+        self.waiting = True
+
+    def _chunk_done(self, tried, lowest):
+        self.waiting = False
+        self.tried += tried
+        if lowest < self.best_hash:
+            self.best_hash = lowest
+
+    def _search_scalar(self):
+        if self.difficulty >= PARALLEL_MIN_DIFFICULTY:
+            return parallel_search(self.block.hash_prefix(), self.difficulty, self.block.nonce,
+                                   should_stop=self._stopped, on_chunk=self._chunk_done, on_wait=self._wait)
+        # Dificuldades baixas: poucos milhares de hashes, não compensa o pool
+        target = '0' * self.difficulty
+        state = self.block.prefix_state()
+        nonce = self.block.nonce
+        while not self._stopped():
+            best = self.best_hash
+            for candidate in range(nonce, nonce + SCALAR_SLICE):
+                sha = state.copy()
+                sha.update(str(candidate).encode('utf-8'))
+                digest = sha.hexdigest()
+                if digest < best:
+                    best = digest
+                if digest[:self.difficulty] == target:
+                    self.tried += candidate - nonce + 1
+                    return candidate
+            self.best_hash = best
+            self.tried += SCALAR_SLICE
+            nonce += SCALAR_SLICE
+        return None
+
+    def _search_batch(self):
+        # Modo didático (SHA-256 em NumPy): em geral mais lento que o escalar
+        prefix = self.block.hash_prefix()
+        midstate = prefix_midstate(prefix)
+        nonce = self.block.nonce
+        while not self._stopped():
+            stop = min(nonce + self.batch_size, 10 ** len(str(nonce)))
+            digest = sha256_batch(prefix, np.arange(nonce, stop, dtype=np.uint64), midstate)
+            hits = np.flatnonzero(leading_zero_mask(digest, self.difficulty))
+            if hits.size:
+                self.tried += int(hits[0]) + 1
+                return nonce + int(hits[0])
+            # Melhor prefixo do lote: menor par (word0, word1) do digest
+            lowest = int(np.lexsort((digest[1], digest[0]))[0])
+            candidate = ''.join(f'{int(word):08x}' for word in digest[:, lowest])
+            if candidate < self.best_hash:
+                self.best_hash = candidate
+            self.tried += stop - nonce
+            nonce = stop
+        return None
+
+
+def reap_jobs():
+    # Cancela e remove os jobs de sessões desconectadas além do TTL (inclusive
+    # os já terminados que ninguém vai coletar)
+    with _jobs_lock:
+        orphans = [job for job in _jobs.values() if job.orphaned()]
+        for job in orphans:
+            job.cancel()
+            del _jobs[job.job_id]
+    return len(orphans)
+
+
+def start_job(block, difficulty, mode="Escalar", batch_size=DEFAULT_BATCH_SIZE):
+    ctx = get_script_run_ctx()
+    reap_jobs()
+    job = MiningJob(block, difficulty, mode, batch_size, ctx.session_id if ctx is not None else None)
+    with _jobs_lock:
+        _jobs[job.job_id] = job
+    job.start()
+    return job.job_id
+
+
+def get_job(job_id):
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def cancel_job(job_id):
+    job = get_job(job_id)
+    if job is not None:
+        job.cancel()
+
+
+def pop_job(job_id):
+    # Remove o job do registro depois que a sessão consumiu o resultado
+    with _jobs_lock:
+        return _jobs.pop(job_id, None)
@@ -0,0 +1,294 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from simulations import simulation_rng
+
+# -----------------------------------------------------------------------------
+# BANCO DE QUESTÕES E CORREÇÃO VETORIZADA (PÁGINA 9)
+# -----------------------------------------------------------------------------
+# As questões vêm de quiz_bank.json (id, módulo, enunciado, alternativas e
+# índice da correta). Cada sessão sorteia a sua prova; uma tentativa, ou um
+# lote inteiro delas, é corrigida numa única comparação numpy entre as
+# alternativas marcadas e o gabarito.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+QUIZ_BANK = os.path.join(ROOT, 'quiz_bank.json')
+QUIZ_DB = os.environ.get("TOKENS_QUIZ_DB", os.path.join(ROOT, 'saved_quiz', 'attempts.sqlite'))
+QUIZ_SIZE = 5
+UNANSWERED = -1
+MAX_OPTIONS = 16
+
+
+class QuestionBank:
+    def __init__(self, questions):
+        self.questions = questions
+        self.ids = [question['id'] for question in questions]
+        self.positions = {question_id: i for i, question_id in enumerate(self.ids)}
+        self.modules = [question['module'] for question in questions]
+        self.answers = np.array([question['answer'] for question in questions], dtype=np.int16)
+        self.n_options = np.array([len(question['options']) for question in questions], dtype=np.int16)
+        if len(self.positions) != len(questions):
+            raise ValueError("Banco de questões com id repetido")
+        if ((self.n_options < 2) | (self.n_options > MAX_OPTIONS)).any():
+            raise ValueError(f"Cada questão precisa de 2 a {MAX_OPTIONS} alternativas")
+        if ((self.answers < 0) | (self.answers >= self.n_options)).any():
+            raise ValueError("Gabarito fora das alternativas da questão")
+
+    @classmethod
+    def from_json(cls, path=QUIZ_BANK):
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self):
+        return len(self.questions)
+
+    def sample(self, rng, size=QUIZ_SIZE):
+        # Prova da sessão: questões sem repetição, na ordem do banco
+        return np.sort(rng.choice(len(self), size=min(size, len(self)), replace=False))
+
+    def score(self, question_idx, choices):
+        # Funciona para uma tentativa (1-D) ou um lote (tentativas × questões);
+        # alternativa em branco (UNANSWERED) nunca coincide com o gabarito
+        return np.asarray(choices) == self.answers[np.asarray(question_idx)]
+
+
+BANK = QuestionBank.from_json()
+
+
+def simulate_class(bank, n_attempts, seed, size=QUIZ_SIZE):
+    # Turma sintética para o painel: habilidade por aluno, dificuldade por
+    # questão (modelo logístico) e um distrator "popular" em cada questão
+    rng = simulation_rng(seed, 'quiz_class')
+    size = min(size, len(bank))
+    # argsort de uniformes = sorteio sem repetição de todas as tentativas de uma vez
+    question_idx = np.sort(np.argsort(rng.random((n_attempts, len(bank))), axis=1)[:, :size], axis=1)
+    difficulty = rng.normal(0.0, 1.0, len(bank))
+    ability = rng.normal(0.8, 1.0, n_attempts)
+    p_correct = 1 / (1 + np.exp(difficulty[question_idx] - ability[:, None]))
+    correct = rng.random(question_idx.shape) < p_correct
+
+    n_options = bank.n_options[question_idx]
+    popular = 1 + rng.integers(0, bank.n_options - 1)
+    offset = np.where(rng.random(question_idx.shape) < 0.6, popular[question_idx],
+                      1 + (rng.random(question_idx.shape) * (n_options - 1)).astype(np.int16))
+    answers = bank.answers[question_idx]
+    choices = np.where(correct, answers, (answers + offset) % n_options)
+    choices[rng.random(question_idx.shape) < 0.03] = UNANSWERED
+    return question_idx, choices
+
+
+# -----------------------------------------------------------------------------
+# TENTATIVAS EM SQLITE (INSERÇÃO EM LOTES + ROLLUPS PRÉ-CALCULADOS)
+# -----------------------------------------------------------------------------
+# As tentativas de todas as sessões passam por um buffer do processo e são
+# gravadas em lotes (executemany numa única transação). Na mesma transação,
+# tabelas de rollup (acertos por questão, escolhas por alternativa e
+# distribuição das notas) recebem os totais do lote via UPSERT: o painel da
+# turma lê só essas tabelas pequenas, sem varrer as respostas.
+
+INSERT_BATCH = 200
+FLUSH_INTERVAL = 2.0  # segundos
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    attempt_id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    created REAL NOT NULL,
+    n_questions INTEGER NOT NULL,
+    score INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS answers (
+    attempt_id INTEGER NOT NULL,
+    question_id TEXT NOT NULL,
+    choice INTEGER NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS question_rollup (
+    question_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    unanswered INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS option_rollup (
+    question_id TEXT NOT NULL,
+    choice INTEGER NOT NULL,
+    picks INTEGER NOT NULL,
+    PRIMARY KEY (question_id, choice)
+);
+CREATE TABLE IF NOT EXISTS score_rollup (
+    n_questions INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    PRIMARY KEY (n_questions, score)
+);
+"""
+
+
+class AttemptStore:
+    def __init__(self, path=QUIZ_DB, bank=BANK, batch_size=INSERT_BATCH, flush_interval=FLUSH_INTERVAL):
+        self.in_memory = path == ':memory:'
+        if not self.in_memory:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.bank = bank
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Transações explícitas (BEGIN IMMEDIATE) e uma conexão por processo
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        if not self.in_memory:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.batches = 0
+        self._lock = threading.Lock()
+
+    def add(self, session, question_idx, choices):
+        # Uma tentativa da página: corrigida na hora, gravada no próximo lote
+        question_idx = np.asarray(question_idx)
+        choices = np.asarray(choices)
+        correct = self.bank.score(question_idx, choices)
+        with self._lock:
+            self.pending.append((session, time.time(), question_idx, choices))
+            due = len(self.pending) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval
+        if due:
+            self.flush()
+        return correct
+
+    def add_batch(self, session, question_idx, choices):
+        # Lote de tentativas do mesmo tamanho (tentativas × questões)
+        n_attempts, size = question_idx.shape
+        with self._lock:
+            self._write([session] * n_attempts, [time.time()] * n_attempts, np.full(n_attempts, size),
+                        question_idx.ravel(), choices.ravel())
+
+    def flush(self):
+        with self._lock:
+            pending, self.pending = self.pending, []
+            self.last_flush = time.monotonic()
+            if not pending:
+                return 0
+            sessions, created, question_idx, choices = zip(*pending)
+            self._write(sessions, created, np.array([len(q) for q in question_idx]),
+                        np.concatenate(question_idx), np.concatenate(choices))
+        return len(pending)
+
+    def _write(self, sessions, created, sizes, flat_questions, flat_choices):
+        # Correção, notas e rollups do lote inteiro com numpy; SQL só com executemany
+        bank = self.bank
+        correct = bank.score(flat_questions, flat_choices)
+        row = np.repeat(np.arange(len(sizes)), sizes)
+        scores = np.bincount(row, weights=correct, minlength=len(sizes)).astype(np.int64)
+        ids = np.asarray(bank.ids, dtype=object)
+
+        asked = np.bincount(flat_questions, minlength=len(bank))
+        right = np.bincount(flat_questions, weights=correct, minlength=len(bank)).astype(np.int64)
+        blank = np.bincount(flat_questions[flat_choices == UNANSWERED], minlength=len(bank))
+        answered = flat_choices != UNANSWERED
+        picks = np.bincount(flat_questions[answered] * MAX_OPTIONS + flat_choices[answered],
+                            minlength=len(bank) * MAX_OPTIONS)
+        picked = np.flatnonzero(picks)
+        score_counts = Counter(zip(sizes.tolist(), scores.tolist()))
+
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            first = conn.execute("SELECT COALESCE(MAX(attempt_id), 0) + 1 FROM attempts").fetchone()[0]
+            attempt_ids = np.arange(first, first + len(sizes))
+            conn.executemany("INSERT INTO attempts VALUES (?, ?, ?, ?, ?)",
+                             zip(attempt_ids.tolist(), sessions, created, sizes.tolist(), scores.tolist()))
+            conn.executemany("INSERT INTO answers VALUES (?, ?, ?, ?)",
+                             zip(attempt_ids[row].tolist(), ids[flat_questions].tolist(),
+                                 flat_choices.tolist(), correct.astype(np.int64).tolist()))
+            touched = np.flatnonzero(asked)
+            conn.executemany(
+                "INSERT INTO question_rollup VALUES (?, ?, ?, ?) ON CONFLICT(question_id) DO UPDATE SET "
+                "attempts = attempts + excluded.attempts, correct = correct + excluded.correct, "
+                "unanswered = unanswered + excluded.unanswered",
+                zip(ids[touched].tolist(), asked[touched].tolist(), right[touched].tolist(), blank[touched].tolist()))
+            conn.executemany(
+                "INSERT INTO option_rollup VALUES (?, ?, ?) ON CONFLICT(question_id, choice) DO UPDATE SET "
+                "picks = picks + excluded.picks",
+                zip(ids[picked // MAX_OPTIONS].tolist(), (picked % MAX_OPTIONS).tolist(), picks[picked].tolist()))
+            conn.executemany(
+                "INSERT INTO score_rollup VALUES (?, ?, ?) ON CONFLICT(n_questions, score) DO UPDATE SET "
+                "attempts = attempts + excluded.attempts",
+                ((size, score, count) for (size, score), count in score_counts.items()))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.batches += 1
+        return len(sizes)
+
+    def class_report(self):
+        # Painel da turma: lê só os rollups (algumas linhas por questão)
+        self.flush()
+        with self._lock:
+            questions = pd.read_sql_query("SELECT * FROM question_rollup", self.conn)
+            options = pd.read_sql_query("SELECT * FROM option_rollup", self.conn)
+            scores = pd.read_sql_query("SELECT * FROM score_rollup", self.conn)
+        return class_summary(self.bank, questions, options, scores)
+
+    def nbytes(self):
+        # Memória do processo: páginas do banco (só quando ':memory:') e o buffer
+        with self._lock:
+            size = sum(q.nbytes + c.nbytes + 64 for _, _, q, c in self.pending)
+            if self.in_memory:
+                page_count = self.conn.execute("PRAGMA page_count").fetchone()[0]
+                page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+                size += page_count * page_size
+        return size
+
+    def clear(self):
+        with self._lock:
+            self.pending = []
+            for table in ('attempts', 'answers', 'question_rollup', 'option_rollup', 'score_rollup'):
+                self.conn.execute(f"DELETE FROM {table}")
+
+
+def class_summary(bank, questions, options, scores):
+    attempts = int(scores['attempts'].sum())
+    mean_score = float((scores['score'] / scores['n_questions'] * scores['attempts']).sum() / attempts) if attempts else 0.0
+
+    answers = bank.answers[[bank.positions.get(q, 0) for q in options['question_id']]]
+    options = options.assign(is_answer=options['choice'].to_numpy() == answers)
+    options = options[options['question_id'].isin(bank.positions)]
+    options = options.merge(questions[['question_id', 'attempts']], on='question_id')
+    options['rate'] = options['picks'] / options['attempts']
+    distractors = options[~options['is_answer']].sort_values('rate', ascending=False).drop_duplicates('question_id')
+
+    questions = questions[questions['question_id'].isin(bank.positions)].copy()
+    questions['module'] = [bank.modules[bank.positions[q]] for q in questions['question_id']]
+    questions['accuracy'] = questions['correct'] / questions['attempts']
+    questions['difficulty'] = 1 - questions['accuracy']
+    questions = questions.merge(distractors[['question_id', 'choice', 'rate']].rename(
+        columns={'choice': 'top_distractor', 'rate': 'distractor_rate'}), on='question_id', how='left')
+    return {
+        'attempts': attempts,
+        'mean_score': mean_score,
+        'questions': questions.sort_values('difficulty', ascending=False).reset_index(drop=True),
+        'options': options.sort_values(['question_id', 'choice']).reset_index(drop=True),
+        'scores': scores.sort_values(['n_questions', 'score']).reset_index(drop=True),
+    }
+
+
+# Um store por arquivo, compartilhado pelas sessões do processo
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def attempt_store(path=QUIZ_DB):
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = AttemptStore(path)
+            # Tentativas ainda no buffer não se perdem ao encerrar o servidor
+            atexit.register(_stores[path].flush)
+        return _stores[path]
@@ -0,0 +1,280 @@
+import os
+import sys
+import threading
+import time
+
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# -----------------------------------------------------------------------------
+# RECURSOS POR SESSÃO: MEDIÇÃO, TETO DE MEMÓRIA E SESSÕES OCIOSAS
+# -----------------------------------------------------------------------------
+# Cada aba do navegador tem o seu session_state (cadeia, explorador, validador,
+# resultados do ledger...) e nada disso era limitado. O gerenciador mede os
+# bytes de cada sessão ao fim de cada execução do script e:
+# - acima do teto por sessão, descarta os objetos derivados (recriados sob
+#   demanda) e despeja a cadeia em disco (save_chain + MappedChainStore: os
+#   blocos antigos passam a ser lidos via mmap, os novos ficam em memória);
+# - acima do teto do processo, faz o mesmo nas sessões usadas há mais tempo;
+# - sessões sem atividade por mais de SESSION_TTL perdem os resultados e têm a
+#   cadeia despejada; se a sessão também está desconectada, o registro e o
+#   arquivo somem. Uma aba desconectada há pouco (aba suspensa, rede instável)
+#   ainda pode reconectar e recuperar a cadeia, então só é esquecida após o TTL.
+# Sessões de outras abas só são mexidas fora de uma execução do script (nem
+# com mineração pendente). A gravação em disco roda fora da trava global: a
+# decisão e a troca da cadeia ficam sob a trava, e a troca só acontece se a
+# cadeia da sessão não mudou enquanto o arquivo era escrito.
+
+SESSION_CAP = int(os.environ.get("TOKENS_SESSION_CAP_MB", 64)) * 2**20
+TOTAL_CAP = int(os.environ.get("TOKENS_SESSIONS_TOTAL_MB", 2048)) * 2**20
+SESSION_TTL = float(os.environ.get("TOKENS_SESSION_TTL", 30 * 60))
+SWEEP_INTERVAL = 30.0
+
+
+def estimate_bytes(value, seen=None, depth=4):
+    # Estimativa recursiva; cada objeto é contado uma vez (o validador e o
+    # explorador apontam para a mesma cadeia da sessão)
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    # Sem importar numpy/pandas aqui (partida a frio): ChainStore, índices e o
+    # AttemptStore em memória (páginas do SQLite) têm nbytes(), arrays numpy
+    # têm nbytes e objetos pandas memory_usage()
+    nbytes = getattr(value, 'nbytes', None)
+    if callable(nbytes):
+        return nbytes()
+    if isinstance(nbytes, int):
+        return nbytes
+    if callable(getattr(value, 'memory_usage', None)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    size = sys.getsizeof(value)
+    if depth == 0:
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_bytes(k, seen, depth - 1) + estimate_bytes(v, seen, depth - 1)
+                          for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_bytes(item, seen, depth - 1) for item in value)
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return size + estimate_bytes(vars(value), seen, depth - 1)
+    return size
+
+
+def _state_get(state, key):
+    return state[key] if key in state else None
+
+
+def _chain_version(store):
+    # Muda com blocos novos (len) e com adulterações (revision)
+    return id(store), len(store), getattr(store, 'revision', 0)
+
+
+class SessionResourceManager:
+    def __init__(self, spill_dir, derived_keys=(), idle_keys=(), chain_key='blockchain',
+                 session_cap=SESSION_CAP, total_cap=TOTAL_CAP, ttl=SESSION_TTL, sweep_interval=SWEEP_INTERVAL):
+        self.spill_dir = spill_dir
+        # derived_keys: recriados sob demanda; idle_keys: resultados que uma
+        # sessão ociosa pode perder
+        self.derived_keys = derived_keys
+        self.idle_keys = idle_keys
+        self.chain_key = chain_key
+        self.session_cap = session_cap
+        self.total_cap = total_cap
+        self.ttl = ttl
+        self.sweep_interval = sweep_interval
+        self.sessions = {}
+        self.spills = 0
+        self.evictions = 0
+        self.removed = 0
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+
+    def measure(self, state):
+        return estimate_bytes(state.filtered_state)
+
+    def _record(self, session_id, state, now):
+        record = self.sessions.setdefault(session_id, {'disk_bytes': 0, 'bytes': 0, 'evicted': False,
+                                                       'spilling': False})
+        record.update(state=state, last_seen=now)
+        return record
+
+    def begin_run(self):
+        # Chamado no início de cada execução do script: a sessão fica fora das
+        # varreduras das outras abas até end_run()
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        with self._lock:
+            self._record(ctx.session_id, ctx.session_state, time.monotonic())['running'] = True
+
+    def end_run(self):
+        # Chamado num finally ao fim do script: vale também para exceções,
+        # st.rerun() e st.stop(), que pulam o resto da página
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return
+        with self._lock:
+            record = self.sessions.get(ctx.session_id)
+            if record is not None:
+                record['running'] = False
+
+    def track(self):
+        # Chamado ao fim de cada execução do script da sessão atual
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return None
+        now = time.monotonic()
+        spills, removals = [], []
+        with self._lock:
+            record = self._record(ctx.session_id, ctx.session_state, now)
+            record['evicted'] = False
+            record['bytes'] = self.measure(ctx.session_state)
+            if record['bytes'] > self.session_cap:
+                self._shrink(ctx.session_id, record, self.session_cap, spills)
+            if now - self._last_sweep >= self.sweep_interval or self._total() > self.total_cap:
+                self._sweep(now, spills, removals, current=ctx.session_id)
+        self._write_spills(spills, current=ctx.session_id)
+        self._remove_files(removals)
+        return record
+
+    def _total(self):
+        return sum(record['bytes'] for record in self.sessions.values())
+
+    def _busy(self, record):
+        # Execução do script em andamento, mineração pendente ou despejo em curso
+        return (record.get('running') or record['spilling']
+                or _state_get(record['state'], 'mining_job') is not None)
+
+    def _drop(self, state, keys):
+        for key in keys:
+            if key in state:
+                del state[key]
+
+    def _spill_path(self, session_id):
+        return os.path.join(self.spill_dir, f'{session_id}.chain')
+
+    def _watermark(self, state):
+        # Até onde a cadeia já foi verificada; lido antes de descartar o validador
+        store = _state_get(state, self.chain_key)
+        validator = _state_get(state, 'chain_validator')
+        if validator is not None and validator.store is store:
+            return validator.verified_upto
+        return getattr(store, 'verified_upto', -1)
+
+    def _plan_spill(self, session_id, record, verified_upto, spills):
+        # Sob a trava: só decide. A gravação fica para _write_spills
+        from chain_store import MappedChainStore
+
+        store = _state_get(record['state'], self.chain_key)
+        if store is None or len(store) < 2:
+            return False
+        if isinstance(store, MappedChainStore) and not len(store._tail) and not store._edits:
+            return False
+        record['spilling'] = True
+        spills.append((session_id, record, store, _chain_version(store), verified_upto))
+        return True
+
+    def _write_spills(self, spills, current=None):
+        # Fora da trava: grava e mapeia; a troca só vale se a cadeia não mudou
+        from chain_store import MappedChainStore, save_chain
+
+        for session_id, record, store, version, verified_upto in spills:
+            mapped = None
+            try:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                path = self._spill_path(session_id)
+                save_chain(store, path, verified_upto)
+                mapped = MappedChainStore(path)
+            finally:
+                with self._lock:
+                    record['spilling'] = False
+                    state = record['state']
+                    if (mapped is not None and self.sessions.get(session_id) is record
+                            and (session_id == current or not record.get('running'))
+                            and _chain_version(_state_get(state, self.chain_key)) == version):
+                        state[self.chain_key] = mapped
+                        record['disk_bytes'] = mapped.disk_bytes()
+                        record['bytes'] = self.measure(state)
+                        self.spills += 1
+
+    def _shrink(self, session_id, record, cap, spills):
+        verified_upto = self._watermark(record['state'])
+        self._drop(record['state'], self.derived_keys)
+        record['bytes'] = self.measure(record['state'])
+        if record['bytes'] > cap and self._plan_spill(session_id, record, verified_upto, spills):
+            # Estimativa até a troca: a cadeia sai da memória
+            store = _state_get(record['state'], self.chain_key)
+            record['bytes'] = max(record['bytes'] - estimate_bytes(store), 0)
+
+    def _evict(self, session_id, record, spills):
+        state = record['state']
+        verified_upto = self._watermark(state)
+        self._drop(state, self.derived_keys + self.idle_keys)
+        self._plan_spill(session_id, record, verified_upto, spills)
+        state['session_notice'] = ("Sua sessão ficou inativa: a cadeia foi salva em disco e os "
+                                   "resultados das simulações foram descartados.")
+        record['bytes'] = self.measure(state)
+        record['evicted'] = True
+        self.evictions += 1
+
+    def _forget(self, session_id, removals):
+        # Registro (e a referência ao session_state) sai agora; arquivos, fora da trava
+        self.sessions.pop(session_id)
+        removals.extend((self._spill_path(session_id), self._spill_path(session_id) + '.data'))
+        self.removed += 1
+
+    def _remove_files(self, paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _sweep(self, now, spills, removals, current=None):
+        self._last_sweep = now
+        alive = runtime.get_instance().is_active_session if runtime.exists() else None
+        for session_id, record in list(self.sessions.items()):
+            if session_id == current:
+                continue
+            if now - record['last_seen'] < self.ttl:
+                continue
+            if alive is not None and not alive(session_id):
+                # Desconectada e ociosa além do TTL: não vai mais voltar
+                self._forget(session_id, removals)
+            elif not record['evicted'] and not self._busy(record):
+                self._evict(session_id, record, spills)
+        # Teto do processo: encolhe primeiro as sessões usadas há mais tempo
+        by_age = sorted((item for item in self.sessions.items() if item[0] != current and not self._busy(item[1])),
+                        key=lambda item: item[1]['last_seen'])
+        for session_id, record in by_age:
+            if self._total() <= self.total_cap:
+                break
+            self._shrink(session_id, record, 0, spills)
+
+    def sweep(self):
+        spills, removals = [], []
+        with self._lock:
+            self._sweep(time.monotonic(), spills, removals)
+        self._write_spills(spills)
+        self._remove_files(removals)
+
+    def totals(self):
+        with self._lock:
+            now = time.monotonic()
+            alive = runtime.get_instance().is_active_session if runtime.exists() else None
+            records = list(self.sessions.items())
+            return {
+                'sessions': len(records),
+                'active': sum(1 for session_id, record in records if now - record['last_seen'] < self.ttl
+                              and (alive is None or alive(session_id))),
+                'evicted': sum(1 for _, record in records if record['evicted']),
+                'bytes': sum(record['bytes'] for _, record in records),
+                'disk_bytes': sum(record['disk_bytes'] for _, record in records),
+                'spills': self.spills,
+                'evictions': self.evictions,
+                'removed': self.removed,
+                'session_cap': self.session_cap,
+                'total_cap': self.total_cap,
+            }
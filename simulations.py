@@ -0,0 +1,352 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from cache import LRUCache, memoize
+
+# -----------------------------------------------------------------------------
+# MOTORES DE SIMULAÇÃO (CICLO DE VIDA DO ATIVO)
+# -----------------------------------------------------------------------------
+# Simulações vetorizadas com numpy.random.Generator: todos os caminhos são
+# sorteados de uma vez como arrays, sem laços Python por mês ou por caminho.
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# -----------------------------------------------------------------------------
+# FLUXOS ALEATÓRIOS INDEPENDENTES (SEEDSEQUENCE)
+# -----------------------------------------------------------------------------
+# Nada aqui usa o gerador global np.random.seed: cada sessão escolhe a própria
+# semente e cada simulação recebe um Generator próprio, derivado da semente
+# por SeedSequence com uma spawn_key fixa por simulação. Mesma semente e
+# mesma simulação = mesmos sorteios, sem estado compartilhado entre sessões
+# ou threads.
+
+STREAMS = {
+    'rental_single': 0,
+    'rental_monte_carlo': 1,
+    'bond_single': 2,
+    'bond_portfolio': 3,
+    'risk_scenarios': 4,
+    'cap_table': 5,
+    'ledger': 6,
+    'quiz': 7,
+    'quiz_class': 8,
+}
+
+
+def simulation_rng(seed, stream):
+    # Equivale ao filho STREAMS[stream] de SeedSequence(seed).spawn(), mas sem
+    # depender da ordem em que as simulações são chamadas
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(STREAMS[stream],)))
+
+
+def fresh_seed():
+    # Semente nova a partir da entropia do sistema operacional
+    return int(np.random.SeedSequence().entropy % 2**32)
+
+
+def simulate_rental_paths(rng, n_paths, years, base_value=100, volatility=0.02, yield_rate=0.005):
+    # Preço do token: produto acumulado de choques normais mensais. O mês 1
+    # começa no valor base e não paga dividendo, como no caminho único.
+    months = years * 12
+    shocks = rng.normal(0, volatility, size=(n_paths, months - 1))
+    prices = np.empty((n_paths, months))
+    prices[:, 0] = base_value
+    np.cumprod(1 + shocks, axis=1, out=prices[:, 1:])
+    prices[:, 1:] *= base_value
+    dividends = prices * yield_rate
+    dividends[:, 0] = 0
+    return prices, dividends
+
+
+def rental_summary(prices, dividends):
+    # Distribuição por caminho: dividendos totais, ganho de capital e ROI (%)
+    total_dividends = dividends.sum(axis=1)
+    capital_gain = prices[:, -1] - prices[:, 0]
+    roi = (total_dividends + capital_gain) / prices[:, 0] * 100
+    return pd.DataFrame({
+        'Dividendos Totais (R$)': total_dividends,
+        'Variação de Capital (R$)': capital_gain,
+        'ROI Total (%)': roi
+    })
+
+
+def percentile_bands(paths, percentiles=PERCENTILES):
+    # Bandas do fan chart: uma coluna por percentil, uma linha por mês
+    bands = np.percentile(paths, percentiles, axis=0)
+    return pd.DataFrame({f'P{p}': band for p, band in zip(percentiles, bands)},
+                        index=pd.RangeIndex(1, paths.shape[1] + 1, name='Mês'))
+
+
+def simulate_bond_defaults(rng, n_bonds, years, default_prob, par_value=1000, coupon_rate=0.10):
+    # Ano do primeiro default de cada título. Sortear um "calote?" por ano até
+    # o primeiro sucesso é uma distribuição geométrica: um sorteio por título
+    # substitui a matriz títulos × anos. Valor > years = título sobreviveu.
+    if default_prob <= 0:
+        default_year = np.full(n_bonds, years + 1, dtype=np.int64)
+    else:
+        default_year = np.minimum(rng.geometric(default_prob, size=n_bonds), years + 1)
+    coupon = par_value * coupon_rate
+    survived = default_year > years
+    # Cupons pagos até o ano anterior ao default; sobreviventes recebem o principal
+    realized = (default_year - 1) * coupon + survived * par_value
+    return default_year, realized
+
+
+def bond_summary(default_year, realized, years, par_value=1000, coupon_rate=0.10):
+    promised = par_value * coupon_rate * years + par_value
+    # Ano do default assume years + 1 valores possíveis: uma contagem resolve
+    # a curva de sobrevivência e a distribuição do fluxo recebido
+    counts = np.bincount(default_year - 1, minlength=years + 1)
+    survival = pd.DataFrame({
+        'Ano': np.arange(0, years + 1),
+        'Sobrevivência Simulada': np.concatenate([[1.0], 1 - np.cumsum(counts[:years]) / len(default_year)]),
+    })
+    outcomes = pd.DataFrame({
+        'Fluxo Total Recebido (R$)': (np.arange(years + 1) * par_value * coupon_rate +
+                                      (np.arange(years + 1) == years) * par_value),
+        'Probabilidade': counts / len(default_year),
+    })
+    loss = promised - realized
+    return survival, outcomes, {
+        'expected_loss': loss.mean(),
+        'loss_rate': loss.mean() / promised,
+        'default_rate': (default_year <= years).mean(),
+        'expected_cash': realized.mean(),
+    }
+
+
+# -----------------------------------------------------------------------------
+# TESTE DE ESTRESSE ESTOCÁSTICO (MATRIZ DE RISCOS)
+# -----------------------------------------------------------------------------
+# As seis categorias de risco seguem uma normal multivariada (intensidade de
+# 0 a 100) com correlações entre si. Os controles da página viram condições:
+# o choque de mercado fixa o nível do risco de Mercado, o hack fixa o
+# Cibernético e a mudança regulatória fixa o Regulatório; as demais
+# categorias são sorteadas da distribuição condicional.
+
+RISK_CATEGORIES = ['Mercado', 'Operacional', 'Cibernético', 'Regulatório', 'Liquidez', 'Custódia']
+RISK_BASE = np.array([30, 20, 50, 40, 25, 35], dtype=float)
+RISK_VOLATILITY = np.array([15, 10, 15, 12, 15, 10], dtype=float)
+RISK_CORRELATION = np.array([
+    # Merc. Oper. Ciber. Regul. Liqu. Cust.
+    [1.0, 0.2, 0.1, 0.3, 0.7, 0.2],   # Mercado
+    [0.2, 1.0, 0.6, 0.2, 0.3, 0.5],   # Operacional
+    [0.1, 0.6, 1.0, 0.2, 0.2, 0.4],   # Cibernético
+    [0.3, 0.2, 0.2, 1.0, 0.5, 0.3],   # Regulatório
+    [0.7, 0.3, 0.2, 0.5, 1.0, 0.3],   # Liquidez
+    [0.2, 0.5, 0.4, 0.3, 0.3, 1.0],   # Custódia
+])
+RISK_COVARIANCE = RISK_CORRELATION * np.outer(RISK_VOLATILITY, RISK_VOLATILITY)
+TAIL_LEVEL = 0.95
+
+
+def stress_conditions(market_shock, tech_fail, reg_change):
+    # Níveis observados (índice da categoria -> intensidade) para cada controle
+    conditions = {0: RISK_BASE[0] + 0.7 * market_shock}
+    if tech_fail:
+        conditions[2] = 100.0
+    if reg_change:
+        conditions[3] = 90.0
+    return conditions
+
+
+def simulate_risk_scenarios(rng, n_scenarios, conditions):
+    # Normal condicional: mu_U + S_UO S_OO^-1 (x_O - mu_O) e
+    # S_UU - S_UO S_OO^-1 S_OU, amostrada via Cholesky em um único produto
+    observed = sorted(conditions)
+    free = [i for i in range(len(RISK_CATEGORIES)) if i not in conditions]
+    x_obs = np.array([conditions[i] for i in observed])
+
+    s_oo = RISK_COVARIANCE[np.ix_(observed, observed)]
+    s_uo = RISK_COVARIANCE[np.ix_(free, observed)]
+    gain = s_uo @ np.linalg.inv(s_oo)
+    mean = RISK_BASE[free] + gain @ (x_obs - RISK_BASE[observed])
+    cov = RISK_COVARIANCE[np.ix_(free, free)] - gain @ s_uo.T
+
+    scenarios = np.empty((n_scenarios, len(RISK_CATEGORIES)))
+    scenarios[:, observed] = x_obs
+    shocks = rng.standard_normal((n_scenarios, len(free)))
+    scenarios[:, free] = mean + shocks @ np.linalg.cholesky(cov).T
+    return np.clip(scenarios, 0, 100)
+
+
+def tail_metrics(scenarios, level=TAIL_LEVEL):
+    # Por categoria: média, VaR (percentil) e expected shortfall (média da cauda)
+    var = np.quantile(scenarios, level, axis=0)
+    tail = np.where(scenarios >= var, scenarios, np.nan)
+    es = np.nanmean(tail, axis=0)
+    pct = int(level * 100)
+    return pd.DataFrame([scenarios.mean(axis=0), var, es],
+                        index=['Média', f'VaR {pct}%', f'ES {pct}%'], columns=RISK_CATEGORIES)
+
+
+risk_cache = LRUCache("Cenários de estresse", max_entries=64)
+
+
+@memoize(risk_cache)
+def risk_stress_test(market_shock, tech_fail, reg_change, n_scenarios, seed):
+    # Lote de cenários calculado uma vez por conjunto de parâmetros + semente
+    rng = simulation_rng(seed, 'risk_scenarios')
+    scenarios = simulate_risk_scenarios(rng, n_scenarios, stress_conditions(market_shock, tech_fail, reg_change))
+    # Índice agregado: média das seis categorias em cada cenário
+    aggregate = scenarios.mean(axis=1)
+    var = np.quantile(aggregate, TAIL_LEVEL)
+    return {
+        'metrics': tail_metrics(scenarios),
+        'aggregate_hist': np.histogram(aggregate, bins=50, range=(0, 100)),
+        'aggregate_var': var,
+        'aggregate_es': aggregate[aggregate >= var].mean(),
+    }
+
+
+# -----------------------------------------------------------------------------
+# CAP TABLE: EMISSÃO E NEGOCIAÇÃO SECUNDÁRIA (ATÉ 10^6 CARTEIRAS)
+# -----------------------------------------------------------------------------
+# Os saldos de todas as carteiras ficam num único array de inteiros: tokens
+# não se dividem. A emissão segue a distribuição da página 2 (60% varejo, 20%
+# emissor, 5% plataforma, 15% reserva); o varejo é repartido por um sorteio
+# multinomial com pesos de Pareto, então a soma dos saldos é exatamente o
+# número de tokens. Cada rodada de negociação sorteia vendedores
+# (proporcionais ao saldo) e compradores em bloco e liquida tudo com
+# bincount, sem laço por transação.
+# No ERC-721 cada token é único: o estado é o dono de cada token (um único
+# detentor por token) e cada negócio transfere um token inteiro.
+
+ALLOCATION = {'Emissor (Retido)': 0.20, 'Taxa Plataforma': 0.05, 'Reserva de Liquidez': 0.15}
+RETAIL_SHARE = 0.60
+GINI_SAMPLE = 50000
+CURVE_POINTS = 200
+STANDARDS = ('ERC-20', 'ERC-721')
+
+
+def issue_tokens(rng, fraction_count, n_wallets, pareto_alpha=1.5):
+    # Carteiras 0..2: emissor, plataforma e reserva; as demais são investidores.
+    # As parcelas fixas são arredondadas para baixo e o varejo fica com o resto.
+    balances = np.zeros(n_wallets + len(ALLOCATION), dtype=np.int64)
+    balances[:len(ALLOCATION)] = [int(fraction_count * share) for share in ALLOCATION.values()]
+    retail = fraction_count - int(balances[:len(ALLOCATION)].sum())
+    weights = rng.pareto(pareto_alpha, n_wallets) + 1
+    balances[len(ALLOCATION):] = rng.multinomial(retail, weights / weights.sum())
+    return balances
+
+
+def token_owners(balances):
+    # ERC-721: dono de cada token (ids 0..N-1), na ordem da emissão; os tokens
+    # de varejo são os ids a partir de balances[:3].sum()
+    return np.repeat(np.arange(len(balances), dtype=np.int32), balances)
+
+
+def trade_round(rng, balances, n_trades, max_fraction=0.5):
+    # ERC-20. Só investidores negociam (emissor, plataforma e reserva ficam
+    # parados). Vendedores sorteados na proporção do saldo, compradores com
+    # atividade uniforme, quantidades em tokens inteiros. Se um vendedor for
+    # sorteado várias vezes, as vendas dele são reduzidas (para baixo) até
+    # caber no saldo.
+    n = len(balances)
+    first_investor = len(ALLOCATION)
+    investors = balances[first_investor:]
+    sellers = first_investor + rng.choice(n - first_investor, size=n_trades, p=investors / investors.sum())
+    buyers = rng.integers(first_investor, n, size=n_trades)
+    amounts = rng.binomial(balances[sellers], rng.uniform(0.05, max_fraction, n_trades))
+    sold = np.bincount(sellers, weights=amounts, minlength=n)
+    scale = np.divide(balances, sold, out=np.ones(n), where=sold > balances)
+    amounts = np.floor(amounts * scale[sellers]).astype(np.int64)
+    balances -= np.bincount(sellers, weights=amounts, minlength=n).astype(np.int64)
+    balances += np.bincount(buyers, weights=amounts, minlength=n).astype(np.int64)
+    return balances
+
+
+def nft_trade_round(rng, owners, balances, n_trades, first_retail):
+    # ERC-721: cada negócio transfere um token de varejo distinto para um
+    # comprador; vender na proporção do saldo = sortear tokens uniformemente
+    n = len(balances)
+    tokens = first_retail + rng.choice(len(owners) - first_retail, size=min(n_trades, len(owners) - first_retail),
+                                       replace=False)
+    buyers = rng.integers(len(ALLOCATION), n, size=len(tokens)).astype(owners.dtype)
+    balances -= np.bincount(owners[tokens], minlength=n)
+    balances += np.bincount(buyers, minlength=n)
+    owners[tokens] = buyers
+    return balances
+
+
+def gini(values):
+    x = np.sort(values).astype(float)
+    n = len(x)
+    if n == 0 or x.sum() == 0:
+        return 0.0
+    ranks = np.arange(1, n + 1)
+    return float(2 * (ranks * x).sum() / (n * x.sum()) - (n + 1) / n)
+
+
+def top_share(values, k=10):
+    return float(np.partition(values, len(values) - k)[-k:].sum() / values.sum()) if len(values) > k else 1.0
+
+
+def lorenz_curve(values, points=CURVE_POINTS):
+    # Curva de Lorenz reduzida a `points` pontos para o gráfico
+    x = np.sort(values)
+    cumulative = np.concatenate([[0.0], np.cumsum(x) / x.sum()])
+    idx = np.linspace(0, len(x), points).astype(int)
+    return idx / len(x), cumulative[idx]
+
+
+def simulate_cap_table(rng, fraction_count, n_wallets, rounds, pareto_alpha=1.5, trades_per_round=None,
+                       standard='ERC-20'):
+    if standard not in STANDARDS:
+        raise ValueError(f"Padrão de token desconhecido: {standard}")
+    balances = issue_tokens(rng, fraction_count, n_wallets, pareto_alpha)
+    trades_per_round = trades_per_round or max(1, n_wallets // 10)
+    initial = balances.copy()
+    if standard == 'ERC-721':
+        owners = token_owners(balances)
+        first_retail = int(balances[:len(ALLOCATION)].sum())
+    # Trajetória do Gini por rodada numa amostra fixa de investidores (barato);
+    # o Gini final é calculado sobre todos
+    sample = len(ALLOCATION) + rng.choice(n_wallets, size=min(GINI_SAMPLE, n_wallets), replace=False)
+    trajectory = [gini(balances[sample])]
+    for _ in range(rounds):
+        if standard == 'ERC-721':
+            nft_trade_round(rng, owners, balances, trades_per_round, first_retail)
+        else:
+            trade_round(rng, balances, trades_per_round)
+        trajectory.append(gini(balances[sample]))
+    return initial, balances, trajectory
+
+
+def cap_table_metrics(balances):
+    investors = balances[len(ALLOCATION):]
+    return {
+        'gini': gini(investors),
+        'top10': top_share(investors),
+        'holders': int((balances > 0).sum()),
+        'tokens': int(balances.sum()),
+        'median_holding': float(np.median(investors)),
+    }
+
+
+cap_table_cache = LRUCache("Cap tables simuladas", max_entries=32)
+
+
+@memoize(cap_table_cache)
+def cap_table_scenario(fraction_count, n_wallets, rounds, pareto_alpha, seed, standard='ERC-20'):
+    # Só resumos reduzidos ficam no cache (curvas de 200 pontos, histograma),
+    # nunca os arrays de saldo com até um milhão de carteiras
+    start = time.perf_counter()
+    rng = simulation_rng(seed, 'cap_table')
+    initial, final, trajectory = simulate_cap_table(rng, fraction_count, n_wallets, rounds, pareto_alpha,
+                                                    standard=standard)
+    investors = final[len(ALLOCATION):]
+    positive = investors[investors > 0]
+    spread = len(positive) and positive.max() > positive.min()
+    bins = np.logspace(np.log10(positive.min()), np.log10(positive.max()), 40) if spread else 40
+    return {
+        'initial': cap_table_metrics(initial),
+        'final': cap_table_metrics(final),
+        'lorenz_initial': lorenz_curve(initial[len(ALLOCATION):]),
+        'lorenz_final': lorenz_curve(investors),
+        'holdings_hist': np.histogram(positive, bins=bins),
+        'gini_trajectory': trajectory,
+        'elapsed': time.perf_counter() - start,
+    }
@@ -0,0 +1,658 @@
+(function () {
+'use strict';
+var MONO = "'Space Mono', 'SFMono-Regular', Menlo, Consolas, monospace";
+var stages = [
+{
+id: 0,
+title: "Ativo Off-Chain",
+subtitle: "O Ponto de Partida",
+icon: "🏢",
+color: "#1a365d",
+gradient: "linear-gradient(135deg, #1a365d 0%, #2d4a7c 100%)",
+description: "Um ativo do mundo real existe fora da blockchain — pode ser um imóvel, recebíveis, cotas de fundo ou créditos de carbono.",
+details: [
+"Propriedade documentada em cartório ou registro tradicional",
+"Liquidez limitada e alto custo de transação",
+"Horário de negociação restrito",
+"Fracionamento complexo e caro"
+],
+examples: ["Imóveis Comerciais", "Recebíveis (FIDC)", "Commodities", "Obras de Arte"],
+metrics: { liquidez: 15, custo: 85, acessibilidade: 20 }
+},
+{
+id: 1,
+title: "Due Diligence",
+subtitle: "Análise e Estruturação",
+icon: "🔍",
+color: "#553c9a",
+gradient: "linear-gradient(135deg, #553c9a 0%, #805ad5 100%)",
+description: "O ativo passa por rigorosa análise jurídica, contábil e de compliance. Estrutura-se o veículo legal (SPV) que será o lastro do token.",
+details: [
+"Auditoria completa do ativo subjacente",
+"Criação de SPV (Sociedade de Propósito Específico)",
+"Parecer jurídico sobre natureza do token",
+"Análise de enquadramento regulatório (CVM 175)"
+],
+examples: ["Análise Jurídica", "Auditoria Contábil", "Estrutura SPV", "Compliance KYC/AML"],
+metrics: { complexidade: 90, tempo: 70, risco: 45 }
+},
+{
+id: 2,
+title: "Smart Contract",
+subtitle: "Codificação das Regras",
+icon: "📜",
+color: "#2c5282",
+gradient: "linear-gradient(135deg, #2c5282 0%, #3182ce 100%)",
+description: "As regras de negócio são codificadas em um smart contract. Definições de transferência, compliance, distribuição de rendimentos e governança.",
+details: [
+"Padrão ERC-20 ou ERC-1400 (security tokens)",
+"Whitelist para investidores qualificados",
+"Lógica de distribuição automática de dividendos",
+"Funções de pause, burn e mint controladas"
+],
+examples: ["ERC-20 Token", "Whitelist KYC", "Auto-Dividendos", "Governança On-Chain"],
+metrics: { automacao: 95, transparencia: 100, auditabilidade: 90 }
+},
+{
+id: 3,
+title: "Tokenização",
+subtitle: "Minting do Ativo Digital",
+icon: "⚡",
+color: "#276749",
+gradient: "linear-gradient(135deg, #276749 0%, #38a169 100%)",
+description: "O ativo é 'mintado' na blockchain. Cada token representa uma fração do ativo subjacente, com todas as regras embarcadas.",
+details: [
+"Deploy do smart contract na rede escolhida",
+"Emissão inicial dos tokens (minting)",
+"Vinculação legal entre token e ativo real",
+"Registro em custodiante qualificado"
+],
+examples: ["Deploy Ethereum", "Polygon/Matic", "Stellar", "Redes Permissionadas"],
+metrics: { fracionamento: 100, velocidade: 85, custo: 30 }
+},
+{
+id: 4,
+title: "Mercado Primário",
+subtitle: "Distribuição Inicial",
+icon: "🎯",
+color: "#9c4221",
+gradient: "linear-gradient(135deg, #9c4221 0%, #dd6b20 100%)",
+description: "Os tokens são oferecidos aos investidores iniciais através de plataformas de crowdfunding ou ofertas privadas (CVM 400/476).",
+details: [
+"Oferta via plataforma autorizada pela CVM",
+"Processo de onboarding e KYC dos investidores",
+"Transferência de recursos para a SPV",
+"Alocação dos tokens nas carteiras"
+],
+examples: ["Crowdfunding CVM 88", "Oferta 476", "Placement Privado", "Bookbuilding Digital"],
+metrics: { alcance: 80, eficiencia: 75, compliance: 100 }
+},
+{
+id: 5,
+title: "Mercado Secundário",
+subtitle: "Negociação Contínua",
+icon: "📈",
+color: "#0d9488",
+gradient: "linear-gradient(135deg, #0d9488 0%, #14b8a6 100%)",
+description: "Tokens podem ser negociados 24/7 em exchanges ou plataformas de balcão. Liquidez programável e settlement instantâneo.",
+details: [
+"Listagem em exchanges autorizadas",
+"Trading peer-to-peer via DEX",
+"Atomic swaps e settlement T+0",
+"Formadores de mercado automatizados (AMM)"
+],
+examples: ["Exchange Centralizada", "DEX (Uniswap)", "OTC Digital", "AMM Pools"],
+metrics: { liquidez: 85, disponibilidade: 100, transparencia: 95 }
+},
+{
+id: 6,
+title: "Ciclo de Vida",
+subtitle: "Rendimentos e Eventos",
+icon: "🔄",
+color: "#7c3aed",
+gradient: "linear-gradient(135deg, #7c3aed 0%, #8b5cf6 100%)",
+description: "Durante a vida do token, rendimentos são distribuídos automaticamente, eventos corporativos são executados via smart contract.",
+details: [
+"Distribuição automática de dividendos/juros",
+"Rebasing para refletir valorização",
+"Votações de governança on-chain",
+"Relatórios de performance via oráculos"
+],
+examples: ["Yield Distribution", "Governance Voting", "NAV Updates", "Corporate Actions"],
+metrics: { automacao: 90, eficiencia: 95, rastreabilidade: 100 }
+},
+{
+id: 7,
+title: "Resgate/Vencimento",
+subtitle: "Conclusão do Ciclo",
+icon: "🏁",
+color: "#dc2626",
+gradient: "linear-gradient(135deg, #b91c1c 0%, #dc2626 100%)",
+description: "No vencimento ou mediante resgate, os tokens são queimados (burn) e o valor é devolvido aos detentores proporcionalmente.",
+details: [
+"Trigger de vencimento no smart contract",
+"Liquidação do ativo subjacente",
+"Burn dos tokens em circulação",
+"Distribuição final aos holders"
+],
+examples: ["Maturity Redemption", "Early Buyback", "Liquidation Event", "Token Burn"],
+metrics: { seguranca: 95, transparencia: 100, finalidade: 100 }
+}
+];
+var state = { stage: 0, playing: false, progress: 0, details: false };
+var timer = null;
+var refs = {};
+function h(tag, props) {
+var el = document.createElement(tag);
+props = props || {};
+Object.keys(props).forEach(function (key) {
+var value = props[key];
+if (key === 'style') {
+Object.keys(value).forEach(function (name) {
+if (name.indexOf('--') === 0) {
+el.style.setProperty(name, value[name]);
+} else {
+el.style[name] = value[name];
+}
+});
+} else if (key.indexOf('on') === 0) {
+el.addEventListener(key.slice(2).toLowerCase(), value);
+} else if (key === 'disabled') {
+el.disabled = value;
+} else {
+el.setAttribute(key, value);
+}
+});
+for (var i = 2; i < arguments.length; i++) {
+append(el, arguments[i]);
+}
+return el;
+}
+function append(el, child) {
+if (child === null || child === undefined || child === false) {
+return;
+}
+if (Array.isArray(child)) {
+child.forEach(function (c) { append(el, c); });
+} else if (typeof child === 'string' || typeof child === 'number') {
+el.appendChild(document.createTextNode(String(child)));
+} else {
+el.appendChild(child);
+}
+}
+function replace(el, children) {
+while (el.firstChild) {
+el.removeChild(el.firstChild);
+}
+append(el, children);
+}
+function metricBar(label, value, color) {
+return h('div', { style: { marginBottom: '12px' } },
+h('div', { style: {
+display: 'flex',
+justifyContent: 'space-between',
+marginBottom: '4px',
+fontSize: '11px',
+fontWeight: '500',
+color: 'rgba(255,255,255,0.7)',
+textTransform: 'uppercase',
+letterSpacing: '0.5px'
+} }, h('span', null, label), h('span', null, value + '%')),
+h('div', { style: {
+height: '6px',
+background: 'rgba(255,255,255,0.1)',
+borderRadius: '3px',
+overflow: 'hidden'
+} }, h('div', { style: {
+width: value + '%',
+height: '100%',
+background: color,
+borderRadius: '3px',
+transition: 'width 0.8s cubic-bezier(0.4, 0, 0.2, 1)'
+} }))
+);
+}
+function header(current) {
+return h('header', { style: {
+position: 'relative',
+padding: '20px 24px',
+display: 'flex',
+justifyContent: 'space-between',
+alignItems: 'center',
+borderBottom: '1px solid rgba(255,255,255,0.05)',
+flexWrap: 'wrap',
+gap: '12px'
+} },
+h('div', null,
+h('div', { style: {
+fontSize: '10px',
+fontWeight: '700',
+letterSpacing: '3px',
+color: current.color,
+marginBottom: '4px',
+fontFamily: MONO
+} }, 'COPPEAD • UFRJ'),
+h('h1', { style: {
+fontSize: '18px',
+fontWeight: '700',
+margin: '0',
+background: 'linear-gradient(135deg, #fff 0%, #999 100%)',
+WebkitBackgroundClip: 'text',
+WebkitTextFillColor: 'transparent'
+} }, 'A Jornada da Tokenização')
+),
+h('div', { style: { display: 'flex', alignItems: 'center', gap: '12px', flexWrap: 'wrap' } },
+h('div', { style: {
+padding: '6px 14px',
+background: 'rgba(255,255,255,0.05)',
+borderRadius: '20px',
+fontSize: '11px',
+fontFamily: MONO
+} }, 'Etapa ' + (state.stage + 1) + ' de ' + stages.length),
+h('button', {
+onClick: togglePlay,
+style: {
+padding: '8px 16px',
+background: state.playing ? 'rgba(239, 68, 68, 0.2)' : current.gradient,
+border: 'none',
+borderRadius: '8px',
+color: '#fff',
+fontSize: '12px',
+fontWeight: '600',
+cursor: 'pointer',
+display: 'flex',
+alignItems: 'center',
+gap: '6px',
+transition: 'all 0.3s ease'
+}
+}, state.playing ? '⏸ Pausar' : '▶ Reproduzir')
+)
+);
+}
+function timeline(current) {
+var buttons = stages.map(function (stage, index) {
+return h('button', {
+onClick: function () { goTo(index); },
+style: {
+width: '36px',
+height: '36px',
+borderRadius: '50%',
+border: index === state.stage ? '3px solid ' + stage.color : '2px solid rgba(255,255,255,0.2)',
+background: index <= state.stage ? stage.gradient : 'rgba(255,255,255,0.05)',
+cursor: 'pointer',
+display: 'flex',
+alignItems: 'center',
+justifyContent: 'center',
+fontSize: '14px',
+transition: 'all 0.3s ease',
+position: 'relative',
+zIndex: '1',
+animation: index === state.stage ? 'pulse 2s ease-in-out infinite' : 'none'
+}
+}, stage.icon);
+});
+return h('div', { style: { padding: '20px 24px', position: 'relative' } },
+h('div', { style: { display: 'flex', justifyContent: 'space-between', position: 'relative' } },
+h('div', { style: {
+position: 'absolute',
+top: '18px',
+left: '18px',
+right: '18px',
+height: '2px',
+background: 'rgba(255,255,255,0.1)',
+zIndex: '0'
+} }, h('div', { style: {
+width: (state.stage / (stages.length - 1)) * 100 + '%',
+height: '100%',
+background: 'linear-gradient(90deg, ' + stages[0].color + ', ' + current.color + ')',
+transition: 'width 0.5s ease-out'
+} })),
+buttons
+)
+);
+}
+function card(title, children, radius) {
+return h('div', { style: {
+background: 'rgba(255,255,255,0.03)',
+borderRadius: radius || '16px',
+padding: '20px',
+border: '1px solid rgba(255,255,255,0.06)'
+} },
+h('h3', { style: {
+fontSize: '11px',
+fontWeight: '700',
+letterSpacing: '2px',
+color: 'rgba(255,255,255,0.5)',
+marginBottom: '16px',
+fontFamily: MONO
+} }, title),
+children
+);
+}
+function flowNode(gradient, icon, label, size, options) {
+options = options || {};
+return h('div', { style: { textAlign: 'center', zIndex: '1' } },
+h('div', { style: {
+width: size + 'px',
+height: size + 'px',
+borderRadius: options.radius || '12px',
+background: gradient,
+display: 'flex',
+alignItems: 'center',
+justifyContent: 'center',
+fontSize: options.fontSize || '24px',
+margin: '0 auto 8px',
+opacity: options.opacity === undefined ? '1' : String(options.opacity),
+boxShadow: options.boxShadow || 'none',
+animation: options.animation || 'none'
+} }, icon),
+h('div', { style: {
+fontSize: options.labelSize || '9px',
+color: options.labelColor || 'rgba(255,255,255,0.5)',
+fontWeight: options.labelWeight || '500'
+} }, label)
+);
+}
+function flowArrow(color, delay) {
+return h('div', { style: {
+flex: '1',
+height: '4px',
+margin: '0 12px',
+background: 'rgba(255,255,255,0.1)',
+borderRadius: '2px',
+position: 'relative',
+overflow: 'hidden'
+} }, h('div', { style: {
+position: 'absolute',
+inset: '0',
+background: 'linear-gradient(90deg, transparent, ' + color + ', transparent)',
+animation: 'tokenMove 2s ease-in-out infinite',
+animationDelay: delay
+} }));
+}
+function flowDiagram(current) {
+var previous = state.stage > 0 ? stages[state.stage - 1] : null;
+var next = state.stage < stages.length - 1 ? stages[state.stage + 1] : null;
+return h('div', { style: {
+background: 'rgba(255,255,255,0.02)',
+borderRadius: '14px',
+padding: '24px 16px',
+border: '1px solid rgba(255,255,255,0.04)',
+position: 'relative',
+overflow: 'hidden'
+} }, h('div', { style: {
+display: 'flex',
+alignItems: 'center',
+justifyContent: 'space-between',
+position: 'relative'
+} },
+flowNode(previous ? previous.gradient : 'rgba(255,255,255,0.1)', previous ? previous.icon : '📋',
+previous ? previous.title : 'Início', 50),
+flowArrow(current.color, '0s'),
+flowNode(current.gradient, current.icon, current.title, 65, {
+radius: '14px',
+fontSize: '32px',
+boxShadow: '0 8px 24px ' + current.color + '44',
+animation: 'pulse 2s ease-in-out infinite',
+labelSize: '11px',
+labelColor: '#fff',
+labelWeight: '600'
+}),
+flowArrow(current.color, '1s'),
+flowNode(next ? next.gradient : 'rgba(255,255,255,0.1)', next ? next.icon : '✓',
+next ? next.title : 'Fim', 50, { opacity: next ? 0.6 : 0.3 })
+));
+}
+function detailsPanel(current) {
+return h('div', { style: {
+background: 'rgba(255,255,255,0.02)',
+borderRadius: '0 0 12px 12px',
+padding: '20px',
+border: '1px solid rgba(255,255,255,0.06)',
+borderTop: 'none',
+marginTop: '-20px',
+animation: 'slideIn 0.3s ease-out'
+} }, h('ul', { style: { margin: '0', padding: '0', listStyle: 'none' } },
+current.details.map(function (detail, index) {
+return h('li', { style: {
+padding: '10px 0',
+borderBottom: index < current.details.length - 1 ? '1px solid rgba(255,255,255,0.05)' : 'none',
+display: 'flex',
+alignItems: 'flex-start',
+gap: '10px',
+fontSize: '13px',
+color: 'rgba(255,255,255,0.7)'
+} }, h('span', { style: { color: current.color } }, '→'), detail);
+})
+));
+}
+function navButton(label, enabled, activeBackground, onClick, bordered) {
+return h('button', {
+onClick: function () { if (enabled) { onClick(); } },
+disabled: !enabled,
+style: {
+flex: '1',
+padding: '14px',
+background: enabled ? activeBackground : 'rgba(255,255,255,0.02)',
+border: bordered ? '1px solid rgba(255,255,255,0.1)' : 'none',
+borderRadius: '10px',
+color: enabled ? '#fff' : 'rgba(255,255,255,0.3)',
+fontSize: '13px',
+fontWeight: '600',
+cursor: enabled ? 'pointer' : 'not-allowed',
+transition: 'all 0.2s ease'
+}
+}, label);
+}
+function main(current) {
+var last = stages.length - 1;
+refs.progressFill = h('div', { style: {
+width: state.progress + '%',
+height: '100%',
+background: current.gradient,
+transition: 'width 0.1s linear'
+} });
+return h('main', { style: {
+padding: '0 24px 24px',
+display: 'grid',
+gridTemplateColumns: '1fr',
+gap: '20px',
+position: 'relative'
+} },
+h('div', { style: { display: 'flex', alignItems: 'flex-start', gap: '20px', animation: 'slideIn 0.5s ease-out' } },
+h('div', { style: {
+width: '70px',
+height: '70px',
+borderRadius: '18px',
+background: current.gradient,
+display: 'flex',
+alignItems: 'center',
+justifyContent: 'center',
+fontSize: '36px',
+boxShadow: '0 15px 30px ' + current.color + '44',
+flexShrink: '0',
+'--glow-color': current.color + '66',
+animation: 'glow 3s ease-in-out infinite'
+} }, current.icon),
+h('div', { style: { flex: '1' } },
+h('div', { style: {
+fontSize: '10px',
+fontWeight: '600',
+color: current.color,
+letterSpacing: '2px',
+marginBottom: '6px',
+fontFamily: MONO
+} }, 'ETAPA ' + (state.stage + 1)),
+h('h2', { style: { fontSize: '28px', fontWeight: '700', margin: '0 0 4px 0', lineHeight: '1.1' } },
+current.title),
+h('p', { style: { fontSize: '14px', color: 'rgba(255,255,255,0.5)', margin: '0', fontWeight: '500' } },
+current.subtitle)
+)
+),
+h('div', { style: {
+background: 'rgba(255,255,255,0.03)',
+borderRadius: '14px',
+padding: '20px',
+border: '1px solid rgba(255,255,255,0.06)',
+backdropFilter: 'blur(10px)'
+} }, h('p', { style: { fontSize: '15px', lineHeight: '1.7', margin: '0', color: 'rgba(255,255,255,0.85)' } },
+current.description)),
+flowDiagram(current),
+card('INDICADORES', Object.keys(current.metrics).map(function (key) {
+return metricBar(key.charAt(0).toUpperCase() + key.slice(1), current.metrics[key], current.color);
+})),
+card('EXEMPLOS', h('div', { style: { display: 'grid', gridTemplateColumns: '1fr 1fr', gap: '10px' } },
+current.examples.map(function (example) {
+return h('div', { style: {
+padding: '12px 14px',
+background: current.color + '15',
+borderRadius: '10px',
+fontSize: '11px',
+fontWeight: '500',
+color: 'rgba(255,255,255,0.8)',
+textAlign: 'center',
+border: '1px solid ' + current.color + '30'
+} }, example);
+}))),
+h('button', {
+onClick: toggleDetails,
+style: {
+width: '100%',
+padding: '14px 20px',
+background: 'rgba(255,255,255,0.03)',
+border: '1px solid rgba(255,255,255,0.06)',
+borderRadius: state.details ? '12px 12px 0 0' : '12px',
+color: '#fff',
+fontSize: '13px',
+fontWeight: '600',
+cursor: 'pointer',
+display: 'flex',
+justifyContent: 'space-between',
+alignItems: 'center',
+transition: 'all 0.3s ease'
+}
+},
+h('span', null, '📋 Detalhes Técnicos'),
+h('span', { style: {
+transform: state.details ? 'rotate(180deg)' : 'rotate(0deg)',
+transition: 'transform 0.3s ease'
+} }, '▼')
+),
+state.details ? detailsPanel(current) : null,
+h('div', { style: { display: 'flex', gap: '12px' } },
+navButton('← Anterior', state.stage > 0, 'rgba(255,255,255,0.05)',
+function () { goTo(state.stage - 1); }, true),
+navButton('Próxima →', state.stage < last, current.gradient,
+function () { goTo(state.stage + 1); }, false)
+),
+state.playing ? h('div', { style: {
+height: '4px',
+background: 'rgba(255,255,255,0.1)',
+borderRadius: '2px',
+overflow: 'hidden'
+} }, refs.progressFill) : null
+);
+}
+function footer() {
+return h('footer', { style: {
+position: 'relative',
+padding: '16px 24px',
+borderTop: '1px solid rgba(255,255,255,0.05)',
+display: 'flex',
+justifyContent: 'space-between',
+alignItems: 'center',
+fontSize: '11px',
+color: 'rgba(255,255,255,0.4)',
+flexWrap: 'wrap',
+gap: '8px'
+} },
+h('div', { style: { fontFamily: MONO } }, 'Prof. José Américo • Coppead/UFRJ • 2025'),
+h('div', null, '🎓 Material Educacional MBA')
+);
+}
+function render() {
+var current = stages[state.stage];
+refs.background.style.background =
+'radial-gradient(ellipse at 20% 20%, ' + current.color + '22 0%, transparent 50%), ' +
+'radial-gradient(ellipse at 80% 80%, ' + current.color + '15 0%, transparent 50%)';
+refs.particles.forEach(function (particle) {
+particle.style.background = current.color;
+});
+replace(refs.content, [header(current), timeline(current), main(current)]);
+}
+function goTo(index) {
+state.stage = index;
+state.progress = 0;
+state.details = false;
+render();
+}
+function toggleDetails() {
+state.details = !state.details;
+render();
+}
+function tick() {
+if (state.progress >= 100) {
+state.progress = 0;
+if (state.stage < stages.length - 1) {
+state.stage += 1;
+} else {
+stopPlaying();
+}
+render();
+return;
+}
+state.progress += 2;
+refs.progressFill.style.width = state.progress + '%';
+}
+function stopPlaying() {
+state.playing = false;
+clearInterval(timer);
+timer = null;
+}
+function togglePlay() {
+if (state.playing) {
+stopPlaying();
+} else {
+state.playing = true;
+timer = setInterval(tick, 100);
+}
+render();
+}
+function mount(root) {
+refs.background = h('div', { style: { position: 'absolute', inset: '0', transition: 'all 1s ease-out' } });
+refs.particles = [];
+for (var i = 0; i < 15; i++) {
+var size = Math.random() * 4 + 2 + 'px';
+refs.particles.push(h('div', { style: {
+position: 'absolute',
+left: Math.random() * 100 + '%',
+top: Math.random() * 100 + '%',
+width: size,
+height: size,
+borderRadius: '50%',
+opacity: '0.3',
+animation: 'float ' + (Math.random() * 20 + 10) + 's ease-in-out infinite',
+animationDelay: Math.random() * 5 + 's'
+} }));
+}
+var grid = h('div', { style: {
+position: 'absolute',
+inset: '0',
+backgroundImage: 'linear-gradient(rgba(255,255,255,0.02) 1px, transparent 1px), ' +
+'linear-gradient(90deg, rgba(255,255,255,0.02) 1px, transparent 1px)',
+backgroundSize: '50px 50px',
+opacity: '0.5'
+} });
+refs.content = h('div', { style: { position: 'relative' } });
+replace(root, h('div', { style: {
+minHeight: '100vh',
+background: '#0a0a0f',
+color: '#ffffff',
+position: 'relative',
+overflow: 'hidden',
+padding: '0 0 20px 0'
+} }, refs.background, refs.particles, grid, refs.content, footer()));
+render();
+}
+mount(document.getElementById('root'));
+})();
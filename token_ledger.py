@@ -0,0 +1,209 @@
+import time
+from collections import Counter
+from itertools import repeat
+
+import numpy as np
+
+from kyc_index import WhitelistIndex, addresses_to_digests, measure_lookups, random_digests, set_bytes_per_address
+from simulations import simulation_rng
+
+# -----------------------------------------------------------------------------
+# LEDGER ERC-20 EM PROCESSO (MESMA LÓGICA DOS CONTRATOS DA PÁGINA 7)
+# -----------------------------------------------------------------------------
+# balanceOf é um dicionário endereço -> saldo (o "mapping" do Solidity) e
+# transfer reproduz os require do contrato: uma transferência que falha é
+# revertida sem alterar nenhum saldo. Com whitelist ativa, o destinatário
+# precisa estar aprovado (modificador onlyWhitelisted do ComplianceToken).
+# Transferências chegam em lotes, processados num laço enxuto, e o ledger
+# conta quantas foram aplicadas e revertidas.
+
+INSUFFICIENT_BALANCE = "Saldo insuficiente"
+NOT_WHITELISTED = "Investidor nao autorizado (KYC Pendente)"
+ONLY_ADMIN = "Apenas admin"
+INVALID_VALUE = "Valor invalido"
+
+ADDRESS_SIZE = 20
+DEFAULT_BATCH = 100000
+
+
+class LedgerError(Exception):
+    # Equivalente a um revert: a mensagem é a do require que falhou
+    pass
+
+
+class TokenLedger:
+    def __init__(self, symbol, total_supply, admin, compliance=False):
+        self.symbol = symbol
+        self.total_supply = total_supply
+        self.admin = admin
+        self.balances = {admin: total_supply}
+        # None = ERC-20 simples, sem restrição de destinatário. A whitelist
+        # pode ser um set ou um WhitelistIndex (carga em massa de KYC)
+        self.whitelist = set() if compliance else None
+        self.applied = 0
+        self.reverted = Counter()
+
+    def balance_of(self, address):
+        return self.balances.get(address, 0)
+
+    def add_to_whitelist(self, caller, investor):
+        if caller != self.admin:
+            raise LedgerError(ONLY_ADMIN)
+        if self.whitelist is None:
+            raise LedgerError("Contrato sem whitelist")
+        self.whitelist.add(investor)
+
+    def is_whitelisted(self, address):
+        return self.whitelist is None or address in self.whitelist
+
+    def _check(self, sender, to, value):
+        # Motivo do revert, ou None se a transferência pode ser aplicada
+        if value < 0:
+            return INVALID_VALUE
+        if not self.is_whitelisted(to):
+            return NOT_WHITELISTED
+        if self.balances.get(sender, 0) < value:
+            return INSUFFICIENT_BALANCE
+        return None
+
+    def transfer(self, sender, to, value):
+        reason = self._check(sender, to, value)
+        if reason is not None:
+            self.reverted[reason] += 1
+            raise LedgerError(reason)
+        self.balances[sender] -= value
+        self.balances[to] = self.balances.get(to, 0) + value
+        self.applied += 1
+        return True
+
+    def transfer_batch(self, senders, receivers, values):
+        # Mesma semântica de chamar transfer em sequência (a ordem importa:
+        # uma transferência pode depender do saldo recebido na anterior), mas
+        # sem exceções nem atributos resolvidos a cada operação
+        balances = self.balances
+        get = balances.get
+        whitelist = self.whitelist
+        if isinstance(whitelist, WhitelistIndex):
+            # Destinatários do lote inteiro conferidos de uma vez no índice
+            approved = whitelist.contains_batch(receivers).tolist()
+        else:
+            approved = repeat(True) if whitelist is None else [to in whitelist for to in receivers]
+        applied = 0
+        insufficient = 0
+        blocked = 0
+        invalid = 0
+        for sender, to, value, allowed in zip(senders, receivers, values, approved):
+            if value < 0:
+                invalid += 1
+                continue
+            if not allowed:
+                blocked += 1
+                continue
+            balance = get(sender, 0)
+            if balance < value:
+                insufficient += 1
+                continue
+            balances[sender] = balance - value
+            balances[to] = get(to, 0) + value
+            applied += 1
+        self.applied += applied
+        for reason, count in ((INSUFFICIENT_BALANCE, insufficient), (NOT_WHITELISTED, blocked),
+                              (INVALID_VALUE, invalid)):
+            if count:
+                self.reverted[reason] += count
+        return applied
+
+    def supply_in_circulation(self):
+        # Invariante: transferências nunca criam nem destroem tokens
+        return sum(self.balances.values())
+
+    def top_holders(self, n=10):
+        return Counter(self.balances).most_common(n)
+
+
+# -----------------------------------------------------------------------------
+# FLUXOS SINTÉTICOS DE TRANSFERÊNCIAS E MEDIÇÃO DE THROUGHPUT
+# -----------------------------------------------------------------------------
+# Os endereços e as operações são sorteados em lotes com numpy (gerador da
+# sessão); o ledger só vê listas Python de endereços e valores, como receberia
+# de um mempool.
+
+def address_pool(rng, n_addresses):
+    raw = rng.bytes(ADDRESS_SIZE * n_addresses)
+    return ['0x' + raw[i:i + ADDRESS_SIZE].hex() for i in range(0, len(raw), ADDRESS_SIZE)]
+
+
+def synthetic_stream(rng, pool, n_ops, max_value, batch_size=DEFAULT_BATCH):
+    # Gera (senders, receivers, values) em lotes de até batch_size operações
+    n = len(pool)
+    for start in range(0, n_ops, batch_size):
+        size = min(batch_size, n_ops - start)
+        senders = [pool[i] for i in rng.integers(0, n, size).tolist()]
+        receivers = [pool[i] for i in rng.integers(0, n, size).tolist()]
+        values = rng.integers(1, max_value + 1, size).tolist()
+        yield senders, receivers, values
+
+
+def airdrop(ledger, pool, amount):
+    # Distribuição inicial: o admin envia `amount` a cada endereço do pool
+    return ledger.transfer_batch([ledger.admin] * len(pool), pool, [amount] * len(pool))
+
+
+def run_stream(ledger, batches):
+    # Só o tempo dentro do ledger entra no throughput, não a geração dos lotes
+    ops = 0
+    applied = 0
+    elapsed = 0.0
+    for senders, receivers, values in batches:
+        start = time.perf_counter()
+        applied += ledger.transfer_batch(senders, receivers, values)
+        elapsed += time.perf_counter() - start
+        ops += len(values)
+    return {
+        'ops': ops,
+        'applied': applied,
+        'reverted': ops - applied,
+        'elapsed': elapsed,
+        'tps': ops / elapsed if elapsed else 0.0,
+    }
+
+
+def simulate_ledger(symbol, total_supply, n_addresses, n_ops, seed, batch_size=DEFAULT_BATCH,
+                    whitelist_share=None, kyc_base=0, approved_digests=None):
+    # Cenário completo da página 7: airdrop de metade do supply e um fluxo de
+    # n_ops transferências aleatórias. Devolve só o resumo (o ledger, com um
+    # saldo por endereço, não fica guardado na sessão).
+    rng = simulation_rng(seed, 'ledger')
+    pool = address_pool(rng, n_addresses)
+    admin = '0x' + '00' * ADDRESS_SIZE
+    ledger = TokenLedger(symbol, total_supply, admin, compliance=whitelist_share is not None)
+    kyc = {}
+    if whitelist_share is not None:
+        # Carga em massa: parte do pool + base sintética de kyc_base endereços
+        # aprovados + endereços de um CSV, tudo num único WhitelistIndex
+        parts = [addresses_to_digests(pool[:round(whitelist_share * n_addresses)]), random_digests(rng, kyc_base)]
+        if approved_digests is not None:
+            parts.append(approved_digests)
+        start = time.perf_counter()
+        ledger.whitelist = WhitelistIndex(np.concatenate(parts))
+        kyc = {
+            'kyc_addresses': len(ledger.whitelist),
+            'kyc_build': time.perf_counter() - start,
+            'kyc_bytes_per_address': ledger.whitelist.bytes_per_address(),
+            'set_bytes_per_address': set_bytes_per_address(pool),
+            'kyc_lookups': measure_lookups(ledger.whitelist, rng),
+        }
+
+    amount = max(1, total_supply // (2 * n_addresses))
+    airdrop(ledger, pool, amount)
+    ledger.reverted.clear()
+    stats = run_stream(ledger, synthetic_stream(rng, pool, n_ops, max(1, amount // 2), batch_size))
+    stats.update({
+        'reasons': dict(ledger.reverted),
+        'holders': sum(1 for balance in ledger.balances.values() if balance > 0),
+        'top_holders': ledger.top_holders(),
+        'supply_ok': ledger.supply_in_circulation() == total_supply,
+        'airdrop': amount,
+    })
+    stats.update(kyc)
+    return stats